@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# _*_ coding: utf-8 _*_
+"""
+Library API for asyncio applications: palette extraction and colour naming without blocking the event loop.
+The work runs in an executor (a thread pool unless configured); the number of jobs running or queued
+in the executor at a time may be limited.
+
+    from azote_palettes import api
+
+    api.configure(executor=ProcessPoolExecutor(), max_concurrency=8)
+    colors = await api.extract_palette('image.jpg', 12)
+    names = await api.name_colours(colors, ('names', 'pantone'))
+
+Cancelling a task cancels its job if not started yet; a running job finishes in the executor, its result
+is dropped, and it keeps its slot until it ends.
+"""
+import io
+import weakref
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+from azote_palettes.color_tools import get_colour_names
+from azote_palettes.imaging import open_image
+from azote_palettes.quantize import get_palette, PIXEL_BUDGET
+
+
+def palette(image, color_count=24, engine=None, pixel_budget=PIXEL_BUDGET):
+    """
+    Blocking version of extract_palette, the job run in the executor
+    """
+    if isinstance(image, (bytes, bytearray, memoryview)):
+        image = open_image(io.BytesIO(image), pixel_budget)
+    elif not isinstance(image, Image.Image):
+        image = open_image(image, pixel_budget)
+    return get_palette(image, color_count=color_count + 1, engine=engine, pixel_budget=pixel_budget)
+
+
+class Extractor(object):
+    def __init__(self, executor=None, max_concurrency=None):
+        """
+        :param executor: concurrent.futures executor; None for a thread pool, created on first use
+        :param max_concurrency: max number of jobs submitted to the executor at a time, None for no limit
+        """
+        self.executor = executor
+        self.own_executor = None
+        self.max_concurrency = max_concurrency
+        # one semaphore per event loop
+        self.semaphores = weakref.WeakKeyDictionary()
+
+    def semaphore(self, loop):
+        if loop not in self.semaphores:
+            self.semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return self.semaphores[loop]
+
+    def get_executor(self):
+        if self.executor is not None:
+            return self.executor
+        if self.own_executor is None:
+            self.own_executor = ThreadPoolExecutor()
+        return self.own_executor
+
+    async def run(self, function, *args):
+        if not self.max_concurrency:
+            return await asyncio.wrap_future(self.get_executor().submit(function, *args))
+
+        loop = asyncio.get_running_loop()
+        semaphore = self.semaphore(loop)
+        await semaphore.acquire()
+        try:
+            job = self.get_executor().submit(function, *args)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        def release(future):
+            # the slot is freed when the job ends in the executor, not when the awaiting task does,
+            # so cancelled tasks can not get more jobs running than max_concurrency
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(semaphore.release)
+
+        job.add_done_callback(release)
+        return await asyncio.wrap_future(job)
+
+    async def extract_palette(self, image, color_count=24, engine=None, pixel_budget=PIXEL_BUDGET):
+        """
+        :param image: image file path, file content (bytes) or PIL Image
+        :param color_count: as num_colors in the GUI, the palette may come out shorter
+        :param engine: see quantize.get_palette
+        :param pixel_budget: see quantize.get_palette
+        :return: list of (r, g, b) tuples
+        """
+        return await self.run(palette, image, color_count, engine, pixel_budget)
+
+    async def name_colours(self, colours, dictionaries=('names', 'pantone'), metric='rgb'):
+        """
+        :param colours: #rrggbb strings or (r, g, b) tuples, see color_tools.get_colour_names
+        :return: {dictionary: [(exact name or None, nearest name, nearest hex), ...]}
+        """
+        return await self.run(get_colour_names, list(colours), tuple(dictionaries), metric)
+
+
+extractor = Extractor()
+
+
+def configure(executor=None, max_concurrency=None):
+    """
+    Sets the executor and the concurrency limit of extract_palette and name_colours; the jobs already
+    running are not affected
+    """
+    global extractor
+    extractor = Extractor(executor, max_concurrency)
+
+
+async def extract_palette(image, color_count=24, engine=None, pixel_budget=PIXEL_BUDGET):
+    """
+    See Extractor.extract_palette
+    """
+    return await extractor.extract_palette(image, color_count, engine, pixel_budget)
+
+
+async def name_colours(colours, dictionaries=('names', 'pantone'), metric='rgb'):
+    """
+    See Extractor.name_colours
+    """
+    return await extractor.name_colours(colours, dictionaries, metric)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# _*_ coding: utf-8 _*_
+"""
+Headless batch extraction: palettes of all the images in directories, streamed as JSON lines or CSV.
+"""
+import os
+import sys
+import csv
+import json
+from concurrent.futures import ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
+
+from PIL import Image
+
+from azote_palettes.color_tools import get_colour_names, rgb_to_cmyk, preload_dictionaries, registry
+from azote_palettes.dictionary_files import CompiledDictionary, register_dictionary_file
+from azote_palettes.imaging import open_image
+from azote_palettes.quantize import get_palette, PIXEL_BUDGET
+
+FORMATS = ('jsonl', 'csv')
+CSV_FIELDS = ('path', 'index', 'hex', 'r', 'g', 'b', 'c', 'm', 'y', 'k')
+
+
+def image_extensions():
+    """
+    :return: set of lowercase file extensions PIL can open
+    """
+    Image.init()
+    return {ext for ext, format_name in Image.registered_extensions().items() if format_name in Image.OPEN}
+
+
+def find_images(paths):
+    """
+    :param paths: image files and directories, the latter walked recursively
+    :return: generator of image paths, in alphabetical order within each directory
+    """
+    extensions = image_extensions()
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                if os.path.splitext(name)[1].lower() in extensions:
+                    yield os.path.join(root, name)
+
+
+def extract(path, color_count=24, engine=None, pixel_budget=PIXEL_BUDGET, dictionaries=('names', 'pantone'),
+            metric='rgb'):
+    """
+    :param path: image file
+    :param color_count: as num_colors in the GUI, the palette may come out shorter
+    :return: record: {'path': path, 'colors': [{'hex', 'rgb', 'cmyk', dictionary: nearest name, ...}]};
+    {'path': path, 'error': message} if the image can not be read
+    """
+    try:
+        colors = get_palette(open_image(path, pixel_budget), color_count=color_count + 1, engine=engine,
+                             pixel_budget=pixel_budget)
+    except Exception as e:
+        return {'path': path, 'error': str(e)}
+
+    hex_values = ['#%02x%02x%02x' % color for color in colors]
+    names = get_colour_names(hex_values, dictionaries, metric)
+    records = []
+    for i, (color, hex_value) in enumerate(zip(colors, hex_values)):
+        record = {'hex': hex_value, 'rgb': list(color), 'cmyk': [round(v) for v in rgb_to_cmyk(*color)]}
+        for dictionary in dictionaries:
+            record[dictionary] = names[dictionary][i][1]
+        records.append(record)
+    return {'path': path, 'colors': records}
+
+
+def init_worker(dictionaries, dictionary_files):
+    """
+    Process pool initializer: registers the palette file dictionaries and builds the indexes once per worker
+    :param dictionary_files: {name: palette file}
+    """
+    for name, source in dictionary_files.items():
+        register_dictionary_file(name, source)
+    for _ in preload_dictionaries(dictionaries):
+        pass
+
+
+def parallel_extract(paths, jobs=None, color_count=24, engine=None, pixel_budget=PIXEL_BUDGET,
+                     dictionaries=('names', 'pantone'), metric='rgb'):
+    """
+    Runs extract in a pool of processes; at most 2 images per process are submitted at a time, so memory use
+    does not grow with the number of images
+    :param paths: image files and directories, see find_images
+    :param jobs: number of processes, os.cpu_count() if None
+    :return: generator of records, in the order of completion
+    """
+    jobs = jobs or os.cpu_count() or 1
+    dictionary_files = {name: registry[name].source for name in dictionaries
+                        if isinstance(registry[name], CompiledDictionary)}
+    images = find_images(paths)
+    with ProcessPoolExecutor(jobs, initializer=init_worker, initargs=(dictionaries, dictionary_files)) as executor:
+        pending = set()
+        for path in images:
+            pending.add(executor.submit(extract, path, color_count, engine, pixel_budget, dictionaries, metric))
+            if len(pending) >= 2 * jobs:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in as_completed(pending):
+            yield future.result()
+
+
+class JsonWriter(object):
+    """
+    One line per image
+    """
+    def __init__(self, f, dictionaries):
+        self.f = f
+
+    def write(self, record):
+        self.f.write(json.dumps(record, ensure_ascii=False))
+        self.f.write('\n')
+        self.f.flush()
+
+
+class CsvWriter(object):
+    """
+    One row per colour; images which could not be read are reported to stderr
+    """
+    def __init__(self, f, dictionaries):
+        self.f = f
+        self.dictionaries = dictionaries
+        self.writer = csv.writer(f)
+        self.writer.writerow(CSV_FIELDS + tuple(dictionaries))
+
+    def write(self, record):
+        if 'error' in record:
+            print('{}: {}'.format(record['path'], record['error']), file=sys.stderr)
+            return
+        for i, color in enumerate(record['colors']):
+            self.writer.writerow([record['path'], i, color['hex']] + color['rgb'] + color['cmyk'] +
+                                 [color[dictionary] for dictionary in self.dictionaries])
+        self.f.flush()
+
+
+writers = {'jsonl': JsonWriter, 'csv': CsvWriter}
+
+
+def batch(paths, f, output_format='jsonl', color_count=24, engine=None, pixel_budget=PIXEL_BUDGET,
+          dictionaries=('names', 'pantone'), metric='rgb', jobs=1):
+    """
+    Writes the palette of each image as soon as extracted
+    :param paths: image files and directories, see find_images
+    :param f: text file to write to
+    :param output_format: one of FORMATS
+    :param jobs: number of processes, see parallel_extract; os.cpu_count() if 0 or None;
+    1 to work in this process, in the order of paths
+    :return: number of images processed
+    """
+    writer = writers[output_format](f, dictionaries)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1:
+        records = (extract(path, color_count, engine, pixel_budget, dictionaries, metric)
+                   for path in find_images(paths))
+    else:
+        records = parallel_extract(paths, jobs, color_count, engine, pixel_budget, dictionaries, metric)
+    count = 0
+    for record in records:
+        writer.write(record)
+        count += 1
+    return count
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# _*_ coding: utf-8 _*_
+"""
+azote-palettes entry point: the GUI, unless the first argument is a command:
+  batch DIR [DIR ...]   palettes of all the images in directories, see batch.py
+  serve --socket PATH   local palette service, see service.py
+  name                  names of the colours read from stdin, see name_filter.py
+Gtk is only imported for the GUI.
+"""
+import os
+import sys
+import argparse
+
+from azote_palettes.color_tools import registry, METRICS, get_index, build_lookup_table
+from azote_palettes.dictionary_files import register_dictionary_file
+from azote_palettes.batch import batch, FORMATS
+from azote_palettes import name_filter
+from azote_palettes.quantize import engines, PIXEL_BUDGET
+
+commands = ('batch', 'serve', 'name')
+
+
+def dictionary_list(value):
+    """
+    :param value: comma-separated dictionary names; .gpl, .csv, .json or .ase files are registered under their path
+    :return: list of registered dictionary names
+    """
+    dictionaries = []
+    for name in value.split(','):
+        name = name.strip()
+        if name not in registry:
+            if not os.path.isfile(name):
+                raise argparse.ArgumentTypeError('unknown dictionary: {}'.format(name))
+            register_dictionary_file(name, name)
+        dictionaries.append(name)
+    return dictionaries
+
+
+def add_naming_arguments(parser):
+    parser.add_argument('--dict', dest='dictionaries', type=dictionary_list, default=['names', 'pantone'],
+                        help='comma-separated dictionaries or palette files (default: names,pantone)')
+    parser.add_argument('--metric', choices=METRICS, default='rgb', help='colour distance (default: rgb)')
+
+
+def run_batch(args):
+    f = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    try:
+        batch(args.paths, f, args.format, args.colors, args.engine, args.pixel_budget, args.dictionaries,
+              args.metric, args.jobs)
+    finally:
+        if f is not sys.stdout:
+            f.close()
+
+
+def run_serve(args):
+    # imported here: socketserver.UnixStreamServer does not exist where there is no AF_UNIX (Windows)
+    try:
+        from azote_palettes.service import serve
+    except ImportError as e:
+        sys.exit('azote-palettes serve: {}'.format(e))
+    serve(args.socket, args.jobs, args.dictionaries, args.metric, args.colors)
+
+
+def run_name(args):
+    if args.build_tables:
+        for dictionary in args.dictionaries:
+            if get_index(dictionary).table is None:
+                print('Building lookup table: {}'.format(build_lookup_table(dictionary)), file=sys.stderr)
+    name_filter.name_stream(sys.stdin, sys.stdout, args.dictionaries, args.metric, args.format, args.chunk_size,
+                            args.header)
+
+
+def parser():
+    p = argparse.ArgumentParser(prog='azote-palettes',
+                                description='Colour palette creator and colour names dictionary. '
+                                            'Run with no command (or an image path) for the GUI.')
+    subparsers = p.add_subparsers(dest='command')
+
+    batch_parser = subparsers.add_parser('batch', help='extract palettes of all the images in directories')
+    batch_parser.add_argument('paths', nargs='+', metavar='PATH', help='image file or directory (recursive)')
+    batch_parser.add_argument('--colors', type=int, default=24, help='palette size (default: 24)')
+    batch_parser.add_argument('--format', choices=FORMATS, default='jsonl',
+                              help='jsonl: a line per image; csv: a row per colour (default: jsonl)')
+    batch_parser.add_argument('--output', '-o', help='output file (default: stdout)')
+    batch_parser.add_argument('--engine', choices=sorted(engines), default=None)
+    batch_parser.add_argument('--pixel-budget', type=int, default=PIXEL_BUDGET,
+                              help='pixels sampled per image, 0 for every 10th pixel (default: {})'.format(
+                                  PIXEL_BUDGET))
+    batch_parser.add_argument('--jobs', '-j', type=int, default=0,
+                              help='number of processes, 1 for no pool (default: the number of CPUs); '
+                                   'with more than 1, records come in the order of completion')
+    add_naming_arguments(batch_parser)
+    batch_parser.set_defaults(run=run_batch)
+
+    serve_parser = subparsers.add_parser('serve', help='answer palette and colour name requests on a Unix socket')
+    serve_parser.add_argument('--socket', required=True, metavar='PATH', help='socket file to create')
+    serve_parser.add_argument('--jobs', '-j', type=int, default=0,
+                              help='number of worker processes (default: the number of CPUs)')
+    serve_parser.add_argument('--colors', type=int, default=24, help='default palette size (default: 24)')
+    add_naming_arguments(serve_parser)
+    serve_parser.set_defaults(run=run_serve)
+
+    name_parser = subparsers.add_parser('name', help='name the colours read from stdin, a colour per line')
+    name_parser.add_argument('--format', choices=name_filter.FORMATS, default='tsv',
+                             help='tsv: input, hex and a name per dictionary; jsonl: an object per line '
+                                  '(default: tsv)')
+    name_parser.add_argument('--header', action='store_true', help='write a header line (tsv)')
+    name_parser.add_argument('--chunk-size', type=int, default=name_filter.CHUNK_SIZE,
+                             help='lines named at a time (default: {})'.format(name_filter.CHUNK_SIZE))
+    name_parser.add_argument('--build-tables', action='store_true',
+                             help='build the missing 24-bit lookup tables first (32 MiB each, a few seconds); '
+                                  'makes rgb metric naming several times faster')
+    add_naming_arguments(name_parser)
+    name_parser.set_defaults(run=run_name)
+
+    return p
+
+
+def main():
+    if len(sys.argv) > 1 and (sys.argv[1] in commands or sys.argv[1] in ('-h', '--help')):
+        args = parser().parse_args()
+        try:
+            args.run(args)
+        except KeyboardInterrupt:
+            sys.exit(130)
+        except BrokenPipeError:
+            # e.g. piped to head
+            sys.stderr.close()
+    else:
+        from azote_palettes.main import main as gui_main
+        gui_main()
+
+
+if __name__ == '__main__':
+    main()
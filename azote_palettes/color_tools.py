@@ -1,5 +1,23 @@
 #!/usr/bin/env python3
 # _*_ coding: utf-8 _*_
+import os
+import re
+import sys
+import math
+import bisect
+import heapq
+import mmap
+import json
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from collections.abc import Mapping
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 def hex_to_rgb(string):
@@ -7,6 +25,35 @@ def hex_to_rgb(string):
     return tuple(int(string[i:i + 2], 16) for i in (0, 2, 4))
 
 
+def parse_colour(colour):
+    """
+    :param colour: 0xRRGGBB int, (r, g, b) tuple or string: '#rrggbb', 'RRGGBB', '#rgb', '0xRRGGBB'...
+    or 'rgb(r, g, b)' (alpha of 'rgba(r, g, b, a)' ignored)
+    :return: (r, g, b) tuple
+    """
+    if isinstance(colour, str):
+        string = colour.strip().lower()
+        if string.startswith('rgb') and string.endswith(')'):
+            values = string[string.find('(') + 1:-1].replace(',', ' ').replace('/', ' ').split()
+            if len(values) in (3, 4) and all(v.isdigit() for v in values[:3]):
+                return parse_colour(tuple(int(v) for v in values[:3]))
+            raise ValueError('Not a colour: {}'.format(colour))
+        string = string[2:] if string.startswith('0x') else string.lstrip('#')
+        if len(string) == 3:
+            string = ''.join(c * 2 for c in string)
+        if len(string) == 6:
+            try:
+                return tuple(int(string[i:i + 2], 16) for i in (0, 2, 4))
+            except ValueError:
+                pass
+    elif isinstance(colour, int):
+        if 0 <= colour <= 0xffffff:
+            return colour >> 16, (colour >> 8) & 0xff, colour & 0xff
+    elif len(colour) == 3 and all(0 <= int(v) <= 255 for v in colour):
+        return tuple(int(v) for v in colour)
+    raise ValueError('Not a colour: {}'.format(colour))
+
+
 RGB_SCALE = 255
 CMYK_SCALE = 100
 
@@ -33,2267 +80,989 @@ def rgb_to_cmyk(r, g, b):
     return c * CMYK_SCALE, m * CMYK_SCALE, y * CMYK_SCALE, k * CMYK_SCALE
 
 
-# Definitions below come from https://en.wikipedia.org/wiki/List_of_colors:_A%E2%80%93F.
+# sRGB (D65) -> CIE XYZ -> CIELAB, see http://www.brucelindbloom.com
+XYZ_MATRIX = ((0.4124564, 0.3575761, 0.1804375),
+              (0.2126729, 0.7151522, 0.0721750),
+              (0.0193339, 0.1191920, 0.9503041))
+WHITE_D65 = (0.95047, 1.0, 1.08883)
+
+METRICS = ('rgb', 'de76', 'de94', 'de2000')
+
+
+def rgb_to_lab(r, g, b):
+    linear = []
+    for v in (r / RGB_SCALE, g / RGB_SCALE, b / RGB_SCALE):
+        linear.append(v / 12.92 if v <= 0.04045 else ((v + 0.055) / 1.055) ** 2.4)
+    f = []
+    for row, white in zip(XYZ_MATRIX, WHITE_D65):
+        t = sum(m * v for m, v in zip(row, linear)) / white
+        f.append(t ** (1 / 3) if t > 216 / 24389 else (24389 / 27 * t + 16) / 116)
+
+    return 116 * f[1] - 16, 500 * (f[0] - f[1]), 200 * (f[1] - f[2])
+
+
+def lab_to_rgb(l, a, b):
+    """
+    :return: (r, g, b) floats, may fall outside 0-255 for colours out of the sRGB gamut
+    """
+    fy = (l + 16) / 116
+    f = (fy + a / 500, fy, fy - b / 200)
+    xyz = []
+    for v, white in zip(f, WHITE_D65):
+        xyz.append(white * (v ** 3 if v ** 3 > 216 / 24389 else (116 * v - 16) / (24389 / 27)))
+    # inverse of XYZ_MATRIX
+    linear = (3.2404542 * xyz[0] - 1.5371385 * xyz[1] - 0.4985314 * xyz[2],
+              -0.9692660 * xyz[0] + 1.8760108 * xyz[1] + 0.0415560 * xyz[2],
+              0.0556434 * xyz[0] - 0.2040259 * xyz[1] + 1.0572252 * xyz[2])
+    rgb = []
+    for v in linear:
+        v = 12.92 * v if v <= 0.0031308 else 1.055 * abs(v) ** (1 / 2.4) - 0.055
+        rgb.append(v * RGB_SCALE)
+
+    return tuple(rgb)
+
+
+def rgb_to_lab_array(rgb):
+    """
+    Vectorised rgb_to_lab, requires numpy
+    :param rgb: (..., 3) array
+    :return: (..., 3) float array
+    """
+    v = np.asarray(rgb, dtype=np.float64) / RGB_SCALE
+    linear = np.where(v <= 0.04045, v / 12.92, ((v + 0.055) / 1.055) ** 2.4)
+    t = linear @ np.array(XYZ_MATRIX).T / np.array(WHITE_D65)
+    f = np.where(t > 216 / 24389, np.cbrt(t), (24389 / 27 * t + 16) / 116)
+
+    return np.stack((116 * f[..., 1] - 16, 500 * (f[..., 0] - f[..., 1]), 200 * (f[..., 1] - f[..., 2])), axis=-1)
+
+
+def delta_e76(lab1, lab2):
+    return math.sqrt((lab1[0] - lab2[0]) ** 2 + (lab1[1] - lab2[1]) ** 2 + (lab1[2] - lab2[2]) ** 2)
+
+
+def delta_e94(lab1, lab2):
+    """
+    CIE94, graphic arts weights; lab1 is the reference colour
+    """
+    l1, a1, b1 = lab1
+    l2, a2, b2 = lab2
+    c1 = math.sqrt(a1 * a1 + b1 * b1)
+    c2 = math.sqrt(a2 * a2 + b2 * b2)
+    dc = c1 - c2
+    dh2 = max((a1 - a2) ** 2 + (b1 - b2) ** 2 - dc * dc, 0)
+
+    return math.sqrt((l1 - l2) ** 2 + (dc / (1 + 0.045 * c1)) ** 2 + dh2 / (1 + 0.015 * c1) ** 2)
+
+
+def delta_e2000(lab1, lab2):
+    """
+    CIEDE2000, after Sharma, Wu, Dalal: http://www2.ece.rochester.edu/~gsharma/ciede2000/
+    """
+    l1, a1, b1 = lab1
+    l2, a2, b2 = lab2
+    c_mean = (math.sqrt(a1 * a1 + b1 * b1) + math.sqrt(a2 * a2 + b2 * b2)) / 2
+    g = 0.5 * (1 - math.sqrt(c_mean ** 7 / (c_mean ** 7 + 25 ** 7)))
+    a1, a2 = a1 * (1 + g), a2 * (1 + g)
+    c1, c2 = math.sqrt(a1 * a1 + b1 * b1), math.sqrt(a2 * a2 + b2 * b2)
+    h1 = math.degrees(math.atan2(b1, a1)) % 360 if c1 else 0
+    h2 = math.degrees(math.atan2(b2, a2)) % 360 if c2 else 0
+
+    dl = l2 - l1
+    dc = c2 - c1
+    dh = h2 - h1
+    if c1 * c2 == 0:
+        dh = 0
+    elif dh > 180:
+        dh -= 360
+    elif dh < -180:
+        dh += 360
+    dh = 2 * math.sqrt(c1 * c2) * math.sin(math.radians(dh / 2))
+
+    l_mean = (l1 + l2) / 2
+    c_mean = (c1 + c2) / 2
+    h_mean = h1 + h2
+    if c1 * c2 != 0:
+        if abs(h1 - h2) <= 180:
+            h_mean /= 2
+        elif h1 + h2 < 360:
+            h_mean = (h_mean + 360) / 2
+        else:
+            h_mean = (h_mean - 360) / 2
+
+    t = 1 - 0.17 * math.cos(math.radians(h_mean - 30)) + 0.24 * math.cos(math.radians(2 * h_mean)) \
+        + 0.32 * math.cos(math.radians(3 * h_mean + 6)) - 0.2 * math.cos(math.radians(4 * h_mean - 63))
+    d_theta = 30 * math.exp(-((h_mean - 275) / 25) ** 2)
+    r_c = 2 * math.sqrt(c_mean ** 7 / (c_mean ** 7 + 25 ** 7))
+    s_l = 1 + 0.015 * (l_mean - 50) ** 2 / math.sqrt(20 + (l_mean - 50) ** 2)
+    s_c = 1 + 0.045 * c_mean
+    s_h = 1 + 0.015 * c_mean * t
+    r_t = -math.sin(math.radians(2 * d_theta)) * r_c
+
+    return math.sqrt((dl / s_l) ** 2 + (dc / s_c) ** 2 + (dh / s_h) ** 2 + r_t * (dc / s_c) * (dh / s_h))
+
+
+def delta_e76_array(lab1, lab2):
+    return np.sqrt(((lab1 - lab2) ** 2).sum(axis=-1))
+
+
+def delta_e94_array(lab1, lab2):
+    l1, a1, b1 = np.moveaxis(lab1, -1, 0)
+    l2, a2, b2 = np.moveaxis(lab2, -1, 0)
+    c1 = np.hypot(a1, b1)
+    dc = c1 - np.hypot(a2, b2)
+    dh2 = np.maximum((a1 - a2) ** 2 + (b1 - b2) ** 2 - dc * dc, 0)
+
+    return np.sqrt((l1 - l2) ** 2 + (dc / (1 + 0.045 * c1)) ** 2 + dh2 / (1 + 0.015 * c1) ** 2)
+
+
+def delta_e2000_array(lab1, lab2):
+    l1, a1, b1 = np.moveaxis(lab1, -1, 0)
+    l2, a2, b2 = np.moveaxis(lab2, -1, 0)
+    c_mean = (np.hypot(a1, b1) + np.hypot(a2, b2)) / 2
+    g = 0.5 * (1 - np.sqrt(c_mean ** 7 / (c_mean ** 7 + 25 ** 7)))
+    a1, a2 = a1 * (1 + g), a2 * (1 + g)
+    c1, c2 = np.hypot(a1, b1), np.hypot(a2, b2)
+    h1 = np.where(c1 == 0, 0, np.degrees(np.arctan2(b1, a1)) % 360)
+    h2 = np.where(c2 == 0, 0, np.degrees(np.arctan2(b2, a2)) % 360)
+
+    dl = l2 - l1
+    dc = c2 - c1
+    dh = h2 - h1
+    dh = np.where(dh > 180, dh - 360, np.where(dh < -180, dh + 360, dh))
+    dh = np.where(c1 * c2 == 0, 0, dh)
+    dh = 2 * np.sqrt(c1 * c2) * np.sin(np.radians(dh / 2))
+
+    l_mean = (l1 + l2) / 2
+    c_mean = (c1 + c2) / 2
+    h_sum = h1 + h2
+    h_mean = np.where(np.abs(h1 - h2) <= 180, h_sum / 2, np.where(h_sum < 360, (h_sum + 360) / 2, (h_sum - 360) / 2))
+    h_mean = np.where(c1 * c2 == 0, h_sum, h_mean)
+
+    t = 1 - 0.17 * np.cos(np.radians(h_mean - 30)) + 0.24 * np.cos(np.radians(2 * h_mean)) \
+        + 0.32 * np.cos(np.radians(3 * h_mean + 6)) - 0.2 * np.cos(np.radians(4 * h_mean - 63))
+    d_theta = 30 * np.exp(-((h_mean - 275) / 25) ** 2)
+    r_c = 2 * np.sqrt(c_mean ** 7 / (c_mean ** 7 + 25 ** 7))
+    s_l = 1 + 0.015 * (l_mean - 50) ** 2 / np.sqrt(20 + (l_mean - 50) ** 2)
+    s_c = 1 + 0.045 * c_mean
+    s_h = 1 + 0.015 * c_mean * t
+    r_t = -np.sin(np.radians(2 * d_theta)) * r_c
+
+    return np.sqrt((dl / s_l) ** 2 + (dc / s_c) ** 2 + (dh / s_h) ** 2 + r_t * (dc / s_c) * (dh / s_h))
+
+
+DELTA_E = {'de76': (delta_e76, delta_e76_array),
+           'de94': (delta_e94, delta_e94_array),
+           'de2000': (delta_e2000, delta_e2000_array)}
+
+
+DICTIONARY_MAGIC = b'AZPD'
+DICTIONARY_VERSION = 1
+# magic, version, flags, number of entries, string table size
+DICTIONARY_HEADER = struct.Struct('<4sHHII')
+UPPER_CASE_KEYS = 1
+
+
+class ColourDictionary(Mapping):
+    """
+    Read-only {'#rrggbb': name} view of a binary dictionary file. Nothing is read before the first access,
+    then the file is memory-mapped; the dict-like view is only materialised if used.
+    File layout (little endian): header, count x uint32 0xRRGGBB, (count + 1) x uint32 name offsets,
+    utf-8 names.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.map = None
+        self.colours = None
+        self.offsets = None
+        self.strings = 0
+        self.key_format = '#%06x'
+        self.lookup = None
+
+    def load(self):
+        if self.map is None:
+            with open(self.path, 'rb') as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, flags, count, size = DICTIONARY_HEADER.unpack_from(data, 0)
+            if magic != DICTIONARY_MAGIC or version != DICTIONARY_VERSION:
+                raise ValueError('{}: not a colour dictionary'.format(self.path))
+            offset = DICTIONARY_HEADER.size
+            self.colours = struct.unpack_from('<{}I'.format(count), data, offset)
+            offset += 4 * count
+            self.offsets = struct.unpack_from('<{}I'.format(count + 1), data, offset)
+            self.strings = offset + 4 * (count + 1)
+            self.key_format = '#%06X' if flags & UPPER_CASE_KEYS else '#%06x'
+            self.map = data
+        return self
+
+    def key(self, i):
+        return self.key_format % self.load().colours[i]
+
+    def name(self, i):
+        self.load()
+        return self.map[self.strings + self.offsets[i]:self.strings + self.offsets[i + 1]].decode('utf-8')
+
+    def key_list(self):
+        self.load()
+        return [self.key_format % colour for colour in self.colours]
+
+    def name_list(self):
+        self.load()
+        data = self.map[self.strings:self.strings + self.offsets[-1]]
+        return [data[start:end].decode('utf-8') for start, end in zip(self.offsets, self.offsets[1:])]
+
+    def __len__(self):
+        return len(self.load().colours)
+
+    def __iter__(self):
+        return iter(self.key_list())
+
+    def __getitem__(self, key):
+        if self.lookup is None:
+            self.lookup = {k: i for i, k in enumerate(self.key_list())}
+        return self.name(self.lookup[key])
+
+
+def write_dictionary(path, d):
+    """
+    Saves a {'#rrggbb': name} mapping in the ColourDictionary format
+    :param path: output file
+    :param d: mapping; the key case (all lower or all upper) is preserved
+    """
+    keys = list(d.keys())
+    encoded = [d[key].encode('utf-8') for key in keys]
+    offsets = [0]
+    for name in encoded:
+        offsets.append(offsets[-1] + len(name))
+    flags = UPPER_CASE_KEYS if any(key != key.lower() for key in keys) else 0
+
+    tmp = '{}.{}.tmp'.format(path, os.getpid())
+    with open(tmp, 'wb') as f:
+        f.write(DICTIONARY_HEADER.pack(DICTIONARY_MAGIC, DICTIONARY_VERSION, flags, len(keys), offsets[-1]))
+        f.write(struct.pack('<{}I'.format(len(keys)), *(int(key.lstrip('#'), 16) for key in keys)))
+        f.write(struct.pack('<{}I'.format(len(offsets)), *offsets))
+        f.write(b''.join(encoded))
+    os.replace(tmp, path)
+
+
+# The .bin files are compiled from the .tsv files next to them, see build_dictionaries.py
+dictionaries_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dictionaries')
+
+# Definitions come from https://en.wikipedia.org/wiki/List_of_colors:_A%E2%80%93F.
 # I removed redundant names arbitrarily.
-names = {"#0048ba": "Absolute Zero",
-         "#b0bf1a": "Acid green",
-         "#7cb9e8": "Aero",
-         "#c9ffe5": "Aero blue",
-         "#b284be": "African violet",
-         "#72a0c1": "Air superiority blue",
-         "#edeae0": "Alabaster",
-         "#f0f8ff": "Alice blue",
-         "#c46210": "Alloy orange",
-         "#efdecd": "Almond",
-         "#e52b50": "Amaranth",
-         "#9f2b68": "Amaranth (M&P)",
-         "#f19cbb": "Amaranth pink",
-         "#ab274f": "Amaranth purple",
-         "#d3212d": "Amaranth red",
-         "#3b7a57": "Amazon",
-         "#ffbf00": "Amber",
-         "#ff7e00": "Amber (SAE/ECE)",
-         "#9966cc": "Amethyst",
-         "#a4c639": "Android green",
-         "#cd9575": "Antique brass",
-         "#665d1e": "Antique bronze",
-         "#915c83": "Antique fuchsia",
-         "#841b2d": "Antique ruby",
-         "#faebd7": "Antique white",
-         "#8db600": "Apple green",
-         "#fbceb1": "Apricot",
-         "#7fffd4": "Aquamarine",
-         "#d0ff14": "Arctic lime",
-         "#4b5320": "Army green",
-         "#8f9779": "Artichoke",
-         "#e9d66b": "Arylide yellow",
-         "#b2beb5": "Ash gray",
-         "#87a96b": "Asparagus",
-         "#ff9966": "Atomic tangerine",
-         "#a52a2a": "Auburn",
-         "#fdee00": "Aureolin",
-         "#568203": "Avocado",
-         "#007fff": "Azure",
-         "#f0ffff": "Azure (X11/web color)",
-         "#89cff0": "Baby blue",
-         "#a1caf1": "Baby blue eyes",
-         "#f4c2c2": "Baby pink",
-         "#fefefa": "Baby powder",
-         "#ff91af": "Baker-Miller pink",
-         "#fae7b5": "Banana Mania",
-         "#da1884": "Barbie Pink",
-         "#7c0a02": "Barn red",
-         "#bcd4e6": "Beau blue",
-         "#9f8170": "Beaver",
-         "#f5f5dc": "Beige",
-         "#2e5894": "B'dazzled blue",
-         "#9c2542": "Big dip o’ruby",
-         "#ffe4c4": "Bisque",
-         "#3d2b1f": "Bistre",
-         "#967117": "Bistre brown",
-         "#cae00d": "Bitter lemon",
-         "#bfff00": "Bitter lime",
-         "#fe6f5e": "Bittersweet",
-         "#bf4f51": "Bittersweet shimmer",
-         "#000000": "Black",
-         "#3d0c02": "Black bean",
-         "#1b1811": "Black chocolate",
-         "#3b2f2f": "Black coffee",
-         "#54626f": "Black coral",
-         "#3b3c36": "Black olive",
-         "#bfafb2": "Black Shadows",
-         "#ffebcd": "Blanched almond",
-         "#a57164": "Blast-off bronze",
-         "#318ce7": "Bleu de France",
-         "#ace5ee": "Blizzard blue",
-         "#faf0be": "Blond",
-         "#660000": "Blood red",
-         "#0000ff": "Blue",
-         "#1f75fe": "Blue (Crayola)",
-         "#0093af": "Blue (Munsell)",
-         "#0087bd": "Blue (NCS)",
-         "#0018a8": "Blue (Pantone)",
-         "#333399": "Blue (pigment)",
-         "#0247fe": "Blue (RYB)",
-         "#a2a2d0": "Blue bell",
-         "#6699cc": "Blue-gray",
-         "#0d98ba": "Blue-green",
-         "#064e40": "Blue-green (color wheel)",
-         "#5dadec": "Blue jeans",
-         "#126180": "Blue sapphire",
-         "#8a2be2": "Blue-violet",
-         "#7366bd": "Blue-violet (Crayola)",
-         "#4d1a7f": "Blue-violet (color wheel)",
-         "#5072a7": "Blue yonder",
-         "#3c69e7": "Bluetiful",
-         "#de5d83": "Blush",
-         "#79443b": "Bole",
-         "#e3dac9": "Bone",
-         "#006a4e": "Bottle green",
-         "#87413f": "Brandy",
-         "#cb4154": "Brick red",
-         "#66ff00": "Bright green",
-         "#d891ef": "Bright lilac",
-         "#c32148": "Bright maroon",
-         "#1974d2": "Bright navy blue",
-         "#ffaa1d": "Bright yellow (Crayola)",
-         "#ff55a3": "Brilliant rose",
-         "#fb607f": "Brink pink",
-         "#004225": "British racing green",
-         "#cd7f32": "Bronze",
-         "#88540b": "Brown",
-         "#af6e4d": "Brown sugar",
-         "#1b4d3e": "Brunswick green",
-         "#7bb661": "Bud green",
-         "#f0dc82": "Buff",
-         "#800020": "Burgundy",
-         "#deb887": "Burlywood",
-         "#a17a74": "Burnished brown",
-         "#cc5500": "Burnt orange",
-         "#e97451": "Burnt sienna",
-         "#8a3324": "Burnt umber",
-         "#bd33a4": "Byzantine",
-         "#702963": "Byzantium",
-         "#536872": "Cadet",
-         "#5f9ea0": "Cadet blue",
-         "#a9b2c3": "Cadet blue (Crayola)",
-         "#91a3b0": "Cadet grey",
-         "#006b3c": "Cadmium green",
-         "#ed872d": "Cadmium orange",
-         "#e30022": "Cadmium red",
-         "#fff600": "Cadmium yellow",
-         "#a67b5b": "Café au lait",
-         "#4b3621": "Café noir",
-         "#a3c1ad": "Cambridge blue",
-         "#efbbcc": "Cameo pink",
-         "#ffff99": "Canary",
-         "#ffef00": "Canary yellow",
-         "#ff0800": "Candy apple red",
-         "#e4717a": "Candy pink",
-         "#592720": "Caput mortuum",
-         "#c41e3a": "Cardinal",
-         "#00cc99": "Caribbean green",
-         "#960018": "Carmine",
-         "#d70040": "Carmine (M&P)",
-         "#ffa6c9": "Carnation pink",
-         "#b31b1b": "Carnelian",
-         "#56a0d3": "Carolina blue",
-         "#ed9121": "Carrot orange",
-         "#00563f": "Castleton green",
-         "#703642": "Catawba",
-         "#c95a49": "Cedar Chest",
-         "#ace1af": "Celadon",
-         "#007ba7": "Celadon blue",
-         "#2f847c": "Celadon green",
-         "#246bce": "Celtic blue",
-         "#de3163": "Cerise",
-         "#2a52be": "Cerulean blue",
-         "#6d9bc3": "Cerulean frost",
-         "#1dacd6": "Cerulean (Crayola)",
-         "#007aa5": "CG blue",
-         "#e03c31": "CG red",
-         "#f7e7ce": "Champagne",
-         "#f1ddcf": "Champagne pink",
-         "#36454f": "Charcoal",
-         "#232b2b": "Charleston green",
-         "#e68fac": "Charm pink",
-         "#dfff00": "Chartreuse (traditional)",
-         "#7fff00": "Chartreuse (web)",
-         "#ffb7c5": "Cherry blossom pink",
-         "#954535": "Chestnut",
-         "#a8516e": "China rose",
-         "#aa381e": "Chinese red",
-         "#856088": "Chinese violet",
-         "#ffb200": "Chinese yellow",
-         "#7b3f00": "Chocolate (traditional)",
-         "#d2691e": "Chocolate (web)",
-         "#ffa700": "Chrome yellow",
-         "#98817b": "Cinereous",
-         "#e34234": "Cinnabar",
-         "#cd607e": "Cinnamon Satin",
-         "#e4d00a": "Citrine",
-         "#9fa91f": "Citron",
-         "#7f1734": "Claret",
-         "#0047ab": "Cobalt blue",
-         "#6f4e37": "Coffee",
-         "#b9d9eb": "Columbia Blue",
-         "#8c92ac": "Cool grey",
-         "#b87333": "Copper",
-         "#da8a67": "Copper (Crayola)",
-         "#ad6f69": "Copper penny",
-         "#cb6d51": "Copper red",
-         "#996666": "Copper rose",
-         "#ff3800": "Coquelicot",
-         "#ff7f50": "Coral",
-         "#893f45": "Cordovan",
-         "#6495ed": "Cornflower blue",
-         "#fff8dc": "Cornsilk",
-         "#2e2d88": "Cosmic cobalt",
-         "#fff8e7": "Cosmic latte",
-         "#81613c": "Coyote brown",
-         "#ffbcd9": "Cotton candy",
-         "#fffdd0": "Cream",
-         "#dc143c": "Crimson",
-         "#9e1b32": "Crimson (UA)",
-         "#f5f5f5": "Cultured",
-         "#00ffff": "Cyan",
-         "#00b7eb": "Cyan (process)",
-         "#58427c": "Cyber grape",
-         "#f56fa1": "Cyclamen",
-         "#666699": "Dark blue-gray",
-         "#654321": "Dark brown",
-         "#5d3954": "Dark byzantium",
-         "#26428b": "Dark cornflower blue",
-         "#008b8b": "Dark cyan",
-         "#536878": "Dark electric blue",
-         "#b8860b": "Dark goldenrod",
-         "#013220": "Dark green",
-         "#006400": "Dark green (X11)",
-         "#1a2421": "Dark jungle green",
-         "#bdb76b": "Dark khaki",
-         "#534b4f": "Dark liver",
-         "#543d37": "Dark liver (horses)",
-         "#8b008b": "Dark magenta",
-         "#4a5d23": "Dark moss green",
-         "#556b2f": "Dark olive green",
-         "#ff8c00": "Dark orange",
-         "#9932cc": "Dark orchid",
-         "#03c03c": "Dark pastel green",
-         "#301934": "Dark purple",
-         "#8b0000": "Dark red",
-         "#e9967a": "Dark salmon",
-         "#8fbc8f": "Dark sea green",
-         "#3c1414": "Dark sienna",
-         "#8cbed6": "Dark sky blue",
-         "#483d8b": "Dark slate blue",
-         "#2f4f4f": "Dark slate gray",
-         "#177245": "Dark spring green",
-         "#00ced1": "Dark turquoise",
-         "#9400d3": "Dark violet",
-         "#00703c": "Dartmouth green",
-         "#555555": "Davy's grey",
-         "#da3287": "Deep cerise",
-         "#b94e48": "Deep chestnut",
-         "#004b49": "Deep jungle green",
-         "#ff1493": "Deep pink",
-         "#ff9933": "Deep saffron",
-         "#00bfff": "Deep sky blue",
-         "#4a646c": "Deep Space Sparkle",
-         "#7e5e60": "Deep taupe",
-         "#1560bd": "Denim",
-         "#2243b6": "Denim blue",
-         "#edc9af": "Desert sand",
-         "#696969": "Dim gray",
-         "#1e90ff": "Dodger blue",
-         "#d71868": "Dogwood rose",
-         "#00009c": "Duke blue",
-         "#efdfbb": "Dutch white",
-         "#e1a95f": "Earth yellow",
-         "#555d50": "Ebony",
-         "#c2b280": "Ecru",
-         "#1b1b1b": "Eerie black",
-         "#614051": "Eggplant",
-         "#f0ead6": "Eggshell",
-         "#1034a6": "Egyptian blue",
-         "#7df9ff": "Electric blue",
-         "#6f00ff": "Electric indigo",
-         "#ccff00": "Electric lime",
-         "#bf00ff": "Electric purple",
-         "#6c3082": "Eminence",
-         "#b48395": "English lavender",
-         "#ab4b52": "English red",
-         "#cc474b": "English vermillion",
-         "#563c5c": "English violet",
-         "#00ff40": "Erin",
-         "#96c8a2": "Eton blue",
-         "#801818": "Falu red",
-         "#b53389": "Fandango",
-         "#de5285": "Fandango pink",
-         "#f400a1": "Fashion fuchsia",
-         "#e5aa70": "Fawn",
-         "#4d5d53": "Feldgrau",
-         "#4f7942": "Fern green",
-         "#6c541e": "Field drab",
-         "#ff5470": "Fiery rose",
-         "#b22222": "Firebrick",
-         "#ce2029": "Fire engine red",
-         "#e95c4b": "Fire opal",
-         "#e25822": "Flame",
-         "#eedc82": "Flax",
-         "#0063dc": "Flickr Blue",
-         "#fb0081": "Flickr Pink",
-         "#a2006d": "Flirt",
-         "#fffaf0": "Floral white",
-         "#15f4ee": "Fluorescent blue",
-         "#5fa777": "Forest green (Crayola)",
-         "#014421": "Forest green (traditional)",
-         "#228b22": "Forest green (web)",
-         "#856d4d": "French bistre",
-         "#0072bb": "French blue",
-         "#fd3f92": "French fuchsia",
-         "#86608e": "French lilac",
-         "#9efd38": "French lime",
-         "#d473d4": "French mauve",
-         "#fd6c9e": "French pink",
-         "#c72c48": "French raspberry",
-         "#f64a8a": "French rose",
-         "#77b5fe": "French sky blue",
-         "#8806ce": "French violet",
-         "#e936a7": "Frostbite",
-         "#c154c1": "Fuchsia (Crayola)",
-         "#cc397b": "Fuchsia purple",
-         "#c74375": "Fuchsia rose",
-         "#e48400": "Fulvous",
-         "#87421f": "Fuzzy Wuzzy",
-         "#dcdcdc": "Gainsboro",
-         "#e49b0f": "Gamboge",
-         "#007f66": "Generic viridian",
-         "#f8f8ff": "Ghost white",
-         "#6082b6": "Glaucous",
-         "#ab92b3": "Glossy grape",
-         "#00ab66": "GO green",
-         "#a57c00": "Gold",
-         "#d4af37": "Gold (metallic)",
-         "#ffd700": "Gold (web) (Golden)",
-         "#e6be8a": "Gold (Crayola)",
-         "#85754e": "Gold Fusion",
-         "#996515": "Golden brown",
-         "#fcc200": "Golden poppy",
-         "#ffdf00": "Golden yellow",
-         "#daa520": "Goldenrod",
-         "#676767": "Granite gray",
-         "#a8e4a0": "Granny Smith apple",
-         "#808080": "Gray (web)",
-         "#bebebe": "Gray (X11 gray)",
-         "#00ff00": "Green",
-         "#1cac78": "Green (Crayola)",
-         "#008000": "Green (web)",
-         "#00a877": "Green (Munsell)",
-         "#009f6b": "Green (NCS)",
-         "#00ad43": "Green (Pantone)",
-         "#00a550": "Green (pigment)",
-         "#66b032": "Green (RYB)",
-         "#1164b4": "Green-blue",
-         "#2887c8": "Green-blue (Crayola)",
-         "#009966": "Green-cyan",
-         "#a7f432": "Green Lizard",
-         "#6eaea1": "Green Sheen",
-         "#adff2f": "Green-yellow",
-         "#f0e891": "Green-yellow (Crayola)",
-         "#a99a86": "Grullo",
-         "#2a3439": "Gunmetal",
-         "#446ccf": "Han blue",
-         "#5218fa": "Han purple",
-         "#3fff00": "Harlequin",
-         "#da9100": "Harvest gold",
-         "#ff7a00": "Heat Wave",
-         "#df73ff": "Heliotrope",
-         "#aa98a9": "Heliotrope gray",
-         "#f0fff0": "Honeydew",
-         "#006db0": "Honolulu blue",
-         "#49796b": "Hooker's green",
-         "#ff1dce": "Hot magenta",
-         "#ff69b4": "Hot pink",
-         "#355e3b": "Hunter green",
-         "#71a6d2": "Iceberg",
-         "#fcf75e": "Icterine",
-         "#319177": "Illuminating emerald",
-         "#b2ec5d": "Inchworm",
-         "#4c516d": "Independence",
-         "#138808": "India green",
-         "#cd5c5c": "Indian red",
-         "#e3a857": "Indian yellow",
-         "#4b0082": "Indigo",
-         "#00416a": "Indigo dye",
-         "#002fa7": "International Klein Blue",
-         "#ff4f00": "International orange (aerospace)",
-         "#ba160c": "International orange (engineering)",
-         "#c0362c": "International orange (Golden Gate Bridge)",
-         "#5a4fcf": "Iris",
-         "#f4f0ec": "Isabelline",
-         "#b2ffff": "Italian sky blue",
-         "#fffff0": "Ivory",
-         "#00a86b": "Jade",
-         "#a50b5e": "Jazzberry jam",
-         "#343434": "Jet",
-         "#f4ca16": "Jonquil",
-         "#bdda57": "June bud",
-         "#29ab87": "Jungle green",
-         "#4cbb17": "Kelly green",
-         "#3ab09e": "Keppel",
-         "#e8f48c": "Key lime",
-         "#c3b091": "Khaki (web)",
-         "#f0e68c": "Khaki (X11) (Light khaki)",
-         "#e79fc4": "Kobi",
-         "#6b4423": "Kobicha",
-         "#354230": "Kombu green",
-         "#512888": "KSU purple",
-         "#d6cadd": "Languid lavender",
-         "#26619c": "Lapis lazuli",
-         "#ffff66": "Laser lemon",
-         "#a9ba9d": "Laurel green",
-         "#cf1020": "Lava",
-         "#b57edc": "Lavender (floral)",
-         "#e6e6fa": "Lavender (web)",
-         "#ccccff": "Lavender blue",
-         "#fff0f5": "Lavender blush",
-         "#c4c3d0": "Lavender gray",
-         "#7cfc00": "Lawn green",
-         "#fff700": "Lemon",
-         "#fffacd": "Lemon chiffon",
-         "#cca01d": "Lemon curry",
-         "#fdff00": "Lemon glacier",
-         "#f6eabe": "Lemon meringue",
-         "#fff44f": "Lemon yellow",
-         "#ffff9f": "Lemon yellow (Crayola)",
-         "#545aa7": "Liberty",
-         "#add8e6": "Light blue",
-         "#f08080": "Light coral",
-         "#93ccea": "Light cornflower blue",
-         "#e0ffff": "Light cyan",
-         "#c8ad7f": "Light French beige",
-         "#fafad2": "Light goldenrod yellow",
-         "#d3d3d3": "Light gray",
-         "#90ee90": "Light green",
-         "#fed8b1": "Light orange",
-         "#c5cbe1": "Light periwinkle",
-         "#ffb6c1": "Light pink",
-         "#ffa07a": "Light salmon",
-         "#20b2aa": "Light sea green",
-         "#87cefa": "Light sky blue",
-         "#778899": "Light slate gray",
-         "#b0c4de": "Light steel blue",
-         "#ffffe0": "Light yellow",
-         "#c8a2c8": "Lilac",
-         "#ae98aa": "Lilac Luster",
-         "#32cd32": "Lime green",
-         "#195905": "Lincoln green",
-         "#faf0e6": "Linen",
-         "#de6fa1": "Liseran purple",
-         "#6ca0dc": "Little boy blue",
-         "#674c47": "Liver",
-         "#b86d29": "Liver (dogs)",
-         "#6c2e1f": "Liver (organ)",
-         "#987456": "Liver chestnut",
-         "#ffbd88": "Macaroni and Cheese",
-         "#cc3336": "Madder Lake",
-         "#ff00ff": "Magenta",
-         "#f653a6": "Magenta (Crayola)",
-         "#ca1f7b": "Magenta (dye)",
-         "#d0417e": "Magenta (Pantone)",
-         "#ff0090": "Magenta (process)",
-         "#9f4576": "Magenta haze",
-         "#aaf0d1": "Magic mint",
-         "#f8f4ff": "Magnolia",
-         "#c04000": "Mahogany",
-         "#fbec5d": "Maize",
-         "#f2c649": "Maize (Crayola)",
-         "#6050dc": "Majorelle blue",
-         "#0bda51": "Malachite",
-         "#979aaa": "Manatee",
-         "#f37a48": "Mandarin",
-         "#fdbe02": "Mango",
-         "#ff8243": "Mango Tango",
-         "#74c365": "Mantis",
-         "#880085": "Mardi Gras",
-         "#eaa221": "Marigold",
-         "#800000": "Maroon (web)",
-         "#b03060": "Maroon (X11)",
-         "#e0b0ff": "Mauve",
-         "#915f6d": "Mauve taupe",
-         "#ef98aa": "Mauvelous",
-         "#47abcc": "Maximum blue",
-         "#30bfbf": "Maximum blue green",
-         "#acace6": "Maximum blue purple",
-         "#5e8c31": "Maximum green",
-         "#d9e650": "Maximum green yellow",
-         "#733380": "Maximum purple",
-         "#d92121": "Maximum red",
-         "#a63a79": "Maximum red purple",
-         "#fafa37": "Maximum yellow",
-         "#f2ba49": "Maximum yellow red",
-         "#4c9141": "May green",
-         "#73c2fb": "Maya blue",
-         "#66ddaa": "Medium aquamarine",
-         "#0000cd": "Medium blue",
-         "#e2062c": "Medium candy apple red",
-         "#af4035": "Medium carmine",
-         "#ba55d3": "Medium orchid",
-         "#9370db": "Medium purple",
-         "#3cb371": "Medium sea green",
-         "#7b68ee": "Medium slate blue",
-         "#00fa9a": "Medium spring green",
-         "#48d1cc": "Medium turquoise",
-         "#f8b878": "Mellow apricot",
-         "#f8de7e": "Mellow yellow",
-         "#febaad": "Melon",
-         "#d3af37": "Metallic gold",
-         "#0a7e8c": "Metallic Seaweed",
-         "#9c7c38": "Metallic Sunburst",
-         "#e4007c": "Mexican pink",
-         "#7ed4e6": "Middle blue",
-         "#8dd9cc": "Middle blue green",
-         "#8b72be": "Middle blue purple",
-         "#8b8680": "Middle grey",
-         "#4d8c57": "Middle green",
-         "#acbf60": "Middle green yellow",
-         "#d982b5": "Middle purple",
-         "#e58e73": "Middle red",
-         "#a55353": "Middle red purple",
-         "#ffeb00": "Middle yellow",
-         "#ecb176": "Middle yellow red",
-         "#702670": "Midnight",
-         "#191970": "Midnight blue",
-         "#004953": "Midnight green (eagle green)",
-         "#ffc40c": "Mikado yellow",
-         "#ffdae9": "Mimi pink",
-         "#e3f988": "Mindaro",
-         "#36747d": "Ming",
-         "#f5e050": "Minion yellow",
-         "#3eb489": "Mint",
-         "#f5fffa": "Mint cream",
-         "#98ff98": "Mint green",
-         "#bbb477": "Misty moss",
-         "#ffe4e1": "Misty rose",
-         "#8da399": "Morning blue",
-         "#8a9a5b": "Moss green",
-         "#30ba8f": "Mountain Meadow",
-         "#997a8d": "Mountbatten pink",
-         "#18453b": "MSU green",
-         "#c54b8c": "Mulberry",
-         "#c8509b": "Mulberry (Crayola)",
-         "#ffdb58": "Mustard",
-         "#317873": "Myrtle green",
-         "#d65282": "Mystic",
-         "#ad4379": "Mystic maroon",
-         "#f6adc6": "Nadeshiko pink",
-         "#ffdead": "Navajo white",
-         "#000080": "Navy blue",
-         "#4666ff": "Neon blue",
-         "#39ff14": "Neon green",
-         "#d7837f": "New York pink",
-         "#727472": "Nickel",
-         "#a4dded": "Non-photo blue",
-         "#e9ffdb": "Nyanza",
-         "#4f42b5": "Ocean Blue",
-         "#48bf91": "Ocean green",
-         "#cc7722": "Ochre",
-         "#43302e": "Old burgundy",
-         "#cfb53b": "Old gold",
-         "#fdf5e6": "Old lace",
-         "#796878": "Old lavender",
-         "#c08081": "Old rose",
-         "#848482": "Old silver",
-         "#808000": "Olive",
-         "#6b8e23": "Olive Drab (Nb3)",
-         "#3c341f": "Olive Drab (Nb7)",
-         "#b5b35c": "Olive green",
-         "#9ab973": "Olivine",
-         "#353839": "Onyx",
-         "#a8c3bc": "Opal",
-         "#b784a7": "Opera mauve",
-         "#ff7f00": "Orange",
-         "#ff7538": "Orange (Crayola)",
-         "#ff5800": "Orange (Pantone)",
-         "#ffa500": "Orange (web)",
-         "#ff9f00": "Orange peel",
-         "#ff681f": "Orange-red",
-         "#fa5b3d": "Orange soda",
-         "#f5bd1f": "Orange-yellow",
-         "#f8d568": "Orange-yellow (Crayola)",
-         "#da70d6": "Orchid",
-         "#f2bdcd": "Orchid pink",
-         "#e29cd2": "Orchid (Crayola)",
-         "#2d383a": "Outer space (Crayola)",
-         "#ff6e4a": "Outrageous Orange",
-         "#002147": "Oxford blue",
-         "#841617": "OU Crimson red",
-         "#1ca9c9": "Pacific blue",
-         "#006600": "Pakistan green",
-         "#682860": "Palatinate purple",
-         "#9bc4e2": "Pale cerulean",
-         "#fadadd": "Pale pink",
-         "#fae6fa": "Pale purple (Pantone)",
-         "#c9c0bb": "Pale silver",
-         "#78184a": "Pansy purple",
-         "#009b7d": "Paolo Veronese green",
-         "#ffefd5": "Papaya whip",
-         "#e63e62": "Paradise pink",
-         "#50c878": "Paris Green",
-         "#dea5a4": "Pastel pink",
-         "#ffe5b4": "Peach",
-         "#ffcba4": "Peach (Crayola)",
-         "#ffdab9": "Peach puff",
-         "#d1e231": "Pear",
-         "#b768a2": "Pearly purple",
-         "#c3cde6": "Periwinkle (Crayola)",
-         "#e12c2c": "Permanent Geranium Lake",
-         "#1c39bb": "Persian blue",
-         "#00a693": "Persian green",
-         "#32127a": "Persian indigo",
-         "#d99058": "Persian orange",
-         "#f77fbe": "Persian pink",
-         "#cc3333": "Persian red",
-         "#fe28a2": "Persian rose",
-         "#ec5800": "Persimmon",
-         "#8ba8b7": "Pewter Blue",
-         "#000f89": "Phthalo blue",
-         "#123524": "Phthalo green",
-         "#2e2787": "Picotee blue",
-         "#c30b4e": "Pictorial carmine",
-         "#fddde6": "Piggy pink",
-         "#01796f": "Pine green",
-         "#2a2f23": "Pine tree",
-         "#ffc0cb": "Pink",
-         "#d74894": "Pink (Pantone)",
-         "#fc74fd": "Pink flamingo",
-         "#ffddf4": "Pink lace",
-         "#d8b2d1": "Pink lavender",
-         "#f78fa7": "Pink Sherbet",
-         "#93c572": "Pistachio",
-         "#e5e4e2": "Platinum",
-         "#8e4585": "Plum",
-         "#dda0dd": "Plum (web)",
-         "#5946b2": "Plump Purple",
-         "#5da493": "Polished Pine",
-         "#be4f62": "Popstar",
-         "#ff5a36": "Portland Orange",
-         "#b0e0e6": "Powder blue",
-         "#f58025": "Princeton orange",
-         "#701c1c": "Prune",
-         "#003153": "Prussian blue",
-         "#df00ff": "Psychedelic purple",
-         "#cc8899": "Puce",
-         "#644117": "Pullman Brown (UPS Brown)",
-         "#ff7518": "Pumpkin",
-         "#6a0dad": "Purple",
-         "#800080": "Purple (web)",
-         "#9f00c5": "Purple (Munsell)",
-         "#a020f0": "Purple (X11)",
-         "#9678b6": "Purple mountain majesty",
-         "#4e5180": "Purple navy",
-         "#fe4eda": "Purple pizzazz",
-         "#9c51b6": "Purple Plum",
-         "#9a4eae": "Purpureus",
-         "#436b95": "Queen blue",
-         "#e8ccd7": "Queen pink",
-         "#a6a6a6": "Quick Silver",
-         "#8e3a59": "Quinacridone magenta",
-         "#ff355e": "Radical Red",
-         "#242124": "Raisin black",
-         "#fbab60": "Rajah",
-         "#e30b5d": "Raspberry",
-         "#b3446c": "Raspberry rose",
-         "#d68a59": "Raw Sienna",
-         "#826644": "Raw umber",
-         "#ff33cc": "Razzle dazzle rose",
-         "#e3256b": "Razzmatazz",
-         "#8d4e85": "Razzmic Berry",
-         "#663399": "Rebecca Purple",
-         "#ff0000": "Red",
-         "#ee204d": "Red (Crayola)",
-         "#f2003c": "Red (Munsell)",
-         "#c40233": "Red (NCS)",
-         "#ed2939": "Red (Pantone)",
-         "#ed1c24": "Red (pigment)",
-         "#fe2712": "Red (RYB)",
-         "#ff5349": "Red-orange",
-         "#ff4500": "Red-orange (Color wheel)",
-         "#e40078": "Red-purple",
-         "#fd3a4a": "Red Salsa",
-         "#c71585": "Red-violet",
-         "#c0448f": "Red-violet (Crayola)",
-         "#922b3e": "Red-violet (Color wheel)",
-         "#a45a52": "Redwood",
-         "#002387": "Resolution blue",
-         "#777696": "Rhythm",
-         "#004040": "Rich black",
-         "#010b13": "Rich black (FOGRA29)",
-         "#010203": "Rich black (FOGRA39)",
-         "#444c38": "Rifle green",
-         "#00cccc": "Robin egg blue",
-         "#8a7f80": "Rocket metallic",
-         "#838996": "Roman silver",
-         "#ff007f": "Rose",
-         "#f9429e": "Rose bonbon",
-         "#9e5e6f": "Rose Dust",
-         "#674846": "Rose ebony",
-         "#e32636": "Rose madder",
-         "#ff66cc": "Rose pink",
-         "#c21e56": "Rose red",
-         "#905d5d": "Rose taupe",
-         "#ab4e52": "Rose vale",
-         "#65000b": "Rosewood",
-         "#d40000": "Rosso corsa",
-         "#bc8f8f": "Rosy brown",
-         "#002366": "Royal blue (dark)",
-         "#4169e1": "Royal blue (light)",
-         "#7851a9": "Royal purple",
-         "#fada5e": "Royal yellow",
-         "#ce4676": "Ruber",
-         "#d10056": "Rubine red",
-         "#e0115f": "Ruby",
-         "#9b111e": "Ruby red",
-         "#a81c07": "Rufous",
-         "#80461b": "Russet",
-         "#679267": "Russian green",
-         "#32174d": "Russian violet",
-         "#b7410e": "Rust",
-         "#da2c43": "Rusty red",
-         "#043927": "Sacramento State green",
-         "#8b4513": "Saddle brown",
-         "#ff7800": "Safety orange",
-         "#ff6700": "Safety orange (blaze orange)",
-         "#eed202": "Safety yellow",
-         "#f4c430": "Saffron",
-         "#bcb88a": "Sage",
-         "#23297a": "St. Patrick's blue",
-         "#fa8072": "Salmon",
-         "#ff91a4": "Salmon pink",
-         "#f4a460": "Sandy brown",
-         "#507d2a": "Sap green",
-         "#0f52ba": "Sapphire",
-         "#0067a5": "Sapphire blue",
-         "#cba135": "Satin sheen gold",
-         "#ff2400": "Scarlet",
-         "#ffd800": "School bus yellow",
-         "#66ff66": "Screamin' Green",
-         "#2e8b57": "Sea green",
-         "#00ffcd": "Sea green (Crayola)",
-         "#59260b": "Seal brown",
-         "#fff5ee": "Seashell",
-         "#ffba00": "Selective yellow",
-         "#704214": "Sepia",
-         "#8a795d": "Shadow",
-         "#778ba5": "Shadow blue",
-         "#009e60": "Shamrock green",
-         "#8fd400": "Sheen green",
-         "#d98695": "Shimmering Blush",
-         "#5fa778": "Shiny Shamrock",
-         "#fc0fc0": "Shocking pink",
-         "#882d17": "Sienna",
-         "#c0c0c0": "Silver",
-         "#aaa9ad": "Silver (Metallic)",
-         "#acacac": "Silver chalice",
-         "#c4aead": "Silver pink",
-         "#bfc1c2": "Silver sand",
-         "#cb410b": "Sinopia",
-         "#ff3855": "Sizzling Red",
-         "#ffdb00": "Sizzling Sunrise",
-         "#007474": "Skobeloff",
-         "#87ceeb": "Sky blue",
-         "#76d7ea": "Sky blue (Crayola)",
-         "#cf71af": "Sky magenta",
-         "#6a5acd": "Slate blue",
-         "#708090": "Slate gray",
-         "#299617": "Slimy green",
-         "#c84186": "Smitten",
-         "#100c08": "Smoky black",
-         "#fffafa": "Snow",
-         "#893843": "Solid pink",
-         "#757575": "Sonic silver",
-         "#1d2951": "Space cadet",
-         "#807532": "Spanish bistre",
-         "#0070b8": "Spanish blue",
-         "#d10047": "Spanish carmine",
-         "#989898": "Spanish gray",
-         "#009150": "Spanish green",
-         "#e86100": "Spanish orange",
-         "#f7bfbe": "Spanish pink",
-         "#e60026": "Spanish red",
-         "#4c2882": "Spanish violet",
-         "#007f5c": "Spanish viridian",
-         "#a7fc00": "Spring bud",
-         "#87ff2a": "Spring Frost",
-         "#00ff7f": "Spring green",
-         "#ecebbd": "Spring green (Crayola)",
-         "#007bb8": "Star command blue",
-         "#4682b4": "Steel blue",
-         "#cc33cc": "Steel pink",
-         "#5f8a8b": "Steel Teal",
-         "#e4d96f": "Straw",
-         "#914e75": "Sugar Plum",
-         "#ffcc33": "Sunglow",
-         "#e3ab57": "Sunray",
-         "#fad6a5": "Sunset",
-         "#cf6ba9": "Super pink",
-         "#a83731": "Sweet Brown",
-         "#d2b48c": "Tan",
-         "#d99a6c": "Tan (Crayola)",
-         "#f28500": "Tangerine",
-         "#fb4d46": "Tart Orange",
-         "#483c32": "Taupe",
-         "#8b8589": "Taupe gray",
-         "#d0f0c0": "Tea green",
-         "#f88379": "Tea rose",
-         "#008080": "Teal",
-         "#367588": "Teal blue",
-         "#cf3476": "Telemagenta",
-         "#cd5700": "Tenné (tawny)",
-         "#e2725b": "Terra cotta",
-         "#d8bfd8": "Thistle",
-         "#fc89ac": "Tickle Me Pink",
-         "#0abab5": "Tiffany Blue",
-         "#dbd7d2": "Timberwolf",
-         "#eee600": "Titanium yellow",
-         "#ff6347": "Tomato",
-         "#00755e": "Tropical rain forest",
-         "#2d68c4": "True Blue",
-         "#1c05b3": "Trypan Blue",
-         "#3e8ede": "Tufts blue",
-         "#deaa88": "Tumbleweed",
-         "#40e0d0": "Turquoise",
-         "#00ffef": "Turquoise blue",
-         "#a0d6b4": "Turquoise green",
-         "#7c4848": "Tuscan red",
-         "#c09999": "Tuscany",
-         "#8a496b": "Twilight lavender",
-         "#66023c": "Tyrian purple",
-         "#0033aa": "UA blue",
-         "#d9004c": "UA red",
-         "#3f00ff": "Ultramarine",
-         "#4166f5": "Ultramarine blue",
-         "#ff6fff": "Ultra pink",
-         "#fc6c85": "Ultra red",
-         "#635147": "Umber",
-         "#ffddca": "Unbleached silk",
-         "#5b92e5": "United Nations blue",
-         "#7b1113": "UP maroon",
-         "#ae2029": "Upsdell red",
-         "#afdbf5": "Uranian blue",
-         "#004f98": "USAFA blue",
-         "#664228": "Van Dyke brown",
-         "#f3e5ab": "Vanilla",
-         "#f38fa9": "Vanilla ice",
-         "#c5b358": "Vegas gold",
-         "#c80815": "Venetian red",
-         "#43b3ae": "Verdigris",
-         "#d9381e": "Vermilion1",
-         "#8f00ff": "Violet",
-         "#7f00ff": "Violet (color wheel)",
-         "#963d7f": "Violet (crayola)",
-         "#8601af": "Violet (RYB)",
-         "#ee82ee": "Violet (web)",
-         "#324ab2": "Violet-blue",
-         "#766ec8": "Violet-blue (Crayola)",
-         "#f75394": "Violet-red",
-         "#40826d": "Viridian",
-         "#009698": "Viridian green",
-         "#9f1d35": "Vivid burgundy",
-         "#00ccff": "Vivid sky blue",
-         "#ffa089": "Vivid tangerine",
-         "#9f00ff": "Vivid violet",
-         "#ceff00": "Volt",
-         "#004242": "Warm black",
-         "#f5deb3": "Wheat",
-         "#ffffff": "White",
-         "#a2add0": "Wild blue yonder",
-         "#d470a2": "Wild orchid",
-         "#ff43a4": "Wild Strawberry",
-         "#a75502": "Windsor tan",
-         "#722f37": "Wine",
-         "#673147": "Wine dregs",
-         "#ff007c": "Winter Sky",
-         "#56887d": "Wintergreen Dream",
-         "#c9a0dc": "Wisteria",
-         "#c19a6b": "Wood brown",
-         "#eeed09": "Xanthic",
-         "#738678": "Xanadu",
-         "#0c020f": "Xiketic",
-         "#0f4d92": "Yale Blue",
-         "#ffff00": "Yellow",
-         "#fce883": "Yellow (Crayola)",
-         "#efcc00": "Yellow (Munsell)",
-         "#ffd300": "Yellow (NCS)",
-         "#fedf00": "Yellow (Pantone)",
-         "#fefe33": "Yellow (RYB)",
-         "#9acd32": "Yellow-green",
-         "#c5e384": "Yellow-green (Crayola)",
-         "#30b21a": "Yellow-green (Color Wheel)",
-         "#ffae42": "Yellow Orange",
-         "#ff9505": "Yellow Orange (Color Wheel)",
-         "#2e5090": "YInMn Blue",
-         "#0014a8": "Zaffre",
-         "#39a78e": "Zomp"}
+names = ColourDictionary(os.path.join(dictionaries_path, 'names.bin'))
 
 # Pantone C colours expressed as hex rgb values
-pantone = {"#FEDD00": "Yellow C",
-           "#FFD700": "Yellow 012 C",
-           "#FE5000": "Orange 021 C",
-           "#F9423A": "Warm Red C",
-           "#EF3340": "Red 032 C",
-           "#CE0058": "Rubine Red C",
-           "#E10098": "Rhodamine Red C",
-           "#BB29BB": "Purple C",
-           "#440099": "Violet C",
-           "#10069F": "Blue 072 C",
-           "#001489": "Reflex Blue C",
-           "#0085CA": "Process Blue C",
-           "#00AB84": "Green C",
-           "#2D2926": "Black C",
-           "#F2F0A1": "Yellow 0131 C",
-           "#FCAEBB": "Red 0331 C",
-           "#F1B2DC": "Magenta 0521 C",
-           "#BF9BDE": "Violet 0631 C",
-           "#74D1EA": "Blue 0821 C",
-           "#9DE7D7": "Green 0921 C",
-           "#9E978E": "Black 0961 C",
-           "#009ACE": "801 C",
-           "#44D62C": "802 C",
-           "#FFE900": "803 C",
-           "#FFAA4D": "804 C",
-           "#FF7276": "805 C",
-           "#FF3EB5": "806 C",
-           "#EA27C2": "807 C",
-           "#84754E": "871 C",
-           "#85714D": "872 C",
-           "#866D4B": "873 C",
-           "#8B6F4E": "874 C",
-           "#87674F": "875 C",
-           "#8B634B": "876 C",
-           "#8A8D8F": "877 C",
-           "#FFD900": "Medium Yellow C",
-           "#FF5E00": "Bright Orange C",
-           "#F93822": "Bright Red C",
-           "#CE0056": "Strong Red C",
-           "#D62598": "Pink C",
-           "#4E008E": "Medium Purple C",
-           "#00239C": "Dark Blue C",
-           "#0084CA": "Medium Blue C",
-           "#00B08B": "Bright Green C",
-           "#222223": "Neutral Black C",
-           "#F6EB61": "100 C",
-           "#F7EA48": "101 C",
-           "#FCE300": "102 C",
-           "#C5A900": "103 C",
-           "#AF9800": "104 C",
-           "#897A27": "105 C",
-           "#F5E1A4": "7401 C",
-           "#ECD898": "7402 C",
-           "#EED484": "7403 C",
-           "#F4DA40": "7404 C",
-           "#F2CD00": "7405 C",
-           "#F1C400": "7406 C",
-           "#CBA052": "7407 C",
-           "#F9E547": "106 C",
-           "#FBE122": "107 C",
-           "#FEDB00": "108 C",
-           "#FFD100": "109 C",
-           "#DAAA00": "110 C",
-           "#AA8A00": "111 C",
-           "#9C8412": "112 C",
-           "#FAE053": "113 C",
-           "#FBDD40": "114 C",
-           "#FDDA24": "115 C",
-           "#FFCD00": "116 C",
-           "#C99700": "117 C",
-           "#AC8400": "118 C",
-           "#897322": "119 C",
-           "#F3DD6D": "127 C",
-           "#F3D54E": "128 C",
-           "#F3D03E": "129 C",
-           "#F2A900": "130 C",
-           "#CC8A00": "131 C",
-           "#A07400": "132 C",
-           "#6C571B": "133 C",
-           "#F8E08E": "1205 C",
-           "#FBD872": "1215 C",
-           "#FFC845": "1225 C",
-           "#FFB81C": "1235 C",
-           "#C69214": "1245 C",
-           "#AD841F": "1255 C",
-           "#886B25": "1265 C",
-           "#FBDB65": "120 C",
-           "#FDD757": "121 C",
-           "#FED141": "122 C",
-           "#FFC72C": "123 C",
-           "#EAAA00": "124 C",
-           "#B58500": "125 C",
-           "#9A7611": "126 C",
-           "#FFC600": "7548 C",
-           "#FFB500": "7549 C",
-           "#D19000": "7550 C",
-           "#B47E00": "7551 C",
-           "#73531D": "7552 C",
-           "#5A4522": "7553 C",
-           "#4B3D2A": "7554 C",
-           "#D29F13": "7555 C",
-           "#B78B20": "7556 C",
-           "#9F7D23": "7557 C",
-           "#967126": "7558 C",
-           "#8F6A2A": "7559 C",
-           "#7D622E": "7560 C",
-           "#6C5D34": "7561 C",
-           "#FDD26E": "134 C",
-           "#FFC658": "135 C",
-           "#FFBF3F": "136 C",
-           "#FFA300": "137 C",
-           "#DE7C00": "138 C",
-           "#AF6D04": "139 C",
-           "#74531C": "140 C",
-           "#FDD086": "1345 C",
-           "#FFC56E": "1355 C",
-           "#FFB549": "1365 C",
-           "#FF9E1B": "1375 C",
-           "#D57800": "1385 C",
-           "#996017": "1395 C",
-           "#6E4C1E": "1405 C",
-           "#F2C75C": "141 C",
-           "#F1BE48": "142 C",
-           "#F1B434": "143 C",
-           "#ED8B00": "144 C",
-           "#CF7F00": "145 C",
-           "#A76D11": "146 C",
-           "#715C2A": "147 C",
-           "#F6BE00": "7408 C",
-           "#F0B323": "7409 C",
-           "#FEAD77": "7410 C",
-           "#E6A65D": "7411 C",
-           "#D38235": "7412 C",
-           "#DC8633": "7413 C",
-           "#C16C18": "7414 C",
-           "#BD9B60": "7562 C",
-           "#D69A2D": "7563 C",
-           "#DB8A06": "7564 C",
-           "#CD7925": "7565 C",
-           "#AD6433": "7566 C",
-           "#89532F": "7567 C",
-           "#775135": "7568 C",
-           "#D78825": "7569 C",
-           "#D3832B": "7570 C",
-           "#C67D30": "7571 C",
-           "#B67233": "7572 C",
-           "#A7662B": "7573 C",
-           "#9E6A38": "7574 C",
-           "#835D32": "7575 C",
-           "#FCC89B": "712 C",
-           "#FDBE87": "713 C",
-           "#FDAA63": "714 C",
-           "#F68D2E": "715 C",
-           "#EA7600": "716 C",
-           "#D45D00": "717 C",
-           "#BE4D00": "718 C",
-           "#FECB8B": "148 C",
-           "#FFC27B": "149 C",
-           "#FFB25B": "150 C",
-           "#FF8200": "151 C",
-           "#E57200": "152 C",
-           "#BE6A14": "153 C",
-           "#9B5A1A": "154 C",
-           "#EFD19F": "155 C",
-           "#EFBE7D": "156 C",
-           "#ECA154": "157 C",
-           "#E87722": "158 C",
-           "#CB6015": "159 C",
-           "#A1561C": "160 C",
-           "#603D20": "161 C",
-           "#FFAE62": "1485 C",
-           "#FF8F1C": "1495 C",
-           "#FF6900": "1505 C",
-           "#B94700": "1525 C",
-           "#94450B": "1535 C",
-           "#653819": "1545 C",
-           "#FFB990": "1555 C",
-           "#FFA06A": "1565 C",
-           "#FF7F32": "1575 C",
-           "#FF6A13": "1585 C",
-           "#D86018": "1595 C",
-           "#A65523": "1605 C",
-           "#8B4720": "1615 C",
-           "#FFBE9F": "162 C",
-           "#FF9D6E": "163 C",
-           "#FF7F41": "164 C",
-           "#FF671F": "165 C",
-           "#E35205": "166 C",
-           "#BE531C": "167 C",
-           "#73381D": "168 C",
-           "#DB864E": "7576 C",
-           "#E07E3C": "7577 C",
-           "#DC6B2F": "7578 C",
-           "#DC582A": "7579 C",
-           "#C05131": "7580 C",
-           "#864A33": "7581 C",
-           "#674736": "7582 C",
-           "#FFA38B": "1625 C",
-           "#FF8D6D": "1635 C",
-           "#FF6A39": "1645 C",
-           "#FC4C02": "1655 C",
-           "#DC4405": "1665 C",
-           "#A9431E": "1675 C",
-           "#833921": "1685 C",
-           "#FFB3AB": "169 C",
-           "#FF8674": "170 C",
-           "#FF5C39": "171 C",
-           "#FA4616": "172 C",
-           "#CF4520": "173 C",
-           "#963821": "174 C",
-           "#6B3529": "175 C",
-           "#C4622D": "7583 C",
-           "#BA5826": "7584 C",
-           "#AF5C37": "7585 C",
-           "#9E5330": "7586 C",
-           "#924C2E": "7587 C",
-           "#7B4D35": "7588 C",
-           "#5C4738": "7589 C",
-           "#D4B59E": "7590 C",
-           "#C07D59": "7591 C",
-           "#B15533": "7592 C",
-           "#9D432C": "7593 C",
-           "#7C3A2D": "7594 C",
-           "#6B3D2E": "7595 C",
-           "#5C3D31": "7596 C",
-           "#D14124": "7597 C",
-           "#BD472A": "7598 C",
-           "#B33D26": "7599 C",
-           "#8D3F2B": "7600 C",
-           "#83412C": "7601 C",
-           "#7B4931": "7602 C",
-           "#674230": "7603 C",
-           "#E4D5D3": "7604 C",
-           "#E1BBB4": "7605 C",
-           "#D6938A": "7606 C",
-           "#C26E60": "7607 C",
-           "#A4493D": "7608 C",
-           "#823B34": "7609 C",
-           "#683431": "7610 C",
-           "#DDBCB0": "7611 C",
-           "#CA9A8E": "7612 C",
-           "#BC8A7E": "7613 C",
-           "#A37F74": "7614 C",
-           "#866761": "7615 C",
-           "#6B4C4C": "7616 C",
-           "#583D3E": "7617 C",
-           "#EABEB0": "7520 C",
-           "#C09C83": "7521 C",
-           "#B46A55": "7522 C",
-           "#AB5C57": "7523 C",
-           "#A45248": "7524 C",
-           "#9A6A4F": "7525 C",
-           "#8A391B": "7526 C",
-           "#ECC3B2": "489 C",
-           "#ECBAA8": "488 C",
-           "#EAA794": "487 C",
-           "#E8927C": "486 C",
-           "#DA291C": "485 C",
-           "#9A3324": "484 C",
-           "#653024": "483 C",
-           "#FFB1BB": "176 C",
-           "#FF808B": "177 C",
-           "#FF585D": "178 C",
-           "#E03C31": "179 C",
-           "#BE3A34": "180 C",
-           "#81312F": "181 C",
-           "#FFA3B5": "1765 C",
-           "#FF8DA1": "1775 C",
-           "#F8485E": "1785 C",
-           "#EE2737": "1788 C",
-           "#D22630": "1795 C",
-           "#AF272F": "1805 C",
-           "#7C2529": "1815 C",
-           "#FCAFC0": "1767 C",
-           "#FB637E": "1777 C",
-           "#F4364C": "1787 C",
-           "#CB333B": "1797 C",
-           "#A4343A": "1807 C",
-           "#643335": "1817 C",
-           "#C66E4E": "7618 C",
-           "#C04C36": "7619 C",
-           "#B7312C": "7620 C",
-           "#AB2328": "7621 C",
-           "#93272C": "7622 C",
-           "#8A2A2B": "7623 C",
-           "#802F2D": "7624 C",
-           "#E1523D": "7625 C",
-           "#C63527": "7626 C",
-           "#A72B2A": "7627 C",
-           "#9E2A2B": "7628 C",
-           "#6D3332": "7629 C",
-           "#633231": "7630 C",
-           "#572D2D": "7631 C",
-           "#E6BAA8": "7415 C",
-           "#E56A54": "7416 C",
-           "#E04E39": "7417 C",
-           "#CD545B": "7418 C",
-           "#B04A5A": "7419 C",
-           "#9B2242": "7420 C",
-           "#651D32": "7421 C",
-           "#FABBCB": "182 C",
-           "#FC9BB3": "183 C",
-           "#F65275": "184 C",
-           "#E4002B": "185 C",
-           "#C8102E": "186 C",
-           "#A6192E": "187 C",
-           "#76232F": "188 C",
-           "#ECC7CD": "196 C",
-           "#E89CAE": "197 C",
-           "#DF4661": "198 C",
-           "#D50032": "199 C",
-           "#BA0C2F": "200 C",
-           "#9D2235": "201 C",
-           "#862633": "202 C",
-           "#F8A3BC": "189 C",
-           "#F67599": "190 C",
-           "#EF426F": "191 C",
-           "#E40046": "192 C",
-           "#BF0D3E": "193 C",
-           "#9B2743": "194 C",
-           "#782F40": "195 C",
-           "#F5B6CD": "1895 C",
-           "#F59BBB": "1905 C",
-           "#EF4A81": "1915 C",
-           "#E0004D": "1925 C",
-           "#C5003E": "1935 C",
-           "#A6093D": "1945 C",
-           "#8A1538": "1955 C",
-           "#F5DADF": "705 C",
-           "#F7CED7": "706 C",
-           "#F9B5C4": "707 C",
-           "#F890A5": "708 C",
-           "#EF6079": "709 C",
-           "#E03E52": "710 C",
-           "#CB2C30": "711 C",
-           "#F2D4D7": "698 C",
-           "#F4C3CC": "699 C",
-           "#F2ACB9": "700 C",
-           "#E68699": "701 C",
-           "#D25B73": "702 C",
-           "#B83A4B": "703 C",
-           "#9E2A2F": "704 C",
-           "#ECB3CB": "203 C",
-           "#E782A9": "204 C",
-           "#E0457B": "205 C",
-           "#CE0037": "206 C",
-           "#A50034": "207 C",
-           "#861F41": "208 C",
-           "#6F263D": "209 C",
-           "#F99FC9": "210 C",
-           "#F57EB6": "211 C",
-           "#F04E98": "212 C",
-           "#E31C79": "213 C",
-           "#CE0F69": "214 C",
-           "#AC145A": "215 C",
-           "#7D2248": "216 C",
-           "#F4CDD4": "7422 C",
-           "#E06287": "7423 C",
-           "#E24585": "7424 C",
-           "#B52555": "7425 C",
-           "#A4123F": "7426 C",
-           "#971B2F": "7427 C",
-           "#6A2C3E": "7428 C",
-           "#D6C9CA": "7632 C",
-           "#C4A4A7": "7633 C",
-           "#C16784": "7634 C",
-           "#C63663": "7635 C",
-           "#BC204B": "7636 C",
-           "#912F46": "7637 C",
-           "#7E2D40": "7638 C",
-           "#EABEDB": "217 C",
-           "#E56DB1": "218 C",
-           "#DA1884": "219 C",
-           "#A50050": "220 C",
-           "#910048": "221 C",
-           "#6C1D45": "222 C",
-           "#936D73": "7639 C",
-           "#934054": "7640 C",
-           "#8E2C48": "7641 C",
-           "#732E4A": "7642 C",
-           "#672E45": "7643 C",
-           "#582D40": "7644 C",
-           "#502B3A": "7645 C",
-           "#EF95CF": "223 C",
-           "#EB6FBD": "224 C",
-           "#DF1995": "225 C",
-           "#D0006F": "226 C",
-           "#AA0061": "227 C",
-           "#890C58": "228 C",
-           "#672146": "229 C",
-           "#F4A6D7": "230 C",
-           "#F277C6": "231 C",
-           "#E93CAC": "232 C",
-           "#C6007E": "233 C",
-           "#A20067": "234 C",
-           "#840B55": "235 C",
-           "#EAD3E2": "670 C",
-           "#E6BCD8": "671 C",
-           "#DFA0C9": "672 C",
-           "#D986BA": "673 C",
-           "#C6579A": "674 C",
-           "#AE2573": "675 C",
-           "#960051": "676 C",
-           "#E5CEDB": "677 C",
-           "#E3C8D8": "678 C",
-           "#DEBED2": "679 C",
-           "#C996B6": "680 C",
-           "#B06C96": "681 C",
-           "#994878": "682 C",
-           "#7C2855": "683 C",
-           "#E4C6D4": "684 C",
-           "#DCB6C9": "685 C",
-           "#D0A1BA": "686 C",
-           "#BE84A3": "687 C",
-           "#A76389": "688 C",
-           "#893B67": "689 C",
-           "#612141": "690 C",
-           "#EBBECB": "510 C",
-           "#E8B3C3": "509 C",
-           "#E4A9BB": "508 C",
-           "#D592AA": "507 C",
-           "#84344E": "506 C",
-           "#6F2C3F": "505 C",
-           "#572932": "504 C",
-           "#E2BCCB": "7429 C",
-           "#DCA9BF": "7430 C",
-           "#C9809E": "7431 C",
-           "#B55C80": "7432 C",
-           "#A73A64": "7433 C",
-           "#9B3259": "7434 C",
-           "#872651": "7435 C",
-           "#E9CDD0": "691 C",
-           "#E4BEC3": "692 C",
-           "#D7A3AB": "693 C",
-           "#C48490": "694 C",
-           "#B46B7A": "695 C",
-           "#984856": "696 C",
-           "#893C47": "697 C",
-           "#F2C6CF": "496 C",
-           "#F1BDC8": "495 C",
-           "#E9A2B2": "494 C",
-           "#DC8699": "493 C",
-           "#8F3237": "492 C",
-           "#7F3035": "491 C",
-           "#5D2A2C": "490 C",
-           "#E9C4C7": "503 C",
-           "#E5BAC1": "502 C",
-           "#DAA5AD": "501 C",
-           "#C6858F": "500 C",
-           "#7A3E3A": "499 C",
-           "#6A3735": "498 C",
-           "#512F2E": "497 C",
-           "#DFC2C3": "5035 C",
-           "#DBB7BB": "5025 C",
-           "#CCA1A6": "5015 C",
-           "#B07C83": "5005 C",
-           "#9C6169": "4995 C",
-           "#874B52": "4985 C",
-           "#3F2021": "4975 C",
-           "#F1A7DC": "236 C",
-           "#EC86D0": "237 C",
-           "#E45DBF": "238 C",
-           "#DB3EB1": "239 C",
-           "#C5299B": "240 C",
-           "#AF1685": "241 C",
-           "#80225F": "242 C",
-           "#EFBAE1": "2365 C",
-           "#E277CD": "2375 C",
-           "#D539B5": "2385 C",
-           "#C800A1": "2395 C",
-           "#B0008E": "2405 C",
-           "#9E007E": "2415 C",
-           "#830065": "2425 C",
-           "#EAB8E4": "243 C",
-           "#E59BDC": "244 C",
-           "#DD7FD3": "245 C",
-           "#C724B1": "246 C",
-           "#BB16A3": "247 C",
-           "#A51890": "248 C",
-           "#80276C": "249 C",
-           "#A56E87": "7646 C",
-           "#A83D72": "7647 C",
-           "#991E66": "7648 C",
-           "#8A1B61": "7649 C",
-           "#722257": "7650 C",
-           "#6A2A5B": "7651 C",
-           "#5E2751": "7652 C",
-           "#E7BAE4": "250 C",
-           "#DD9CDF": "251 C",
-           "#C964CF": "252 C",
-           "#AD1AAC": "253 C",
-           "#981D97": "254 C",
-           "#72246C": "255 C",
-           "#EBC6DF": "517 C",
-           "#E6BEDD": "516 C",
-           "#E2ACD7": "515 C",
-           "#D48BC8": "514 C",
-           "#93328E": "513 C",
-           "#833177": "512 C",
-           "#612C51": "511 C",
-           "#EEDAEA": "7436 C",
-           "#CCAED0": "7437 C",
-           "#D59ED7": "7438 C",
-           "#B288B9": "7439 C",
-           "#A277A6": "7440 C",
-           "#9F5CC0": "7441 C",
-           "#963CBD": "7442 C",
-           "#D7A9E3": "2562 C",
-           "#C98BDB": "2572 C",
-           "#AC4FC6": "2582 C",
-           "#9B26B6": "2592 C",
-           "#87189D": "2602 C",
-           "#772583": "2612 C",
-           "#653165": "2622 C",
-           "#948794": "7653 C",
-           "#A2789C": "7654 C",
-           "#A15A95": "7655 C",
-           "#8E3A80": "7656 C",
-           "#6E2B62": "7657 C",
-           "#6A3460": "7658 C",
-           "#5D3754": "7659 C",
-           "#D5C2D8": "524 C",
-           "#C9B1D0": "523 C",
-           "#BA9CC5": "522 C",
-           "#A57FB2": "521 C",
-           "#642F6C": "520 C",
-           "#59315F": "519 C",
-           "#4B3048": "518 C",
-           "#DBCDD3": "5245 C",
-           "#D0BEC7": "5235 C",
-           "#C6B0BC": "5225 C",
-           "#AF95A6": "5215 C",
-           "#86647A": "5205 C",
-           "#66435A": "5195 C",
-           "#4A3041": "5185 C",
-           "#D8C8D1": "5175 C",
-           "#D3C0CD": "5165 C",
-           "#BFA5B8": "5155 C",
-           "#9B7793": "5145 C",
-           "#7E5475": "5135 C",
-           "#693C5E": "5125 C",
-           "#512A44": "5115 C",
-           "#DFC8E7": "531 C",
-           "#D7B9E4": "530 C",
-           "#CAA2DD": "529 C",
-           "#B580D1": "528 C",
-           "#8031A7": "527 C",
-           "#702F8A": "526 C",
-           "#572C5F": "525 C",
-           "#D6BFDD": "256 C",
-           "#C6A1CF": "257 C",
-           "#8C4799": "258 C",
-           "#6D2077": "259 C",
-           "#642667": "260 C",
-           "#5D285F": "261 C",
-           "#51284F": "262 C",
-           "#CBA3D8": "2563 C",
-           "#B884CB": "2573 C",
-           "#A05EB5": "2583 C",
-           "#84329B": "2593 C",
-           "#702082": "2603 C",
-           "#671E75": "2613 C",
-           "#5F2167": "2623 C",
-           "#9991A4": "7660 C",
-           "#8D6E97": "7661 C",
-           "#7A4183": "7662 C",
-           "#6B3077": "7663 C",
-           "#653279": "7664 C",
-           "#5E366E": "7665 C",
-           "#5C4E63": "7666 C",
-           "#C1A0DA": "2567 C",
-           "#A77BCA": "2577 C",
-           "#8246AF": "2587 C",
-           "#5C068C": "2597 C",
-           "#500778": "2607 C",
-           "#470A68": "2617 C",
-           "#3C1053": "2627 C",
-           "#D7C6E6": "263 C",
-           "#C1A7E2": "264 C",
-           "#9063CD": "265 C",
-           "#753BBD": "266 C",
-           "#5F259F": "267 C",
-           "#582C83": "268 C",
-           "#512D6D": "269 C",
-           "#C5B4E3": "2635 C",
-           "#AD96DC": "2645 C",
-           "#9678D3": "2655 C",
-           "#7D55C7": "2665 C",
-           "#330072": "2685 C",
-           "#2E1A47": "2695 C",
-           "#B4B5DF": "270 C",
-           "#9595D2": "271 C",
-           "#7474C1": "272 C",
-           "#24135F": "273 C",
-           "#211551": "274 C",
-           "#201747": "275 C",
-           "#221C35": "276 C",
-           "#A7A4E0": "2705 C",
-           "#8B84D7": "2715 C",
-           "#685BC7": "2725 C",
-           "#2E008B": "2735 C",
-           "#280071": "2745 C",
-           "#250E62": "2755 C",
-           "#201547": "2765 C",
-           "#6E7CA0": "7667 C",
-           "#686E9F": "7668 C",
-           "#615E9B": "7669 C",
-           "#565294": "7670 C",
-           "#514689": "7671 C",
-           "#4C4184": "7672 C",
-           "#535486": "7673 C",
-           "#DDDAE8": "7443 C",
-           "#B6B8DC": "7444 C",
-           "#A7A2C3": "7445 C",
-           "#8986CA": "7446 C",
-           "#5D4777": "7447 C",
-           "#4B384C": "7448 C",
-           "#41273B": "7449 C",
-           "#878CB4": "7674 C",
-           "#7C7FAB": "7675 C",
-           "#7566A0": "7676 C",
-           "#6F5091": "7677 C",
-           "#68478D": "7678 C",
-           "#563D82": "7679 C",
-           "#523178": "7680 C",
-           "#E5E1E6": "663 C",
-           "#E0DBE3": "664 C",
-           "#C6BCD0": "665 C",
-           "#A192B2": "666 C",
-           "#7C6992": "667 C",
-           "#614B79": "668 C",
-           "#3F2A56": "669 C",
-           "#D8D7DF": "5315 C",
-           "#C6C4D2": "5305 C",
-           "#B3B0C4": "5295 C",
-           "#8D89A5": "5285 C",
-           "#595478": "5275 C",
-           "#403A60": "5265 C",
-           "#1E1A34": "5255 C",
-           "#C5CFDA": "538 C",
-           "#BBC7D6": "537 C",
-           "#A2B2C8": "536 C",
-           "#8E9FBC": "535 C",
-           "#1B365D": "534 C",
-           "#1F2A44": "533 C",
-           "#1C1F2A": "532 C",
-           "#D9E1E2": "7541 C",
-           "#A4BCC2": "7542 C",
-           "#98A4AE": "7543 C",
-           "#768692": "7544 C",
-           "#425563": "7545 C",
-           "#253746": "7546 C",
-           "#131E29": "7547 C",
-           "#B9D3DC": "552 C",
-           "#A3C7D2": "551 C",
-           "#8DB9CA": "550 C",
-           "#6BA4B8": "549 C",
-           "#003D4C": "548 C",
-           "#00313C": "547 C",
-           "#072B31": "546 C",
-           "#BFCED6": "5455 C",
-           "#B7C9D3": "5445 C",
-           "#A6BBC8": "5435 C",
-           "#7A99AC": "5425 C",
-           "#5B7F95": "5415 C",
-           "#4F758B": "5405 C",
-           "#081F2C": "5395 C",
-           "#D1DDE6": "642 C",
-           "#C6D6E3": "643 C",
-           "#9BB8D3": "644 C",
-           "#7DA1C4": "645 C",
-           "#5E8AB4": "646 C",
-           "#236192": "647 C",
-           "#002E5D": "648 C",
-           "#DBE2E9": "649 C",
-           "#CED9E5": "650 C",
-           "#A7BCD6": "651 C",
-           "#7D9BC1": "652 C",
-           "#326295": "653 C",
-           "#003A70": "654 C",
-           "#002554": "655 C",
-           "#DDE5ED": "656 C",
-           "#C8D8EB": "657 C",
-           "#B1C9E8": "658 C",
-           "#7BA4DB": "659 C",
-           "#407EC9": "660 C",
-           "#003594": "661 C",
-           "#001A70": "662 C",
-           "#BDC5DB": "7450 C",
-           "#89ABE3": "7451 C",
-           "#8094DD": "7452 C",
-           "#7BA6DE": "7453 C",
-           "#5F8FB4": "7454 C",
-           "#3A5DAE": "7455 C",
-           "#606EB2": "7456 C",
-           "#CBD3EB": "2706 C",
-           "#9FAEE5": "2716 C",
-           "#485CC7": "2726 C",
-           "#1E22AA": "2736 C",
-           "#171C8F": "2746 C",
-           "#151F6D": "2756 C",
-           "#141B4D": "2766 C",
-           "#B8CCEA": "2708 C",
-           "#5C88DA": "2718 C",
-           "#0047BB": "2728 C",
-           "#06038D": "2738 C",
-           "#001871": "2748 C",
-           "#001E62": "2758 C",
-           "#071D49": "2768 C",
-           "#C3D7EE": "2707 C",
-           "#A7C6ED": "2717 C",
-           "#307FE2": "2727 C",
-           "#001A72": "2747 C",
-           "#001E60": "2757 C",
-           "#13294B": "2767 C",
-           "#ABCAE9": "277 C",
-           "#8BB8E8": "278 C",
-           "#418FDE": "279 C",
-           "#012169": "280 C",
-           "#00205B": "281 C",
-           "#041E42": "282 C",
-           "#92C1E9": "283 C",
-           "#6CACE4": "284 C",
-           "#0072CE": "285 C",
-           "#0033A0": "286 C",
-           "#003087": "287 C",
-           "#002D72": "288 C",
-           "#0C2340": "289 C",
-           "#94A9CB": "7681 C",
-           "#6787B7": "7682 C",
-           "#426DA9": "7683 C",
-           "#385E9D": "7684 C",
-           "#2C5697": "7685 C",
-           "#1D4F91": "7686 C",
-           "#1D428A": "7687 C",
-           "#C6DAE7": "545 C",
-           "#BDD6E6": "544 C",
-           "#A4C8E1": "543 C",
-           "#7BAFD4": "542 C",
-           "#003C71": "541 C",
-           "#003057": "540 C",
-           "#00263A": "539 C",
-           "#B9D9EB": "290 C",
-           "#9BCBEB": "291 C",
-           "#69B3E7": "292 C",
-           "#003DA5": "293 C",
-           "#002F6C": "294 C",
-           "#002855": "295 C",
-           "#041C2C": "296 C",
-           "#8DC8E8": "2905 C",
-           "#62B5E5": "2915 C",
-           "#009CDE": "2925 C",
-           "#0057B8": "2935 C",
-           "#004C97": "2945 C",
-           "#003865": "2955 C",
-           "#00263E": "2965 C",
-           "#71C5E8": "297 C",
-           "#41B6E6": "298 C",
-           "#00A3E0": "299 C",
-           "#005EB8": "300 C",
-           "#004B87": "301 C",
-           "#003B5C": "302 C",
-           "#002A3A": "303 C",
-           "#4698CB": "7688 C",
-           "#298FC2": "7689 C",
-           "#0076A8": "7690 C",
-           "#006298": "7691 C",
-           "#005587": "7692 C",
-           "#004976": "7693 C",
-           "#01426A": "7694 C",
-           "#99D6EA": "2975 C",
-           "#5BC2E7": "2985 C",
-           "#00A9E0": "2995 C",
-           "#0077C8": "3005 C",
-           "#00629B": "3015 C",
-           "#004F71": "3025 C",
-           "#003E51": "3035 C",
-           "#7BA7BC": "7695 C",
-           "#6399AE": "7696 C",
-           "#4E87A0": "7697 C",
-           "#41748D": "7698 C",
-           "#34657F": "7699 C",
-           "#165C7D": "7700 C",
-           "#005776": "7701 C",
-           "#BBDDE6": "7457 C",
-           "#71B2C9": "7458 C",
-           "#4298B5": "7459 C",
-           "#0086BF": "7460 C",
-           "#007DBA": "7461 C",
-           "#00558C": "7462 C",
-           "#002B49": "7463 C",
-           "#9ADBE8": "304 C",
-           "#59CBE8": "305 C",
-           "#00B5E2": "306 C",
-           "#006BA6": "307 C",
-           "#00587C": "308 C",
-           "#003B49": "309 C",
-           "#A4DBE8": "635 C",
-           "#8BD3E6": "636 C",
-           "#4EC3E0": "637 C",
-           "#00AFD7": "638 C",
-           "#0095C8": "639 C",
-           "#0082BA": "640 C",
-           "#0067A0": "641 C",
-           "#48A9C5": "7702 C",
-           "#009CBD": "7703 C",
-           "#0085AD": "7704 C",
-           "#007096": "7705 C",
-           "#006A8E": "7706 C",
-           "#00617F": "7707 C",
-           "#005670": "7708 C",
-           "#B8DDE1": "628 C",
-           "#9BD3DD": "629 C",
-           "#77C5D5": "630 C",
-           "#3EB1C8": "631 C",
-           "#0093B2": "632 C",
-           "#007396": "633 C",
-           "#005F83": "634 C",
-           "#6AD1E3": "310 C",
-           "#05C3DE": "311 C",
-           "#00A9CE": "312 C",
-           "#0092BC": "313 C",
-           "#007FA3": "314 C",
-           "#00677F": "315 C",
-           "#004851": "316 C",
-           "#68D2DF": "3105 C",
-           "#00C1D5": "3115 C",
-           "#00AEC7": "3125 C",
-           "#008EAA": "3135 C",
-           "#00778B": "3145 C",
-           "#006272": "3155 C",
-           "#004F59": "3165 C",
-           "#63B1BC": "7709 C",
-           "#00A7B5": "7710 C",
-           "#0097A9": "7711 C",
-           "#00859B": "7712 C",
-           "#007D8A": "7713 C",
-           "#007680": "7714 C",
-           "#006269": "7715 C",
-           "#B1E4E3": "317 C",
-           "#88DBDF": "318 C",
-           "#2DCCD3": "319 C",
-           "#009CA6": "320 C",
-           "#008C95": "321 C",
-           "#007377": "322 C",
-           "#005F61": "323 C",
-           "#A0D1CA": "7464 C",
-           "#40C1AC": "7465 C",
-           "#00B0B9": "7466 C",
-           "#00A3AD": "7467 C",
-           "#007398": "7468 C",
-           "#005F86": "7469 C",
-           "#005A70": "7470 C",
-           "#7EDDD3": "7471 C",
-           "#5CB8B2": "7472 C",
-           "#279989": "7473 C",
-           "#007681": "7474 C",
-           "#487A7B": "7475 C",
-           "#0D5257": "7476 C",
-           "#244C5A": "7477 C",
-           "#B6CFD0": "5523 C",
-           "#ABC7CA": "5513 C",
-           "#94B7BB": "5503 C",
-           "#7FA9AE": "5493 C",
-           "#4F868E": "5483 C",
-           "#115E67": "5473 C",
-           "#07272D": "5463 C",
-           "#00968F": "7716 C",
-           "#00857D": "7717 C",
-           "#007672": "7718 C",
-           "#006D68": "7719 C",
-           "#00635B": "7720 C",
-           "#005E5D": "7721 C",
-           "#005151": "7722 C",
-           "#9CDBD9": "324 C",
-           "#64CCC9": "325 C",
-           "#00B2A9": "326 C",
-           "#008675": "327 C",
-           "#007367": "328 C",
-           "#00685E": "329 C",
-           "#00534C": "330 C",
-           "#71DBD4": "3242 C",
-           "#2AD2C9": "3252 C",
-           "#00BFB3": "3262 C",
-           "#00A499": "3272 C",
-           "#008578": "3282 C",
-           "#00594F": "3292 C",
-           "#004C45": "3302 C",
-           "#7CE0D3": "3245 C",
-           "#2CD5C4": "3255 C",
-           "#00C7B1": "3265 C",
-           "#00B398": "3275 C",
-           "#009681": "3285 C",
-           "#007864": "3295 C",
-           "#004E42": "3305 C",
-           "#6DCDB8": "3248 C",
-           "#49C5B1": "3258 C",
-           "#00AB8E": "3268 C",
-           "#009B77": "3278 C",
-           "#008264": "3288 C",
-           "#006A52": "3298 C",
-           "#034638": "3308 C",
-           "#B9DCD2": "566 C",
-           "#A1D6CA": "565 C",
-           "#86C8BC": "564 C",
-           "#6BBBAE": "563 C",
-           "#006F62": "562 C",
-           "#00594C": "561 C",
-           "#1D3C34": "560 C",
-           "#B5E3D8": "573 C",
-           "#A5DFD3": "572 C",
-           "#98DBCE": "571 C",
-           "#6BCABA": "570 C",
-           "#00816D": "569 C",
-           "#006C5B": "568 C",
-           "#173F35": "567 C",
-           "#ADCAB8": "559 C",
-           "#9ABEAA": "558 C",
-           "#85B09A": "557 C",
-           "#6FA287": "556 C",
-           "#28724F": "555 C",
-           "#205C40": "554 C",
-           "#284734": "553 C",
-           "#BFCEC2": "5595 C",
-           "#A7BDB1": "5585 C",
-           "#92ACA0": "5575 C",
-           "#7F9C90": "5565 C",
-           "#5C7F71": "5555 C",
-           "#43695B": "5545 C",
-           "#183028": "5535 C",
-           "#BAC5B9": "5665 C",
-           "#B0BDB0": "5655 C",
-           "#A3B2A4": "5645 C",
-           "#94A596": "5635 C",
-           "#708573": "5625 C",
-           "#5E7461": "5615 C",
-           "#22372B": "5605 C",
-           "#BCC9C5": "5527 C",
-           "#B1C0BC": "5517 C",
-           "#9DB0AC": "5507 C",
-           "#829995": "5497 C",
-           "#5D7975": "5487 C",
-           "#3E5D58": "5477 C",
-           "#18332F": "5467 C",
-           "#D1E0D7": "621 C",
-           "#B7CDC2": "622 C",
-           "#9AB9AD": "623 C",
-           "#789F90": "624 C",
-           "#507F70": "625 C",
-           "#285C4D": "626 C",
-           "#13322B": "627 C",
-           "#A7E6D7": "331 C",
-           "#8CE2D0": "332 C",
-           "#3CDBC0": "333 C",
-           "#009775": "334 C",
-           "#007B5F": "335 C",
-           "#00664F": "336 C",
-           "#8FD6BD": "337 C",
-           "#6ECEB2": "338 C",
-           "#00B388": "339 C",
-           "#00965E": "340 C",
-           "#007A53": "341 C",
-           "#006747": "342 C",
-           "#115740": "343 C",
-           "#50A684": "7723 C",
-           "#00966C": "7724 C",
-           "#008755": "7725 C",
-           "#007B4B": "7726 C",
-           "#006F44": "7727 C",
-           "#006845": "7728 C",
-           "#005844": "7729 C",
-           "#7AE1BF": "3375 C",
-           "#47D7AC": "3385 C",
-           "#00C389": "3395 C",
-           "#00AF66": "3405 C",
-           "#007749": "3415 C",
-           "#006341": "3425 C",
-           "#154734": "3435 C",
-           "#A0DAB3": "344 C",
-           "#91D6AC": "345 C",
-           "#71CC98": "346 C",
-           "#009A44": "347 C",
-           "#00843D": "348 C",
-           "#046A38": "349 C",
-           "#2C5234": "350 C",
-           "#A2E4B8": "351 C",
-           "#8FE2B0": "352 C",
-           "#80E0A7": "353 C",
-           "#00B140": "354 C",
-           "#009639": "355 C",
-           "#007A33": "356 C",
-           "#215732": "357 C",
-           "#9BE3BF": "7478 C",
-           "#26D07C": "7479 C",
-           "#00BF6F": "7480 C",
-           "#00B74F": "7481 C",
-           "#009F4D": "7482 C",
-           "#275D38": "7483 C",
-           "#00573F": "7484 C",
-           "#4B9560": "7730 C",
-           "#228848": "7731 C",
-           "#007A3E": "7732 C",
-           "#007041": "7733 C",
-           "#286140": "7734 C",
-           "#36573B": "7735 C",
-           "#395542": "7736 C",
-           "#6BA539": "7737 C",
-           "#48A23F": "7738 C",
-           "#319B42": "7739 C",
-           "#3A913F": "7740 C",
-           "#44883E": "7741 C",
-           "#4A773C": "7742 C",
-           "#44693D": "7743 C",
-           "#ADDC91": "358 C",
-           "#A1D884": "359 C",
-           "#6CC24A": "360 C",
-           "#43B02A": "361 C",
-           "#509E2F": "362 C",
-           "#4C8C2B": "363 C",
-           "#4A7729": "364 C",
-           "#D0DEBB": "7485 C",
-           "#BCE194": "7486 C",
-           "#8EDD65": "7487 C",
-           "#78D64B": "7488 C",
-           "#74AA50": "7489 C",
-           "#719949": "7490 C",
-           "#79863C": "7491 C",
-           "#C2E189": "365 C",
-           "#B7DD79": "366 C",
-           "#A4D65E": "367 C",
-           "#78BE20": "368 C",
-           "#64A70B": "369 C",
-           "#658D1B": "370 C",
-           "#546223": "371 C",
-           "#D4EB8E": "372 C",
-           "#CDEA80": "373 C",
-           "#C5E86C": "374 C",
-           "#97D700": "375 C",
-           "#84BD00": "376 C",
-           "#7A9A01": "377 C",
-           "#59621D": "378 C",
-           "#C4D6A4": "580 C",
-           "#BCD19B": "579 C",
-           "#B7CE95": "578 C",
-           "#A9C47F": "577 C",
-           "#789D4A": "576 C",
-           "#67823A": "575 C",
-           "#4E5B31": "574 C",
-           "#D0D1AB": "5807 C",
-           "#C6C89B": "5797 C",
-           "#BABD8B": "5787 C",
-           "#A2A569": "5777 C",
-           "#8A8D4A": "5767 C",
-           "#6D712E": "5757 C",
-           "#3D441E": "5747 C",
-           "#D2CE9E": "5875 C",
-           "#CBC793": "5865 C",
-           "#C0BB87": "5855 C",
-           "#AFA96E": "5845 C",
-           "#A09958": "5835 C",
-           "#89813D": "5825 C",
-           "#555025": "5815 C",
-           "#C3C6A8": "5803 C",
-           "#B3B995": "5793 C",
-           "#A3AA83": "5783 C",
-           "#899064": "5773 C",
-           "#737B4C": "5763 C",
-           "#5E6738": "5753 C",
-           "#3E4827": "5743 C",
-           "#BFCC80": "7492 C",
-           "#BBC592": "7493 C",
-           "#9CAF88": "7494 C",
-           "#8F993E": "7495 C",
-           "#76881D": "7496 C",
-           "#7A7256": "7497 C",
-           "#5B6236": "7498 C",
-           "#BABC16": "7744 C",
-           "#ABAD23": "7745 C",
-           "#999B30": "7746 C",
-           "#888D30": "7747 C",
-           "#7C8034": "7748 C",
-           "#727337": "7749 C",
-           "#656635": "7750 C",
-           "#E2E868": "379 C",
-           "#DBE442": "380 C",
-           "#CEDC00": "381 C",
-           "#C4D600": "382 C",
-           "#A8AD00": "383 C",
-           "#949300": "384 C",
-           "#787121": "385 C",
-           "#E9EC6B": "386 C",
-           "#E3E935": "387 C",
-           "#E0E721": "388 C",
-           "#D0DF00": "389 C",
-           "#B5BD00": "390 C",
-           "#9A9500": "391 C",
-           "#827A04": "392 C",
-           "#E3E48D": "587 C",
-           "#E0E27C": "586 C",
-           "#DBDE70": "585 C",
-           "#D2D755": "584 C",
-           "#B7BF10": "583 C",
-           "#8E8C13": "582 C",
-           "#625D20": "581 C",
-           "#F0EC74": "393 C",
-           "#EDE939": "394 C",
-           "#ECE81A": "395 C",
-           "#E1E000": "396 C",
-           "#BFB800": "397 C",
-           "#ADA400": "398 C",
-           "#A09200": "399 C",
-           "#F3EA5D": "3935 C",
-           "#F3E500": "3945 C",
-           "#EFDF00": "3955 C",
-           "#EEDC00": "3965 C",
-           "#BBA600": "3975 C",
-           "#9A8700": "3985 C",
-           "#685C20": "3995 C",
-           "#F1EB9C": "600 C",
-           "#F0E991": "601 C",
-           "#F0E87B": "602 C",
-           "#EDE04B": "603 C",
-           "#EADA24": "604 C",
-           "#E1CD00": "605 C",
-           "#CFB500": "606 C",
-           "#EBE49A": "607 C",
-           "#E9E186": "608 C",
-           "#E6DE77": "609 C",
-           "#E1D555": "610 C",
-           "#D7C826": "611 C",
-           "#C4B000": "612 C",
-           "#B39B00": "613 C",
-           "#E9DF97": "461 C",
-           "#E4D77E": "460 C",
-           "#DECD63": "459 C",
-           "#D9C756": "458 C",
-           "#B89D18": "457 C",
-           "#A28E2A": "456 C",
-           "#695B24": "455 C",
-           "#DCD59A": "614 C",
-           "#D6CF8D": "615 C",
-           "#D0C883": "616 C",
-           "#C0B561": "617 C",
-           "#AC9F3C": "618 C",
-           "#9F912A": "619 C",
-           "#8A7B19": "620 C",
-           "#CAB64B": "7751 C",
-           "#CFB023": "7752 C",
-           "#C1A01E": "7753 C",
-           "#A08629": "7754 C",
-           "#897630": "7755 C",
-           "#736635": "7756 C",
-           "#675E33": "7757 C",
-           "#D4C304": "7758 C",
-           "#C4B200": "7759 C",
-           "#91852C": "7760 C",
-           "#747136": "7761 C",
-           "#5D6439": "7762 C",
-           "#585C3B": "7763 C",
-           "#535435": "7764 C",
-           "#BBB323": "7765 C",
-           "#B4A91F": "7766 C",
-           "#AA9D2E": "7767 C",
-           "#8F7E35": "7768 C",
-           "#716135": "7769 C",
-           "#635939": "7770 C",
-           "#4E4934": "7771 C",
-           "#D5CB9F": "4545 C",
-           "#CFC493": "4535 C",
-           "#C5B783": "4525 C",
-           "#B3A369": "4515 C",
-           "#998542": "4505 C",
-           "#8C7732": "4495 C",
-           "#614F25": "4485 C",
-           "#CAC7A7": "454 C",
-           "#BFBB98": "453 C",
-           "#B0AA7E": "452 C",
-           "#9B945F": "451 C",
-           "#594A25": "450 C",
-           "#524727": "449 C",
-           "#4A412A": "448 C",
-           "#F1E6B2": "7499 C",
-           "#DFD1A7": "7500 C",
-           "#D9C89E": "7501 C",
-           "#CEB888": "7502 C",
-           "#A89968": "7503 C",
-           "#94795D": "7504 C",
-           "#816040": "7505 C",
-           "#DDCBA4": "468 C",
-           "#D3BC8D": "467 C",
-           "#C6AA76": "466 C",
-           "#B9975B": "465 C",
-           "#8B5B29": "464 C",
-           "#744F28": "463 C",
-           "#5C462B": "462 C",
-           "#EFDBB2": "7506 C",
-           "#FCD299": "7507 C",
-           "#E1B87F": "7508 C",
-           "#D6A461": "7509 C",
-           "#C6893F": "7510 C",
-           "#B77729": "7511 C",
-           "#A6631B": "7512 C",
-           "#EDC8A3": "719 C",
-           "#E7B78A": "720 C",
-           "#DDA46F": "721 C",
-           "#C88242": "722 C",
-           "#B36924": "723 C",
-           "#934D11": "724 C",
-           "#7D3F16": "725 C",
-           "#F3CFB3": "475 C",
-           "#F1C6A7": "474 C",
-           "#F0BF9B": "473 C",
-           "#E59E6D": "472 C",
-           "#B86125": "471 C",
-           "#A45A2A": "470 C",
-           "#693F23": "469 C",
-           "#E0C09F": "726 C",
-           "#D9B48F": "727 C",
-           "#CDA077": "728 C",
-           "#B58150": "729 C",
-           "#9E652E": "730 C",
-           "#774212": "731 C",
-           "#623412": "732 C",
-           "#E0C6AD": "4685 C",
-           "#DCBFA6": "4675 C",
-           "#CDA788": "4665 C",
-           "#BF9474": "4655 C",
-           "#AD7C59": "4645 C",
-           "#946037": "4635 C",
-           "#4F2C1D": "4625 C",
-           "#E1B7A7": "7513 C",
-           "#D5A286": "7514 C",
-           "#C58B68": "7515 C",
-           "#99552B": "7516 C",
-           "#85431E": "7517 C",
-           "#6D4F47": "7518 C",
-           "#5E4B3C": "7519 C",
-           "#D7C4B7": "4755 C",
-           "#CDB5A7": "4745 C",
-           "#C0A392": "4735 C",
-           "#AE8A79": "4725 C",
-           "#956C58": "4715 C",
-           "#7C4D3A": "4705 C",
-           "#5B3427": "4695 C",
-           "#DBC8B6": "482 C",
-           "#D3BBA8": "481 C",
-           "#C6A992": "480 C",
-           "#AA8066": "479 C",
-           "#703F2A": "478 C",
-           "#623B2A": "477 C",
-           "#4E3629": "476 C",
-           "#D6D2C4": "7527 C",
-           "#C5B9AC": "7528 C",
-           "#B7A99A": "7529 C",
-           "#A39382": "7530 C",
-           "#7A6855": "7531 C",
-           "#63513D": "7532 C",
-           "#473729": "7533 C",
-           "#D1CCBD": "7534 C",
-           "#B7B09C": "7535 C",
-           "#A69F88": "7536 C",
-           "#A7ACA2": "7537 C",
-           "#949A90": "7538 C",
-           "#8E9089": "7539 C",
-           "#4B4F54": "7540 C",
-           "#D0D3D4": "427 C",
-           "#C1C6C8": "428 C",
-           "#A2AAAD": "429 C",
-           "#7C878E": "430 C",
-           "#5B6770": "431 C",
-           "#333F48": "432 C",
-           "#1D252D": "433 C",
-           "#C7C9C7": "420 C",
-           "#B2B4B2": "421 C",
-           "#9EA2A2": "422 C",
-           "#898D8D": "423 C",
-           "#707372": "424 C",
-           "#54585A": "425 C",
-           "#25282A": "426 C",
-           "#BEC6C4": "441 C",
-           "#A2ACAB": "442 C",
-           "#919D9D": "443 C",
-           "#717C7D": "444 C",
-           "#505759": "445 C",
-           "#3F4444": "446 C",
-           "#373A36": "447 C",
-           "#BABBB1": "413 C",
-           "#A8A99E": "414 C",
-           "#919388": "415 C",
-           "#7E7F74": "416 C",
-           "#65665C": "417 C",
-           "#51534A": "418 C",
-           "#212322": "419 C",
-           "#C4BFB6": "400 C",
-           "#AFA9A0": "401 C",
-           "#9D968D": "402 C",
-           "#8C857B": "403 C",
-           "#776E64": "404 C",
-           "#696158": "405 C",
-           "#C4BCB7": "406 C",
-           "#B2A8A2": "407 C",
-           "#978C87": "408 C",
-           "#857874": "409 C",
-           "#746661": "410 C",
-           "#5E514D": "411 C",
-           "#382F2D": "412 C",
-           "#D0C4C5": "434 C",
-           "#C1B2B6": "435 C",
-           "#AB989D": "436 C",
-           "#7B6469": "437 C",
-           "#584446": "438 C",
-           "#453536": "439 C",
-           "#382E2C": "440 C",
-           "#D7D2CB": "Warm Gray 1 C",
-           "#CBC4BC": "Warm Gray 2 C",
-           "#BFB8AF": "Warm Gray 3 C",
-           "#B6ADA5": "Warm Gray 4 C",
-           "#ACA39A": "Warm Gray 5 C",
-           "#A59C94": "Warm Gray 6 C",
-           "#968C83": "Warm Gray 7 C",
-           "#8C8279": "Warm Gray 8 C",
-           "#83786F": "Warm Gray 9 C",
-           "#796E65": "Warm Gray 10 C",
-           "#6E6259": "Warm Gray 11 C",
-           "#D9D9D6": "Cool Gray 1 C",
-           "#D0D0CE": "Cool Gray 2 C",
-           "#C8C9C7": "Cool Gray 3 C",
-           "#BBBCBC": "Cool Gray 4 C",
-           "#B1B3B3": "Cool Gray 5 C",
-           "#A7A8AA": "Cool Gray 6 C",
-           "#97999B": "Cool Gray 7 C",
-           "#888B8D": "Cool Gray 8 C",
-           "#75787B": "Cool Gray 9 C",
-           "#63666A": "Cool Gray 10 C",
-           "#53565A": "Cool Gray 11 C",
-           "#332F21": "Black 2 C",
-           "#212721": "Black 3 C",
-           "#31261D": "Black 4 C",
-           "#3E2B2E": "Black 5 C",
-           "#101820": "Black 6 C",
-           "#3D3935": "Black 7 C"}
-
-
-def closest_colour(requested_colour, dictionary='names'):
+pantone = ColourDictionary(os.path.join(dictionaries_path, 'pantone.bin'))
+
+
+class KDTree(object):
     """
-    Credits go to fraxel: https://stackoverflow.com/a/9694246/4040598
-    :param requested_colour: #rrggbb string
-    :param dictionary: names od pantone
-    :return: The closest colour name as a string
+    Static 3-d tree over a list of (r, g, b) tuples; built once, queried many times
+    """
+    def __init__(self, points):
+        self.points = points
+        self.root = self._build(list(range(len(points))), 0)
+
+    def _build(self, indices, axis):
+        if not indices:
+            return None
+        indices.sort(key=lambda i: self.points[i][axis])
+        mid = len(indices) // 2
+        next_axis = (axis + 1) % 3
+        return indices[mid], axis, self._build(indices[:mid], next_axis), self._build(indices[mid + 1:], next_axis)
+
+    def nearest(self, point):
+        """
+        :param point: (r, g, b) tuple
+        :return: (index, squared distance) of the nearest point; on ties the highest index wins,
+        as it used to in the linear scan
+        """
+        best = [-1, float('inf')]
+        self._search(self.root, point, best)
+        return best[0], best[1]
+
+    def _search(self, node, point, best):
+        if node is None:
+            return
+        index, axis, lower, higher = node
+        r, g, b = self.points[index]
+        dist = (r - point[0]) ** 2 + (g - point[1]) ** 2 + (b - point[2]) ** 2
+        if dist < best[1] or (dist == best[1] and index > best[0]):
+            best[0], best[1] = index, dist
+
+        diff = point[axis] - self.points[index][axis]
+        near, far = (lower, higher) if diff < 0 else (higher, lower)
+        self._search(near, point, best)
+        # equal distances must be visited too, to keep the tie-breaking rule
+        if diff * diff <= best[1]:
+            self._search(far, point, best)
+
+    def nearest_k(self, point, k):
+        """
+        :param point: (r, g, b) tuple
+        :param k: number of points to find
+        :return: [(index, squared distance)], nearest first; on ties the higher index comes first
+        """
+        # max-heap of the k best so far: the root is the worst, i.e. the farthest, lowest index on ties
+        heap = []
+        self._search_k(self.root, point, k, heap)
+        return [(index, -dist) for dist, index in sorted(heap, reverse=True)]
+
+    def _search_k(self, node, point, k, heap):
+        if node is None:
+            return
+        index, axis, lower, higher = node
+        r, g, b = self.points[index]
+        dist = (r - point[0]) ** 2 + (g - point[1]) ** 2 + (b - point[2]) ** 2
+        if len(heap) < k:
+            heapq.heappush(heap, (-dist, index))
+        elif (-dist, index) > heap[0]:
+            heapq.heapreplace(heap, (-dist, index))
+
+        diff = point[axis] - self.points[index][axis]
+        near, far = (lower, higher) if diff < 0 else (higher, lower)
+        self._search_k(near, point, k, heap)
+        if len(heap) < k or diff * diff <= -heap[0][0]:
+            self._search_k(far, point, k, heap)
+
+
+def cache_dir():
+    """
+    :return: $XDG_CACHE_HOME/azote-palettes (~/.cache/azote-palettes by default)
+    """
+    base = os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'azote-palettes')
+
+
+class LookupTable(object):
+    """
+    Memory-mapped table of 2 ** 24 uint16 cells: the nearest entry index for every 0xRRGGBB value.
+    The pages are shared between all processes which open the same file.
+    """
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.map) != 2 ** 24 * 2:
+            self.map.close()
+            raise ValueError('{}: unexpected lookup table size'.format(path))
+        self.cells = memoryview(self.map).cast('H')
+
+    def __getitem__(self, rgb):
+        return self.cells[(rgb[0] << 16) | (rgb[1] << 8) | rgb[2]]
+
+
+def trigrams(string):
+    return {string[i:i + 3] for i in range(len(string) - 2)}
+
+
+class NameSearch(object):
+    """
+    Prefix (sorted names + bisect) and trigram index over the names of a dictionary
     """
-    d = names if dictionary == 'names' else pantone
+    def __init__(self, names):
+        self.names = [name.lower() for name in names]
+        self.sorted = sorted((name, i) for i, name in enumerate(self.names))
+        # all words but the first, which the names prefix search covers already
+        self.words = sorted((word, i) for i, name in enumerate(self.names) for word in name.split()[1:])
+        self.trigrams = {}
+        for i, name in enumerate(self.names):
+            for trigram in trigrams(name):
+                self.trigrams.setdefault(trigram, []).append(i)
+
+    @staticmethod
+    def prefixed(items, query):
+        start = bisect.bisect_left(items, (query,))
+        for string, i in items[start:]:
+            if not string.startswith(query):
+                break
+            yield string, i
+
+    def find(self, query, limit=20):
+        """
+        :param query: any part of a name, case insensitive; may contain typos if 3 characters or longer
+        :return: [(rank, similarity, index)] sorted best first. Ranks: 0 the whole name, 1 name prefix,
+        2 word prefix, 3 substring, 4 similar (at least half of the query trigrams found in the name)
+        """
+        query = ' '.join(query.lower().split())
+        if not query:
+            return []
+
+        found = {}
+        for name, i in self.prefixed(self.sorted, query):
+            found[i] = (0 if name == query else 1, 1.0)
+        for word, i in self.prefixed(self.words, query):
+            found.setdefault(i, (2, 1.0))
+
+        wanted = trigrams(query)
+        counts = {}
+        for trigram in wanted:
+            for i in self.trigrams.get(trigram, ()):
+                counts[i] = counts.get(i, 0) + 1
+        for i, count in counts.items():
+            if i in found:
+                continue
+            if count == len(wanted) and query in self.names[i]:
+                found[i] = (3, 1.0)
+            elif count * 2 >= len(wanted):
+                found[i] = (4, count / len(wanted))
+
+        ranked = sorted(found.items(), key=lambda item: (item[1][0], -item[1][1], len(self.names[item[0]]),
+                                                         self.names[item[0]]))
+        return [(rank, similarity, i) for i, (rank, similarity) in ranked[:limit]]
+
+
+class ColourIndex(object):
+    """
+    Parsed dictionary: parallel lists of hex keys, names and rgb tuples, plus the spatial index
+    """
+    def __init__(self, d, dictionary):
+        self.dictionary = dictionary
+        if isinstance(d, ColourDictionary):
+            self.keys = d.key_list()
+            self.names = d.name_list()
+        else:
+            self.keys = list(d.keys())
+            self.names = list(d.values())
+        self.rgb = [hex_to_rgb(key) for key in self.keys]
+        # exact matches: {0xRRGGBB: index}, whatever the case or spelling of the keys
+        self.colours = [(r << 16) | (g << 8) | b for r, g, b in self.rgb]
+        self.exact = {}
+        for i, colour in enumerate(self.colours):
+            self.exact.setdefault(colour, i)
+        # reverse lookup: {lower case name: index}
+        self.by_name = {}
+        for i, name in enumerate(self.names):
+            self.by_name.setdefault(name.lower(), i)
+        self.search = None
+        self.tree = KDTree(self.rgb)
+        self.array = np.array(self.rgb, dtype=np.int32) if np is not None else None
+        self.lab = None
+        self.lab_array = None
+        self.lab_tree = None
+        # the checksum identifies the dictionary content in cache files
+        self.checksum = zlib.crc32('\n'.join(self.keys + self.names).encode('utf-8'))
+        self.table = None
+        if os.path.isfile(self.table_path()):
+            try:
+                self.table = LookupTable(self.table_path())
+            except (OSError, ValueError) as e:
+                # stderr: stdout may carry data, e.g. azote-palettes name
+                print(e, file=sys.stderr)
+
+    def table_path(self):
+        # dictionaries of palette files are registered under any name, e.g. their path: no separators here,
+        # the file must stay in the cache directory
+        name = re.sub(r'[^A-Za-z0-9_.-]+', '_', self.dictionary)
+        return os.path.join(cache_dir(), '{}-{:08x}.lut'.format(name, self.checksum))
+
+    def find(self, query, limit=20):
+        """
+        See NameSearch.find; the search index is built on first use
+        """
+        if self.search is None:
+            self.search = NameSearch(self.names)
+        return self.search.find(query, limit)
+
+    def load_lab(self):
+        """
+        Converts the dictionary to CIELAB once, so that perceptual lookups only convert the requested colour
+        """
+        if self.lab is None:
+            lab_array = rgb_to_lab_array(self.array) if np is not None else None
+            lab = [tuple(lab) for lab in lab_array.tolist()] if np is not None else \
+                [rgb_to_lab(*rgb) for rgb in self.rgb]
+            # delta E 1976 is the euclidean distance in Lab, so it may use a k-d tree as well
+            self.lab_array, self.lab_tree = lab_array, KDTree(lab)
+            # set last: other threads take the Lab data as ready as soon as self.lab is set
+            self.lab = lab
+
+    def nearest(self, rgb, metric='rgb'):
+        """
+        :param rgb: (r, g, b) tuple
+        :param metric: one of METRICS
+        :return: index of the nearest entry
+        """
+        if metric == 'rgb':
+            if self.table is not None:
+                return self.table[rgb]
+            return self.tree.nearest(rgb)[0]
+
+        check_metric(metric)
+        self.load_lab()
+        lab = rgb_to_lab(*rgb)
+        if metric == 'de76':
+            return self.lab_tree.nearest(lab)[0]
+        delta_e, delta_e_array = DELTA_E[metric]
+        if np is not None:
+            # reversed, so that argmin (first minimum) picks the highest index on ties
+            return len(self.lab) - 1 - int(delta_e_array(np.array(lab), self.lab_array[::-1]).argmin())
+        return min(range(len(self.lab)), key=lambda i: (delta_e(lab, self.lab[i]), -i))
 
-    requested_colour = hex_to_rgb(requested_colour)
-    min_colours = {}
-    for key, name in d.items():
-        r_c, g_c, b_c = hex_to_rgb(key)
-        rd = (r_c - requested_colour[0]) ** 2
-        gd = (g_c - requested_colour[1]) ** 2
-        bd = (b_c - requested_colour[2]) ** 2
-        min_colours[(rd + gd + bd)] = name
+    def nearest_k(self, rgb, k, metric='rgb'):
+        """
+        :param rgb: (r, g, b) tuple
+        :param k: number of entries
+        :param metric: one of METRICS
+        :return: [(index, distance)], nearest first, in the metric units (euclidean distance for rgb)
+        """
+        k = min(k, len(self.keys))
+        if k <= 0:
+            return []
+        if metric != 'rgb':
+            check_metric(metric)
+            self.load_lab()
+            lab = rgb_to_lab(*rgb)
 
-    c_name = min_colours[min(min_colours.keys())]
-    hex_value = None
-    for key, name in d.items():
-        if name == c_name:
-            hex_value = '({})'.format(key)
-            break
+        if np is not None:
+            # one pass over the whole dictionary, then a partial sort
+            if metric == 'rgb':
+                dist = np.sqrt(((self.array - np.array(rgb)) ** 2).sum(axis=1))
+            else:
+                dist = DELTA_E[metric][1](np.array(lab), self.lab_array)
+            threshold = np.partition(dist, k - 1)[k - 1]
+            candidates = np.nonzero(dist <= threshold)[0]
+            # nearest first, the higher index first on ties
+            order = np.lexsort((-candidates, dist[candidates]))[:k]
+            return [(int(i), float(dist[i])) for i in candidates[order]]
 
-    return '<span weight="bold">{}</span> {}'.format(c_name, hex_value)
+        if metric == 'rgb':
+            return [(i, math.sqrt(dist)) for i, dist in self.tree.nearest_k(rgb, k)]
+        if metric == 'de76':
+            return [(i, math.sqrt(dist)) for i, dist in self.lab_tree.nearest_k(lab, k)]
+        delta_e = DELTA_E[metric][0]
+        found = heapq.nsmallest(k, ((delta_e(lab, point), -i) for i, point in enumerate(self.lab)))
+        return [(-i, dist) for dist, i in found]
 
+    def nearest_many(self, rgb, metric='rgb', chunk=1024):
+        """
+        Vectorised nearest(), requires numpy
+        :param rgb: (n, 3) integer array
+        :param metric: one of METRICS
+        :param chunk: number of colours compared to the whole dictionary at once
+        :return: (n,) array of entry indices
+        """
+        rgb = np.asarray(rgb, dtype=np.int32).reshape(-1, 3)
+        if metric == 'rgb':
+            if self.table is not None:
+                cells = np.frombuffer(self.table.map, dtype=np.uint16)
+                return cells[(rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]].astype(np.intp)
+            # |c - p|^2 = |c|^2 - 2 c.p + |p|^2, and |c|^2 does not change the argmin; a matrix product instead
+            # of the (chunk, entries, 3) difference array; all the values are integers, exact in float64
+            points = self.array[::-1].astype(np.float64)
+            colours = rgb.astype(np.float64)
+            norms = (points ** 2).sum(axis=1)
+            distance = lambda c, p: norms - 2 * (c[:, 0, :] @ p[0].T)
+        else:
+            check_metric(metric)
+            self.load_lab()
+            points = self.lab_array[::-1]
+            colours = rgb_to_lab_array(rgb)
+            distance = DELTA_E[metric][1]
 
-def get_colour_name(requested_colour, dictionary='names'):
-    d = names if dictionary == 'names' else pantone
+        # points are reversed, so that argmin (first minimum) picks the highest index on ties
+        result = np.empty(len(rgb), dtype=np.intp)
+        for start in range(0, len(rgb), chunk):
+            dist = distance(colours[start:start + chunk, None, :], points[None, :, :])
+            result[start:start + chunk] = len(points) - 1 - dist.argmin(axis=1)
+        return result
+
+    def build_table(self, block=16):
+        """
+        Computes the nearest entry for all 2 ** 24 colours and saves the table to the cache directory.
+        The RGB cube is processed in block ** 3 cells; for each block only the entries which may be
+        the nearest one to any of its cells are compared. Takes several seconds, requires numpy.
+        :return: path to the table file
+        """
+        if np is None:
+            raise RuntimeError('numpy is required to build lookup tables')
+        if len(self.keys) > 0xffff:
+            raise ValueError('{}: too many entries for a uint16 table'.format(self.dictionary))
+
+        # reversed, so that argmin (first minimum) picks the highest index on ties
+        order = np.arange(len(self.keys))[::-1]
+        points = np.array(self.rgb, dtype=np.int32)[order]
+        lo = np.arange(0, 256, block)
+        hi = lo + block - 1
+        # per-axis lower and upper bounds of the squared distance from each block to each entry
+        lower, upper = [], []
+        for axis in range(3):
+            v = points[:, axis][None, :]
+            near = np.maximum(np.maximum(lo[:, None] - v, v - hi[:, None]), 0)
+            far = np.maximum(np.abs(v - lo[:, None]), np.abs(v - hi[:, None]))
+            lower.append(near ** 2)
+            upper.append(far ** 2)
+
+        table = np.empty((256, 256, 256), dtype=np.uint16)
+        cell = np.arange(block)
+        for bx in range(len(lo)):
+            for by in range(len(lo)):
+                low_xy = lower[0][bx] + lower[1][by]
+                up_xy = upper[0][bx] + upper[1][by]
+                for bz in range(len(lo)):
+                    bound = (up_xy + upper[2][bz]).min()
+                    candidates = np.nonzero(low_xy + lower[2][bz] <= bound)[0]
+                    c = points[candidates]
+                    dist = ((lo[bx] + cell)[:, None, None, None] - c[:, 0]) ** 2 + \
+                           ((lo[by] + cell)[None, :, None, None] - c[:, 1]) ** 2 + \
+                           ((lo[bz] + cell)[None, None, :, None] - c[:, 2]) ** 2
+                    table[lo[bx]:hi[bx] + 1, lo[by]:hi[by] + 1, lo[bz]:hi[bz] + 1] = \
+                        order[candidates[dist.argmin(axis=3)]]
+
+        path = self.table_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = '{}.{}.tmp'.format(path, os.getpid())
+        table.tofile(tmp)
+        os.replace(tmp, path)
+        self.table = LookupTable(path)
+
+        return path
+
+
+# Dictionaries by name. Values are mappings which load their data on first access (see ColourDictionary),
+# so registering costs nothing; the index is only built on the first lookup or by preload_dictionaries().
+registry = {'names': names, 'pantone': pantone}
+indexes = {}
+indexes_lock = threading.Lock()
+
+
+def register_dictionary(name, d):
+    """
+    :param name: dictionary name, as used by get_colour_name and friends
+    :param d: {'#rrggbb': name} mapping, preferably a lazy ColourDictionary
+    """
+    with indexes_lock:
+        registry[name] = d
+        indexes.pop(name, None)
+    name_cache.clear()
+
+
+def get_dictionary(dictionary='names'):
     try:
-        closest_name = actual_name = d[requested_colour]
+        return registry[dictionary]
     except KeyError:
-        closest_name = closest_colour(requested_colour, dictionary)
-        actual_name = None
+        raise ValueError('Unknown dictionary: {}, use one of: {}'.format(dictionary, ', '.join(registry)))
+
+
+def get_index(dictionary='names'):
+    """
+    :param dictionary: registered dictionary name
+    :return: ColourIndex, built on first use
+    """
+    try:
+        return indexes[dictionary]
+    except KeyError:
+        d = get_dictionary(dictionary)
+        with indexes_lock:
+            if dictionary not in indexes:
+                indexes[dictionary] = ColourIndex(d, dictionary)
+            return indexes[dictionary]
+
+
+def preload_dictionaries(dictionaries=None):
+    """
+    Builds indexes in advance, one dictionary per step, e.g. from GLib.idle_add(next, generator)
+    :param dictionaries: names to load, all registered if None
+    :return: generator, yields True after each dictionary
+    """
+    for dictionary in list(dictionaries or registry):
+        get_index(dictionary)
+        yield True
+
+
+def build_lookup_table(dictionary='names'):
+    """
+    Precomputes the 24-bit nearest colour table, see ColourIndex.build_table
+    :param dictionary: registered dictionary name
+    :return: path to the table file
+    """
+    return get_index(dictionary).build_table()
+
+
+class NameCache(object):
+    """
+    Bounded LRU cache of nearest entry indices, keyed by (0xRRGGBB, dictionary, metric)
+    """
+    def __init__(self, maxsize=65536):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self.lock:
+            try:
+                value = self.data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self.data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self.lock:
+            if self.maxsize <= 0:
+                return
+            self.data[key] = value
+            self.data.move_to_end(key)
+            self.trim()
+
+    def trim(self):
+        while len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+            self.evictions += 1
+
+    def resize(self, maxsize):
+        with self.lock:
+            self.maxsize = maxsize
+            self.trim()
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        with self.lock:
+            return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                    'size': len(self.data), 'maxsize': self.maxsize}
+
+    def save(self, path):
+        """
+        Entries are stored with the checksum of their dictionary, so that they are only reused for the same content
+        """
+        with self.lock:
+            items = list(self.data.items())
+        dictionaries = {}
+        for (colour, dictionary, metric), i in items:
+            if dictionary not in dictionaries:
+                dictionaries[dictionary] = {'checksum': indexes[dictionary].checksum, 'entries': []}
+            dictionaries[dictionary]['entries'].append([colour, metric, i])
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = '{}.{}.tmp'.format(path, os.getpid())
+        with open(tmp, 'w') as f:
+            json.dump({'dictionaries': dictionaries}, f)
+        os.replace(tmp, path)
+
+    def load(self, path):
+        with open(path, 'r') as f:
+            dictionaries = json.load(f)['dictionaries']
+        for dictionary, saved in dictionaries.items():
+            if dictionary in registry and get_index(dictionary).checksum == saved['checksum']:
+                for colour, metric, i in saved['entries']:
+                    self.put((colour, dictionary, metric), i)
+
+
+name_cache = NameCache()
+
+
+def name_cache_path():
+    return os.path.join(cache_dir(), 'name-cache.json')
+
+
+def name_cache_info():
+    """
+    :return: {'hits', 'misses', 'evictions', 'size', 'maxsize'} of the colour naming cache
+    """
+    return name_cache.info()
+
+
+def set_name_cache_size(maxsize):
+    """
+    :param maxsize: max number of cached lookups; 0 disables the cache
+    """
+    name_cache.resize(maxsize)
+
+
+def clear_name_cache():
+    name_cache.clear()
+
+
+def save_name_cache(path=None):
+    """
+    :param path: defaults to cache_dir()/name-cache.json
+    """
+    name_cache.save(path or name_cache_path())
+
+
+def load_name_cache(path=None):
+    """
+    Restores entries saved by save_name_cache, skipping dictionaries which have changed since
+    :param path: defaults to cache_dir()/name-cache.json
+    :return: True if the file has been loaded
+    """
+    try:
+        name_cache.load(path or name_cache_path())
+        return True
+    except (OSError, ValueError, KeyError) as e:
+        print(e, file=sys.stderr)
+        return False
+
+
+def nearest_index(rgb, dictionary='names', metric='rgb'):
+    """
+    :param rgb: (r, g, b) tuple
+    :return: index of the nearest entry in get_index(dictionary), from the cache if possible
+    """
+    key = ((rgb[0] << 16) | (rgb[1] << 8) | rgb[2], dictionary, metric)
+    i = name_cache.get(key)
+    if i is None:
+        i = get_index(dictionary).nearest(rgb, metric)
+        name_cache.put(key, i)
+    return i
+
+
+def check_metric(metric):
+    if metric not in METRICS:
+        raise ValueError('Unknown metric: {}, use one of: {}'.format(metric, ', '.join(METRICS)))
+
+
+def closest_colour(requested_colour, dictionary='names', metric='rgb'):
+    """
+    Credits go to fraxel: https://stackoverflow.com/a/9694246/4040598
+    :param requested_colour: #rrggbb string, or anything else parse_colour accepts
+    :param dictionary: registered dictionary name
+    :param metric: rgb (euclidean), de76, de94 or de2000 (CIELAB delta E)
+    :return: The closest colour name as a string
+    """
+    index = get_index(dictionary)
+    i = nearest_index(parse_colour(requested_colour), dictionary, metric)
+
+    return format_colour_name(index.names[i], index.keys[i])
+
+
+def closest_colours(requested_colour, k=5, dictionary='names', metric='rgb'):
+    """
+    :param requested_colour: anything parse_colour accepts
+    :param k: number of candidates
+    :param dictionary: registered dictionary name
+    :param metric: one of METRICS
+    :return: [(name, hex value, distance)], nearest first; distance in the metric units
+    """
+    index = get_index(dictionary)
+    return [(index.names[i], index.keys[i], dist)
+            for i, dist in index.nearest_k(parse_colour(requested_colour), k, metric)]
+
+
+def format_colour_name(name, hex_value):
+    return '<span weight="bold">{}</span> ({})'.format(name, hex_value)
+
+
+def exact_colour_name(colour, dictionary='names'):
+    """
+    :param colour: anything parse_colour accepts
+    :param dictionary: registered dictionary name
+    :return: name of the entry of exactly this colour, or None
+    """
+    r, g, b = parse_colour(colour)
+    index = get_index(dictionary)
+    i = index.exact.get((r << 16) | (g << 8) | b)
+    return index.names[i] if i is not None else None
+
+
+def colour_by_name(name, dictionary='names'):
+    """
+    :param name: colour name, case insensitive
+    :param dictionary: registered dictionary name
+    :return: hex value as in the dictionary, or None
+    """
+    index = get_index(dictionary)
+    i = index.by_name.get(name.lower())
+    return index.keys[i] if i is not None else None
+
+
+def find_colours(query, dictionaries=None, limit=20):
+    """
+    Search colours by name, e.g. for search-as-you-type
+    :param query: any part of a name or Pantone code, case insensitive, typos tolerated
+    :param dictionaries: registered dictionary names, all if None
+    :param limit: max number of results
+    :return: [(dictionary, name, hex value)], best matches first
+    """
+    found = []
+    for dictionary in list(dictionaries or registry):
+        index = get_index(dictionary)
+        for rank, similarity, i in index.find(query, limit):
+            found.append(((rank, -similarity, len(index.names[i])), (dictionary, index.names[i], index.keys[i])))
+    found.sort(key=lambda item: item[0])
+
+    return [result for key, result in found[:limit]]
+
+
+def get_colour_name(requested_colour, dictionary='names', metric='rgb'):
+    closest_name = actual_name = exact_colour_name(requested_colour, dictionary)
+    if actual_name is None:
+        closest_name = closest_colour(requested_colour, dictionary, metric)
 
     return actual_name, closest_name
+
+
+def colours_to_array(colours):
+    """
+    :param colours: sequence of anything parse_colour accepts, or an (n, 3) array
+    :return: (n, 3) int32 array, a row per colour
+    :raises: ValueError if any is not a colour
+    """
+    if isinstance(colours, np.ndarray):
+        return colours.astype(np.int32).reshape(-1, 3)
+    colours = list(colours)
+    if all(isinstance(colour, str) and len(colour) == 7 and colour[0] == '#' for colour in colours):
+        # fast path for the common '#rrggbb' spelling
+        try:
+            data = bytes.fromhex(''.join(colour[1:] for colour in colours))
+        except ValueError:
+            data = b''
+        if len(data) == 3 * len(colours):
+            return np.frombuffer(data, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+    return np.array([parse_colour(colour) for colour in colours], dtype=np.int32).reshape(-1, 3)
+
+
+def get_colour_names(colours, dictionaries=('names', 'pantone'), metric='rgb', cache=True):
+    """
+    Batch version of get_colour_name: all colours are matched against each dictionary in one vectorised pass
+    :param colours: sequence of #rrggbb strings, (r, g, b) tuples or anything else parse_colour accepts,
+    or an (n, 3) array
+    :param dictionaries: registered dictionary names
+    :param metric: one of METRICS
+    :param cache: use name_cache; False for streams of mostly unique colours, where it is pure overhead
+    :return: {dictionary: [(exact name or None, nearest name, nearest hex), ...]}, in the input order
+    """
+    result = {}
+    if np is None:
+        rgb = [parse_colour(c) for c in colours]
+        for dictionary in dictionaries:
+            index = get_index(dictionary)
+            found = result[dictionary] = []
+            for colour in rgb:
+                i = nearest_index(colour, dictionary, metric)
+                found.append((index.names[i] if index.rgb[i] == colour else None, index.names[i], index.keys[i]))
+        return result
+
+    rgb = colours_to_array(colours)
+    for dictionary in dictionaries:
+        index = get_index(dictionary)
+        if cache:
+            # cached colours are served from name_cache, only the rest goes to the vectorised search
+            keys = [(colour, dictionary, metric)
+                    for colour in ((rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]).tolist()]
+            nearest = [name_cache.get(key) for key in keys]
+            missing = [n for n, i in enumerate(nearest) if i is None]
+            if missing:
+                for n, i in zip(missing, index.nearest_many(rgb[missing], metric).tolist()):
+                    nearest[n] = i
+                    name_cache.put(keys[n], i)
+            nearest = np.array(nearest, dtype=np.intp)
+        else:
+            nearest = index.nearest_many(rgb, metric)
+        exact = (index.array[nearest] == rgb).all(axis=1)
+        result[dictionary] = [(index.names[i] if e else None, index.names[i], index.keys[i])
+                              for i, e in zip(nearest.tolist(), exact.tolist())]
+    return result
+
+
+if __name__ == "__main__":
+    for dictionary in ('names', 'pantone'):
+        print(build_lookup_table(dictionary))
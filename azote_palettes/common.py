@@ -10,3 +10,4 @@ last_folder = ''
 
 rc = None
 preview = None
+palette_cache = None
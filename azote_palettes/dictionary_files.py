@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# _*_ coding: utf-8 _*_
+"""
+External colour dictionaries: GIMP .gpl, .csv, .json and Adobe .ase palettes.
+Each file is compiled on first use into the binary ColourDictionary format and cached
+in cache_dir()/dictionaries, under the hash of the source file.
+"""
+import os
+import csv
+import json
+import struct
+import hashlib
+
+from azote_palettes.color_tools import ColourDictionary, register_dictionary, write_dictionary, cache_dir, \
+    lab_to_rgb, parse_colour, RGB_SCALE
+
+
+def parse_hex(string, bare=True):
+    """
+    :param string: '#rrggbb', '#rgb', '0xrrggbb' or, if bare, 'rrggbb'; a bare 'rgb' could be a name, e.g. 'Bad'
+    :return: (r, g, b) tuple or None
+    """
+    string = string.strip()
+    if not (string.startswith('#') or string.lower().startswith('0x') or (bare and len(string) == 6)):
+        return None
+    try:
+        return parse_colour(string)
+    except ValueError:
+        return None
+
+
+def pick_bare_hex(strings):
+    """
+    Of strings which might be bare 'rrggbb' values, picks the colour: names of hex letters only, e.g. 'Facade',
+    lose to values with digits
+    :return: index in strings, or None if none or ambiguous
+    """
+    found = [i for i, string in enumerate(strings) if isinstance(string, str) and parse_hex(string)]
+    if len(found) > 1:
+        found = [i for i in found if not strings[i].strip().isalpha()]
+    return found[0] if len(found) == 1 else None
+
+
+def parse_rgb(values):
+    """
+    :param values: sequence of 3 numbers or numeric strings, 0-255
+    :return: (r, g, b) tuple or None
+    """
+    try:
+        rgb = tuple(int(round(float(v))) for v in values)
+    except (TypeError, ValueError):
+        return None
+    if len(rgb) != 3 or not all(0 <= v <= 255 for v in rgb):
+        return None
+    return rgb
+
+
+def read_gpl(path):
+    """
+    :return: list of ((r, g, b), name)
+    """
+    entries = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#') or line.startswith('GIMP Palette') or \
+                    line.startswith('Name:') or line.startswith('Columns:'):
+                continue
+            parts = line.split(None, 3)
+            rgb = parse_rgb(parts[:3])
+            if rgb:
+                entries.append((rgb, parts[3].strip() if len(parts) > 3 else ''))
+    return entries
+
+
+def row_colour(cells):
+    """
+    The colour of a csv row: a '#' or '0x' prefixed hex value, else r, g, b columns, else a bare hex value
+    if there is only one, see pick_bare_hex
+    :return: (r, g, b) tuple and the indices of the colour cells, or (None, ())
+    """
+    for i, cell in enumerate(cells):
+        rgb = parse_hex(cell, bare=False)
+        if rgb:
+            return rgb, (i,)
+    for i in range(len(cells) - 2):
+        rgb = parse_rgb(cells[i:i + 3])
+        if rgb:
+            return rgb, (i, i + 1, i + 2)
+    i = pick_bare_hex(cells)
+    if i is not None:
+        return parse_hex(cells[i]), (i,)
+    return None, ()
+
+
+def read_csv(path):
+    """
+    Rows of a name and either a hex value or r, g, b columns, in any order; other rows (headers) are skipped
+    :return: list of ((r, g, b), name)
+    """
+    entries = []
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.reader(f):
+            cells = [cell.strip() for cell in row]
+            rgb, used = row_colour(cells)
+            if rgb:
+                name = next((cell for i, cell in enumerate(cells) if i not in used and cell), '')
+                entries.append((rgb, name))
+    return entries
+
+
+def json_colour(value, bare=True):
+    if isinstance(value, str):
+        return parse_hex(value, bare)
+    if isinstance(value, (list, tuple)):
+        return parse_rgb(value)
+    if isinstance(value, dict):
+        return parse_rgb([value.get(c) for c in ('r', 'g', 'b')])
+    return None
+
+
+def pair_colour(first, second):
+    """
+    :param first: name or colour
+    :param second: colour or name
+    :return: ((r, g, b), name) or None; prefixed hex values and rgb lists win over bare hex values
+    """
+    for colour, name in ((first, second), (second, first)):
+        if not isinstance(name, (list, tuple, dict)) and json_colour(colour, bare=False):
+            return json_colour(colour, bare=False), str(name)
+    i = pick_bare_hex([first, second])
+    if i is not None:
+        return parse_hex((first, second)[i]), str((second, first)[i])
+    return None
+
+
+def read_json(path):
+    """
+    Accepts {"#rrggbb": name}, {name: "#rrggbb"}, [[name, colour], ...] or [{"name": ..., "hex": ...}, ...];
+    colours may also be [r, g, b] lists or {"r": .., "g": .., "b": ..} objects
+    :return: list of ((r, g, b), name)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    entries = []
+    if isinstance(data, dict):
+        for key, value in data.items():
+            found = pair_colour(key, value)
+            if found:
+                entries.append(found)
+    elif isinstance(data, list):
+        for item in data:
+            if isinstance(item, dict):
+                name = item.get('name') or item.get('title') or ''
+                for key in ('hex', 'color', 'colour', 'value', 'rgb'):
+                    if key in item and json_colour(item[key]):
+                        entries.append((json_colour(item[key]), name))
+                        break
+            elif isinstance(item, (list, tuple)) and len(item) == 2:
+                found = pair_colour(item[0], item[1])
+                if found:
+                    entries.append(found)
+    return entries
+
+
+def read_ase(path):
+    """
+    Adobe Swatch Exchange; RGB, CMYK, LAB and Gray swatches are converted to rgb
+    :return: list of ((r, g, b), name)
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:4] != b'ASEF':
+        raise ValueError('{}: not an ASE file'.format(path))
+
+    entries = []
+    count, = struct.unpack_from('>I', data, 8)
+    offset = 12
+    for i in range(count):
+        block_type, length = struct.unpack_from('>HI', data, offset)
+        offset += 6
+        if block_type == 0x0001:
+            name_length, = struct.unpack_from('>H', data, offset)
+            name = data[offset + 2:offset + 2 + name_length * 2].decode('utf-16-be').rstrip('\0')
+            position = offset + 2 + name_length * 2
+            model = data[position:position + 4].decode('ascii').strip()
+            position += 4
+            if model == 'RGB':
+                values = struct.unpack_from('>3f', data, position)
+                rgb = tuple(v * RGB_SCALE for v in values)
+            elif model == 'CMYK':
+                c, m, y, k = struct.unpack_from('>4f', data, position)
+                rgb = tuple(RGB_SCALE * (1 - v) * (1 - k) for v in (c, m, y))
+            elif model == 'LAB':
+                l, a, b = struct.unpack_from('>3f', data, position)
+                rgb = lab_to_rgb(l * 100, a, b)
+            elif model == 'Gray':
+                rgb = (struct.unpack_from('>f', data, position)[0] * RGB_SCALE,) * 3
+            else:
+                rgb = None
+            if rgb:
+                entries.append((tuple(min(max(int(round(v)), 0), 255) for v in rgb), name))
+        offset += length
+    return entries
+
+
+readers = {'.gpl': read_gpl, '.csv': read_csv, '.json': read_json, '.ase': read_ase}
+
+
+def compile_dictionary(source):
+    """
+    :param source: palette file path
+    :return: path to the compiled dictionary; reused as long as the source content does not change
+    """
+    reader = readers.get(os.path.splitext(source)[1].lower())
+    if reader is None:
+        raise ValueError('{}: unsupported palette file, use one of: {}'.format(source, ', '.join(readers)))
+
+    with open(source, 'rb') as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+    path = os.path.join(cache_dir(), 'dictionaries', '{}.bin'.format(digest))
+    if not os.path.isfile(path):
+        try:
+            entries = reader(source)
+        except struct.error:
+            raise ValueError('{}: truncated palette file'.format(source))
+        d = {}
+        for rgb, name in entries:
+            # the first name of a repeated colour wins
+            d.setdefault('#%02x%02x%02x' % rgb, name or '#%02x%02x%02x' % rgb)
+        if not d:
+            raise ValueError('{}: no colours found'.format(source))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_dictionary(path, d)
+    return path
+
+
+class CompiledDictionary(ColourDictionary):
+    """
+    ColourDictionary of a palette file, compiled (or found in the cache) on first access
+    """
+    def __init__(self, source):
+        super().__init__(None)
+        self.source = source
+
+    def load(self):
+        if self.map is None:
+            self.path = compile_dictionary(self.source)
+        return super().load()
+
+
+def register_dictionary_file(name, source):
+    """
+    :param name: dictionary name, as used by get_colour_name and friends
+    :param source: .gpl, .csv, .json or .ase file; nothing is read before the first lookup
+    """
+    register_dictionary(name, CompiledDictionary(os.path.expanduser(source)))
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# _*_ coding: utf-8 _*_
+"""
+Image loading shared by the preview and palette extraction: the file is decoded once,
+the preview and the quantiser work on the same pixels.
+"""
+import os
+
+from PIL import Image
+
+from azote_palettes.quantize import PIXEL_BUDGET, PaletteSource
+
+# max width and height of the thumbnail for the coarse palette
+THUMBNAIL_SIZE = 128
+
+
+def file_stamp(path):
+    """
+    :return: (mtime, size) tuple, to tell if the file has changed since loaded
+    """
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def draft_scale(size, preview_max_width, pixel_budget):
+    """
+    Decode planner: the largest JPEG reduce-on-decode scale (1/8, 1/4 or 1/2) at which the image still covers
+    the preview and has at least pixel_budget pixels for the quantiser
+    :param size: (width, height) of the file
+    :return: 8, 4, 2 or 1
+    """
+    w, h = size
+    ratio = min(preview_max_width / w, int(preview_max_width * 0.5625) / h, 1)
+    for scale in (8, 4, 2):
+        scaled_w, scaled_h = w // scale, h // scale
+        if scaled_w >= w * ratio and scaled_h >= h * ratio and scaled_w * scaled_h >= pixel_budget:
+            return scale
+    return 1
+
+
+def scale_image(image, max_width):
+    """
+    :param image: PIL Image
+    :param max_width: the preview fits in max_width x max_width * 0.5625
+    :return: scaled copy, or the image itself if small enough
+    """
+    max_height = int(max_width * 0.5625)
+    w, h = image.size
+    if w <= max_width and h <= max_height:
+        return image
+    ratio = min(max_width / w, max_height / h)
+    scaled = image.copy()
+    scaled.thumbnail((w * ratio, h * ratio), Image.NEAREST)
+    return scaled
+
+
+def open_image(path, pixel_budget=PIXEL_BUDGET):
+    """
+    Decodes the image for the palette alone, with no preview: JPEG files at the smallest scale
+    which still has pixel_budget pixels; the full size if no pixel_budget
+    :return: PIL Image
+    """
+    image = Image.open(path)
+    if image.format == 'JPEG' and pixel_budget:
+        scale = draft_scale(image.size, 0, pixel_budget)
+        if scale > 1:
+            w, h = image.size
+            image.draft(image.mode, (w // scale, h // scale))
+    image.load()
+    return image
+
+
+def load_thumbnail(path, size=THUMBNAIL_SIZE):
+    """
+    Decodes a JPEG file at 1/8 scale (or the largest reduction which still covers size) and scales it
+    to fit size x size; takes milliseconds whatever the image size
+    :return: PIL Image, or None if the file format can not be decoded at reduced scale
+    """
+    image = Image.open(path)
+    if image.format != 'JPEG':
+        return None
+    image.draft('RGB', (size, size))
+    image.thumbnail((size, size), Image.NEAREST)
+    return image
+
+
+class LoadedImage(object):
+    """
+    Decoded image: the pixels for the quantiser and a scaled copy for the preview. JPEG files are decoded
+    at the smallest scale which still satisfies both, see draft_scale.
+    """
+    def __init__(self, path, preview_max_width, pixel_budget=PIXEL_BUDGET):
+        self.path = path
+        self.stamp = file_stamp(path)
+        self.preview_max_width = preview_max_width
+        self.pixel_budget = pixel_budget
+        self.image = Image.open(path)
+        if self.image.format == 'JPEG':
+            scale = draft_scale(self.image.size, preview_max_width, pixel_budget)
+            if scale > 1:
+                w, h = self.image.size
+                self.image.draft(self.image.mode, (w // scale, h // scale))
+        self.image.load()
+        self.preview = scale_image(self.image, preview_max_width)
+        self.source = None
+
+    def is_current(self, path, preview_max_width, pixel_budget=PIXEL_BUDGET):
+        """
+        :return: True if the same, unchanged file has been loaded for the same preview size and pixel budget
+        """
+        try:
+            return path == self.path and file_stamp(path) == self.stamp and \
+                preview_max_width == self.preview_max_width and pixel_budget == self.pixel_budget
+        except OSError:
+            return False
+
+    def palette_source(self, max_count, engine=None):
+        """
+        :return: PaletteSource of the image, created on first use and kept for other palette sizes
+        """
+        if self.source is None or self.source.max_count < max_count or (engine and self.source.engine != engine):
+            self.source = PaletteSource(self.image, max_count, engine=engine, pixel_budget=self.pixel_budget)
+        return self.source
+
+
+def load_image(path, preview_max_width, loaded=None, pixel_budget=PIXEL_BUDGET):
+    """
+    :param path: image file
+    :param preview_max_width: see scale_image
+    :param loaded: previously LoadedImage, reused if still current
+    :param pixel_budget: min number of pixels the quantiser needs, see draft_scale
+    :return: LoadedImage
+    """
+    if loaded is not None and loaded.is_current(path, preview_max_width, pixel_budget):
+        return loaded
+    return LoadedImage(path, preview_max_width, pixel_budget)
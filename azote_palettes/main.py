@@ -8,7 +8,7 @@ e-mail: nwg.piotr@gmail.com
 Website: https://github.com/nwg-piotr/azote-palettes
 License: GPL-3.0-or-later
 
-Depends on: 'python-colorthief'
+Depends on: 'python-numpy' or 'python-colorthief'
 """
 import sys
 import os
@@ -16,17 +16,26 @@ import platform
 import tempfile
 import gi
 import json
+import threading
 
 gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk, GdkPixbuf, Gdk, GLib
 from PIL import Image
-from colorthief import ColorThief
-from azote_palettes.color_tools import get_colour_name, hex_to_rgb, rgb_to_cmyk
+from azote_palettes.color_tools import get_colour_names, format_colour_name, hex_to_rgb, rgb_to_cmyk, \
+    preload_dictionaries, find_colours, closest_colours, register_dictionary, registry, get_index, METRICS
+from azote_palettes.dictionary_files import CompiledDictionary
+from azote_palettes.quantize import get_palette, default_engine, engines, PIXEL_BUDGET
+from azote_palettes.imaging import load_image, load_thumbnail
+from azote_palettes.palette_cache import PaletteCache, cache_key, MAX_SIZE
 from azote_palettes import common
 
 tempdir = '/tmp' if platform.system() == 'Darwin' else tempfile.gettempdir()
 clipboard_file = os.path.join(tempdir, 'azote-clipboard.png')
-clipboard_file_scaled = os.path.join(tempdir, 'azote-clipboard-scaled.png')
+
+DICTIONARY_LABELS = {'names': '', 'pantone': 'Pantone'}
+# the largest palette size in the menu
+MAX_COLORS = 36
+METRIC_LABELS = {'rgb': 'RGB', 'de76': 'ΔE76', 'de94': 'ΔE94', 'de2000': 'ΔE2000'}
 
 # I have no Mac in range to check if it works there!
 image_grab = platform.system() == 'Windows' or platform.system() == 'Darwin'
@@ -47,19 +56,31 @@ def save_clipboard():
             pixbuf.savev(clipboard_file, 'png', [], [])
 
 
-def scale_image(path):
-    preview_max_height = int(common.rc.preview_max_width * 0.5625)
+def load(path, loaded=None):
+    """
+    Decodes the image once for both the preview and the palette; called in the worker thread
+    :param loaded: LoadedImage to reuse if the file has not changed
+    :return: LoadedImage or None
+    """
     try:
-        pillow_image = Image.open(path)
-        w, h = pillow_image.size
-        ratio = min(common.rc.preview_max_width / w, preview_max_height / h)
-        if w > common.rc.preview_max_width or h > preview_max_height:
-            w = w * ratio
-            h = h * ratio
-            pillow_image.thumbnail((w, h), Image.NEAREST)
-        pillow_image.save(clipboard_file_scaled)
+        return load_image(path, common.rc.preview_max_width, loaded, common.rc.pixel_budget)
     except Exception as e:
         print(e)
+        return None
+
+
+def image_pixbuf(image):
+    """
+    :param image: PIL Image
+    :return: GdkPixbuf made from the pixel data in memory, with no encoding or temporary file
+    """
+    has_alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+    mode = 'RGBA' if has_alpha else 'RGB'
+    if image.mode != mode:
+        image = image.convert(mode)
+    data = GLib.Bytes.new(image.tobytes())
+    w, h = image.size
+    return GdkPixbuf.Pixbuf.new_from_bytes(data, GdkPixbuf.Colorspace.RGB, has_alpha, 8, w, h, w * len(mode))
 
 
 def color_image(size, color):
@@ -68,21 +89,74 @@ def color_image(size, color):
     :param color: tuple (red, green, blue)
     :return: GdkPixbuf
     """
-    image = Image.new("RGB", size, color)
-    data = image.tobytes()
-    w, h = image.size
-    data = GLib.Bytes.new(data)
-    return GdkPixbuf.Pixbuf.new_from_bytes(data, GdkPixbuf.Colorspace.RGB, False, 8, w, h, w * 3)
+    return image_pixbuf(Image.new("RGB", size, color))
 
 
-def palette(image_path):
+def palette_key(path):
+    # the names depend on the dictionary content, which the user may edit (dictionary_files)
+    return cache_key(path, num_colors=common.rc.num_colors, engine=common.rc.engine,
+                     pixel_budget=common.rc.pixel_budget, metric=common.rc.metric,
+                     dictionaries=[(d, get_index(d).checksum) for d in common.rc.dictionaries])
+
+
+def cached_palette(path):
+    """
+    :return: palette and names as from palette, or (None, None) if not in the palette cache
+    """
     try:
-        color_thief = ColorThief(image_path)
-        return color_thief.get_palette(color_count=common.rc.num_colors + 1, quality=10)
-    except:
+        # the file may be gone, then load() fails as well and the failure is shown
+        record = common.palette_cache.get(palette_key(path))
+    except Exception as e:
+        print(e)
+        return None, None
+    if record:
+        return [tuple(color) for color in record['palette']], record['names']
+    return None, None
+
+
+def coarse_palette(path):
+    """
+    Quick preview of the palette, from a thumbnail decoded at reduced scale
+    :return: list of (r, g, b) tuples, or None if the file can not be decoded at reduced scale
+    """
+    try:
+        thumbnail = load_thumbnail(path)
+        if thumbnail is None:
+            return None
+        return get_palette(thumbnail, color_count=common.rc.num_colors + 1, quality=1, engine=common.rc.engine)
+    except Exception as e:
+        print(e)
         return None
 
 
+def palette(loaded):
+    """
+    Extracts the palette and names its colours, or takes both from the palette cache
+    :param loaded: LoadedImage
+    :return: list of (r, g, b) tuples, {dictionary: [(exact name, nearest name, nearest hex)]} with an entry
+    per swatch; (None, None) on failure
+    """
+    colors, names = cached_palette(loaded.path)
+    if colors:
+        return colors, names
+
+    try:
+        # pixels are only read once per image, other palette sizes come from the same source
+        source = loaded.palette_source(MAX_COLORS + 1, engine=common.rc.engine)
+        colors = source.palette(common.rc.num_colors + 1)
+    except:
+        return None, None
+    try:
+        names = get_colour_names([rgb_to_hex(color) for color in colors], common.rc.dictionaries, common.rc.metric)
+    except (OSError, ValueError) as e:
+        # the swatches are shown anyway, not cached without their names
+        print(e, file=sys.stderr)
+        return colors, None
+    common.palette_cache.put(palette_key(loaded.path), {'palette': colors, 'names': names})
+
+    return colors, names
+
+
 def rgb_to_hex(rgb):
     return '#%02x%02x%02x' % (rgb[0], rgb[1], rgb[2])
 
@@ -96,8 +170,9 @@ class Preview(Gtk.VBox):
             common.image_path = os.path.join(common.images_path, 'welcome.jpg')
 
         self.image = Gtk.Image()
-        scale_image(common.image_path)
-        self.image.set_from_file(clipboard_file_scaled)
+        self.loaded = None
+        # the latest job number; workers of the older ones give up at the next step
+        self.job = 0
 
         self.set_spacing(5)
         self.set_border_width(15)
@@ -105,60 +180,170 @@ class Preview(Gtk.VBox):
 
         self.label = Gtk.Label()
         self.label.set_property("name", "label")
-        self.label.set_text(common.image_path)
         self.pack_start(self.label, True, True, 10)
 
         self.toolbar = Toolbar()
         self.pack_start(self.toolbar, False, False, 0)
 
-        self.palette_preview = PalettePreview()
+        self.palette_preview = PalettePreview(None, None, busy=True)
         self.add(self.palette_preview)
 
+        self.refresh()
+
     def refresh(self):
         self.label.set_text(common.image_path)
-        scale_image(common.image_path)
-        self.image.set_from_file(clipboard_file_scaled)
-
-        self.palette_preview.destroy()
-        self.palette_preview = PalettePreview()
-        self.palette_preview.show_all()
-        self.add(self.palette_preview)
+        self.start(common.image_path, self.loaded, True)
+
+    def refresh_palette(self):
+        if self.loaded:
+            self.start(self.loaded.path, self.loaded, False)
+
+    def start(self, path, loaded, with_preview):
+        """
+        Decodes the image and extracts the palette in a worker thread; the jobs started before are cancelled
+        :param loaded: LoadedImage to reuse if the file has not changed
+        :param with_preview: also update the preview image
+        """
+        self.job += 1
+        self.show_palette(None, None, busy=True)
+        thread = threading.Thread(target=self.work, args=(self.job, path, loaded, with_preview), daemon=True)
+        thread.start()
+
+    def cancelled(self, job):
+        return job != self.job
+
+    def work(self, job, path, loaded, with_preview):
+        if with_preview and common.rc.progressive:
+            # a new image: show the coarse palette while decoding the whole file, unless cached
+            colors, names = cached_palette(path)
+            if colors:
+                GLib.idle_add(self.on_palette, job, None, colors, names, True)
+            else:
+                colors = coarse_palette(path)
+                if colors:
+                    GLib.idle_add(self.on_palette, job, None, colors, None, True)
+            if self.cancelled(job):
+                return
+
+        loaded = load(path, loaded)
+        if self.cancelled(job):
+            return
+        if loaded is None:
+            GLib.idle_add(self.on_palette, job, None, None, None)
+            return
+        if with_preview:
+            try:
+                pixbuf = image_pixbuf(loaded.preview)
+            except Exception as e:
+                print(e)
+                pixbuf = None
+            GLib.idle_add(self.on_preview, job, pixbuf)
+
+        if self.cancelled(job):
+            return
+        try:
+            colors, names = palette(loaded)
+        except Exception as e:
+            print(e)
+            colors, names = None, None
+        GLib.idle_add(self.on_palette, job, loaded, colors, names)
+
+    def on_preview(self, job, pixbuf):
+        if not self.cancelled(job):
+            if pixbuf:
+                self.image.set_from_pixbuf(pixbuf)
+            else:
+                self.image.clear()
+        return False
+
+    def on_palette(self, job, loaded, colors, names, busy=False):
+        """
+        :param loaded: LoadedImage; None for a preliminary palette, then busy is True
+        """
+        if not self.cancelled(job):
+            if not busy:
+                self.loaded = loaded
+            self.show_palette(colors, names, busy)
+        return False
+
+    def show_palette(self, colors, names, busy=False):
+        if len(self.palette_preview.all_buttons) == common.rc.num_colors:
+            # swatches updated in place
+            self.palette_preview.set_palette(colors, names, busy)
+        else:
+            self.palette_preview.destroy()
+            self.palette_preview = PalettePreview(colors, names, busy)
+            self.palette_preview.show_all()
+            self.add(self.palette_preview)
 
 
 class PalettePreview(Gtk.VBox):
-    def __init__(self):
+    def __init__(self, colors, names, busy=False):
+        """
+        :param colors: list of (r, g, b) tuples, see palette
+        :param names: names of the colours, see palette; None if not known yet
+        :param busy: show a spinner, the palette is being extracted
+        """
         super().__init__()
         self.set_spacing(5)
         self.label = Gtk.Label()
         self.label.set_use_markup(True)
         self.label.set_property("name", "label")
-        self.label.set_text('Click a button below for colour details')
         self.pack_start(self.label, True, True, 10)
-        self.palette = palette(common.image_path)
+        self.spinner = Gtk.Spinner()
+        self.spinner.set_no_show_all(True)
+        self.pack_start(self.spinner, True, True, 0)
+
+        self.all_buttons = []
+        for i in range(common.rc.num_colors // 6):
+            hbox = Gtk.HBox()
+            for j in range(6):
+                button = Gtk.Button.new_with_label('       ')
+                button.set_always_show_image(True)
+                button.set_image(Gtk.Image())
+                button.set_image_position(2)
+                button.set_property("name", "color-btn")
+                button.set_no_show_all(True)
+                button.connect('clicked', self.on_button_press)
+                self.all_buttons.append(button)
+                hbox.pack_start(button, True, False, 0)
+            self.pack_start(hbox, True, True, 0)
+
+        self.set_palette(colors, names, busy)
+
+    def set_palette(self, colors, names, busy=False):
+        """
+        Updates the swatches: placeholders if no colors, the coarse palette then the refined one if progressive
+        """
+        self.palette, self.names = colors, names
+        # names are computed for the metric and dictionaries at the time of extraction
+        self.names_for = (common.rc.metric, list(common.rc.dictionaries)) if names else None
+        self.spinner.set_visible(busy)
+        if busy:
+            self.spinner.start()
+        else:
+            self.spinner.stop()
+        self.label.set_tooltip_markup(None)
         if self.palette:
-            self.all_buttons = []
-            index = 0
-            for i in range(common.rc.num_colors // 6):
-                hbox = Gtk.HBox()
-                for j in range(6):
-                    try:
-                        color = self.palette[index]
-                        pixbuf = color_image((80, 30), color)
-                        image = Gtk.Image.new_from_pixbuf(pixbuf)
-                        button = Gtk.Button.new_with_label(rgb_to_hex(color))
-                        button.set_always_show_image(True)
-                        button.set_image(image)
-                        button.set_image_position(2)
-                        button.set_property("name", "color-btn")
-                        button.connect('clicked', self.on_button_press)
-                        self.all_buttons.append(button)
-                        label = Gtk.Label()
-                        label.set_text(str(color))
-                        hbox.pack_start(button, True, False, 0)
-                        index += 1
-                    except IndexError:
-                        break
-                self.pack_start(hbox, True, True, 0)
+            self.label.set_text('Click a button below for colour details')
+        else:
+            self.label.set_text('Extracting palette...' if busy else 'Could not extract the palette')
+
+        for index, button in enumerate(self.all_buttons):
+            button.set_property("name", "color-btn")
+            if self.palette and index < len(self.palette):
+                color = self.palette[index]
+                button.get_image().set_from_pixbuf(color_image((80, 30), color))
+                button.set_label(rgb_to_hex(color))
+                button.set_sensitive(True)
+                button.show()
+            elif busy and not self.palette:
+                button.get_image().set_from_pixbuf(color_image((80, 30), (200, 200, 200)))
+                button.set_label('       ')
+                button.set_sensitive(False)
+                button.show()
+            else:
+                button.hide()
 
     def on_button_press(self, button):
         # mark all buttons unselected
@@ -176,26 +361,35 @@ class PalettePreview(Gtk.VBox):
         y = 'Y: <span weight="bold">{}</span>'.format(str(round(y)))
         k = 'K: <span weight="bold">{}</span>'.format(str(round(k)))
 
-        # find exact or closest common colour name
-        exact_name, closest_name = get_colour_name(button.get_label(), 'names')
-
-        # find exact or closest Pantone C colour
-        exact_pantone, closest_pantone = get_colour_name(button.get_label(), 'pantone')
+        # find exact or closest colour names in all the dictionaries selected in the rc file
+        if self.names_for != (common.rc.metric, common.rc.dictionaries):
+            self.names = get_colour_names([rgb_to_hex(color) for color in self.palette], common.rc.dictionaries,
+                                          common.rc.metric)
+            self.names_for = (common.rc.metric, list(common.rc.dictionaries))
+        index = self.all_buttons.index(button)
+        labels = []
+        for dictionary in common.rc.dictionaries:
+            exact_name, closest_name, closest_hex = self.names[dictionary][index]
+            title = DICTIONARY_LABELS.get(dictionary, dictionary)
+            if exact_name:
+                labels.append('{}: {}'.format(' '.join(('Exact', title)).strip(), exact_name))
+            else:
+                labels.append('{}: {}'.format(' '.join(('Nearest', title)).strip(),
+                                              format_colour_name(closest_name, closest_hex)))
 
         self.label.set_selectable(True)
 
-        if exact_name:
-            label_name = 'Exact: {}'.format(exact_name)
-        else:
-            label_name = 'Nearest: {}'.format(closest_name)
-
-        if exact_pantone:
-            label_pantone = 'Exact Pantone: {}'.format(exact_pantone)
-        else:
-            label_pantone = 'Nearest Pantone: {}'.format(closest_pantone)
-
         self.label.set_markup(
-            '{} | {} {} {} {} | {} | {}'.format(button.get_label(), c, m, y, k, label_name, label_pantone))
+            '{} | {} {} {} {} | {}'.format(button.get_label(), c, m, y, k, ' | '.join(labels)))
+
+        # nearest alternatives with their distances
+        tooltip = []
+        for dictionary in common.rc.dictionaries:
+            title = DICTIONARY_LABELS.get(dictionary, dictionary) or 'Names'
+            tooltip.append('<b>{}</b>'.format(title))
+            for name, hex_value, distance in closest_colours(button.get_label(), 5, dictionary, common.rc.metric):
+                tooltip.append('{} ({}) {:.1f}'.format(GLib.markup_escape_text(name), hex_value, distance))
+        self.label.set_tooltip_markup('\n'.join(tooltip))
 
 
 class Toolbar(Gtk.HBox):
@@ -207,6 +401,10 @@ class Toolbar(Gtk.HBox):
         self.pack_start(button, False, False, 0)
         button.connect_after('clicked', self.on_size_button)
 
+        button = Gtk.Button.new_with_label("Metric ({})".format(METRIC_LABELS[common.rc.metric]))
+        self.pack_start(button, False, False, 0)
+        button.connect_after('clicked', self.on_metric_button)
+
         button = Gtk.Button.new_with_label("Select image")
         self.add(button)
         button.connect_after('clicked', self.on_open_button)
@@ -215,6 +413,8 @@ class Toolbar(Gtk.HBox):
         self.pack_start(button, False, False, 0)
         button.connect_after('clicked', self.on_paste_button)
 
+        self.pack_end(ColourSearch(), False, False, 0)
+
     def on_size_button(self, button):
         menu = Gtk.Menu()
         item = Gtk.MenuItem.new_with_label('6 colors')
@@ -242,9 +442,24 @@ class Toolbar(Gtk.HBox):
     def on_size_menu_item(self, item, button, number):
         common.rc.num_colors = number
         common.rc.save()
-        common.preview.refresh()
+        common.preview.refresh_palette()
         button.set_label("Palette size ({})".format(common.rc.num_colors))
 
+    def on_metric_button(self, button):
+        menu = Gtk.Menu()
+        for metric in METRICS:
+            item = Gtk.MenuItem.new_with_label(METRIC_LABELS[metric])
+            item.connect('activate', self.on_metric_menu_item, button, metric)
+            menu.append(item)
+
+        menu.show_all()
+        menu.popup_at_widget(button, Gdk.Gravity.WEST, Gdk.Gravity.SOUTH_WEST, None)
+
+    def on_metric_menu_item(self, item, button, metric):
+        common.rc.metric = metric
+        common.rc.save()
+        button.set_label("Metric ({})".format(METRIC_LABELS[common.rc.metric]))
+
     def on_open_button(self, button):
         dialog = Gtk.FileChooserDialog(title='Select image', parent=button.get_toplevel(),
                                        action=Gtk.FileChooserAction.OPEN)
@@ -277,13 +492,58 @@ class Toolbar(Gtk.HBox):
 
         global clipboard_file
         if os.path.exists(clipboard_file):
-            scale_image(clipboard_file)
-            common.preview.image.set_from_file(clipboard_file)
-            common.preview.label.set_text(clipboard_file)
             common.image_path = clipboard_file
             common.preview.refresh()
 
 
+class ColourSearch(Gtk.SearchEntry):
+    """
+    Find colours by name, as you type, in the dictionaries selected in the rc file
+    """
+    def __init__(self):
+        super().__init__()
+        self.set_placeholder_text('Find colour by name')
+        self.popover = Gtk.Popover.new(self)
+        self.popover.set_modal(False)
+        self.popover.set_position(Gtk.PositionType.TOP)
+        self.list_box = Gtk.ListBox()
+        self.list_box.set_selection_mode(Gtk.SelectionMode.NONE)
+        self.popover.add(self.list_box)
+        self.connect('search-changed', self.on_search_changed)
+        self.connect('stop-search', self.on_stop_search)
+
+    def on_search_changed(self, entry):
+        for row in self.list_box.get_children():
+            row.destroy()
+
+        try:
+            found = find_colours(self.get_text(), common.rc.dictionaries, limit=12)
+        except (OSError, ValueError) as e:
+            print(e, file=sys.stderr)
+            found = []
+        if not found:
+            self.popover.popdown()
+            return
+
+        for dictionary, name, hex_value in found:
+            hbox = Gtk.HBox()
+            hbox.set_spacing(10)
+            image = Gtk.Image.new_from_pixbuf(color_image((40, 20), hex_to_rgb(hex_value)))
+            hbox.pack_start(image, False, False, 0)
+            label = Gtk.Label()
+            label.set_property("name", "label")
+            label.set_selectable(True)
+            label.set_text('{} ({}) {}'.format(name, hex_value, DICTIONARY_LABELS.get(dictionary, dictionary)))
+            hbox.pack_start(label, False, False, 0)
+            self.list_box.add(hbox)
+        self.list_box.show_all()
+        self.popover.popup()
+
+    def on_stop_search(self, entry):
+        self.set_text('')
+        self.popover.popdown()
+
+
 class GUI:
     def __init__(self):
         window = Gtk.Window()
@@ -301,6 +561,21 @@ class GUI:
 
         window.show_all()
 
+        # build colour name indexes while idle, one dictionary per call, instead of on the first click
+        GLib.idle_add(next, preload_names(common.rc.dictionaries), False)
+
+
+def preload_names(dictionaries):
+    """
+    preload_dictionaries for GLib.idle_add: a dictionary which can not be read is reported, not raised
+    """
+    for dictionary in dictionaries:
+        try:
+            yield from preload_dictionaries([dictionary])
+        except (OSError, ValueError) as e:
+            print(e, file=sys.stderr)
+            yield True
+
 
 def destroy(self):
     Gtk.main_quit()
@@ -311,18 +586,58 @@ class RuntimeConfig(object):
         super().__init__()
         self.preview_max_width = 720
         self.num_colors = 24
+        self.metric = 'rgb'
+        # palette extraction engine: 'mmcq' (numpy) or 'colorthief'
+        self.engine = default_engine()
+        # number of pixels sampled for the palette, whatever the image size
+        self.pixel_budget = PIXEL_BUDGET
+        # show a coarse palette from a thumbnail first, while the whole image is being decoded
+        self.progressive = True
+        # max size of the palette cache, in bytes
+        self.palette_cache_size = MAX_SIZE
+        # names to show in the colour details label
+        self.dictionaries = ['names', 'pantone']
+        # additional dictionaries: {name: path to a .gpl, .csv, .json or .ase palette}
+        self.dictionary_files = {}
 
         try:
             with open(common.rc_path, 'r') as f:
                 rc = json.load(f)
                 self.preview_max_width = int(rc['preview_max_width'])
                 self.num_colors = int(rc['num_colors'])
+                if rc.get('metric') in METRICS:
+                    self.metric = rc['metric']
+                if rc.get('engine') in engines:
+                    self.engine = rc['engine']
+                self.pixel_budget = int(rc.get('pixel_budget', self.pixel_budget))
+                self.progressive = rc.get('progressive', 'true') == 'true'
+                self.palette_cache_size = int(rc.get('palette_cache_size', self.palette_cache_size))
+                self.dictionary_files = rc.get('dictionary_files', self.dictionary_files)
+                self.dictionaries = rc.get('dictionaries', self.dictionaries)
         except FileNotFoundError:
             self.save()
 
+        for name, path in self.dictionary_files.items():
+            # read now: a missing or broken file would make every lookup fail
+            d = CompiledDictionary(os.path.expanduser(path))
+            try:
+                d.load()
+            except (OSError, ValueError) as e:
+                print(e, file=sys.stderr)
+                continue
+            register_dictionary(name, d)
+        self.dictionaries = [d for d in self.dictionaries if d in registry]
+
     def save(self):
         rc = {'preview_max_width': str(self.preview_max_width),
-              'num_colors': str(self.num_colors)}
+              'num_colors': str(self.num_colors),
+              'metric': self.metric,
+              'engine': self.engine,
+              'pixel_budget': str(self.pixel_budget),
+              'progressive': str(self.progressive).lower(),
+              'palette_cache_size': str(self.palette_cache_size),
+              'dictionaries': self.dictionaries,
+              'dictionary_files': self.dictionary_files}
 
         with open(common.rc_path, 'w') as f:
             json.dump(rc, f, indent=2)
@@ -339,6 +654,12 @@ def main():
     common.resources_path = os.path.dirname(os.path.abspath(__file__))
     common.images_path = os.path.join(common.resources_path, 'images')
     common.rc = RuntimeConfig()
+    common.palette_cache = PaletteCache(max_size=common.rc.palette_cache_size)
+
+    if len(sys.argv) > 1 and sys.argv[1] == '--clear-cache':
+        common.palette_cache.clear()
+        print('Palette cache cleared: {}'.format(common.palette_cache.path))
+        return
 
     screen = Gdk.Screen.get_default()
     provider = Gtk.CssProvider()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# _*_ coding: utf-8 _*_
+"""
+Streaming colour naming: a colour per input line, named chunk by chunk with the vectorised get_colour_names,
+so memory use does not depend on the input length.
+"""
+import json
+from itertools import islice
+
+from azote_palettes.color_tools import get_colour_names, parse_colour
+
+FORMATS = ('tsv', 'jsonl')
+CHUNK_SIZE = 10000
+
+
+def parse_line(line):
+    """
+    Hex values need their prefix, so that a line of digits is never read both ways
+    :param line: '#rrggbb', '#rgb', '0xrrggbb', 'rgb(r, g, b)', or digits only: a decimal 0xRRGGBB value
+    :return: (r, g, b) tuple or None
+    """
+    line = line.strip()
+    try:
+        if line.isdigit():
+            return parse_colour(int(line))
+        if line.startswith('#') or line.lower().startswith(('0x', 'rgb')):
+            return parse_colour(line)
+    except ValueError:
+        pass
+    return None
+
+
+def name_chunk(lines, dictionaries=('names', 'pantone'), metric='rgb'):
+    """
+    :param lines: input lines, see parse_line
+    :return: list of (input, #rrggbb or None, [nearest name in each dictionary] or None)
+    """
+    inputs = [line.rstrip('\r\n') for line in lines]
+    colours = [parse_line(line) for line in inputs]
+    valid = [colour for colour in colours if colour is not None]
+    # mostly unique colours, the name cache would only slow it down
+    names = get_colour_names(valid, dictionaries, metric, cache=False) if valid else {}
+    result = []
+    n = 0
+    for line, colour in zip(inputs, colours):
+        if colour is None:
+            result.append((line, None, None))
+            continue
+        result.append((line, '#%02x%02x%02x' % colour, [names[dictionary][n][1] for dictionary in dictionaries]))
+        n += 1
+    return result
+
+
+def format_tsv(rows, dictionaries):
+    # tabs in the input would shift the columns
+    return ''.join('{}\t{}\t{}\n'.format(line.replace('\t', ' '), hex_value or '',
+                                         '\t'.join(found or [''] * len(dictionaries)))
+                   for line, hex_value, found in rows)
+
+
+def format_jsonl(rows, dictionaries):
+    lines = []
+    for line, hex_value, found in rows:
+        record = {'input': line}
+        if hex_value is None:
+            record['error'] = 'not a colour'
+        else:
+            record['hex'] = hex_value
+            record.update(zip(dictionaries, found))
+        lines.append(json.dumps(record, ensure_ascii=False))
+        lines.append('\n')
+    return ''.join(lines)
+
+
+formatters = {'tsv': format_tsv, 'jsonl': format_jsonl}
+
+
+def name_stream(f_in, f_out, dictionaries=('names', 'pantone'), metric='rgb', output_format='tsv',
+                chunk_size=CHUNK_SIZE, header=False):
+    """
+    Names each colour of f_in, written to f_out a chunk at a time; blank lines are skipped
+    :param f_in: text file, a colour per line, see parse_line
+    :param f_out: text file; tsv: input, #rrggbb and a name per dictionary, empty if not a colour
+    :param output_format: one of FORMATS
+    :param header: write a column header line (tsv only)
+    :return: number of lines named
+    """
+    formatter = formatters[output_format]
+    if header and output_format == 'tsv':
+        f_out.write('\t'.join(['input', 'hex'] + list(dictionaries)) + '\n')
+    lines = (line for line in f_in if line.strip())
+    count = 0
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            return count
+        f_out.write(formatter(name_chunk(chunk, dictionaries, metric), dictionaries))
+        f_out.flush()
+        count += len(chunk)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# _*_ coding: utf-8 _*_
+"""
+Persistent palette cache: SQLite database in $XDG_CACHE_HOME/azote-palettes, keyed by the image file
+(path, mtime, size) and the extraction parameters. Least recently used records are evicted above max_size.
+"""
+import os
+import json
+import time
+import sqlite3
+import hashlib
+from contextlib import closing
+
+from azote_palettes.color_tools import cache_dir
+
+# max total size of the stored records, in bytes
+MAX_SIZE = 16 * 1024 * 1024
+
+
+def cache_key(image_path, **params):
+    """
+    :param image_path: image file
+    :param params: everything the record depends on, e.g. num_colors, engine, pixel_budget, metric
+    :return: hex digest; changes if the file is modified or replaced
+    """
+    st = os.stat(image_path)
+    data = json.dumps([os.path.abspath(image_path), st.st_mtime_ns, st.st_size, params], sort_keys=True)
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+
+class PaletteCache(object):
+    def __init__(self, path=None, max_size=MAX_SIZE):
+        self.path = path or os.path.join(cache_dir(), 'palettes.sqlite')
+        self.max_size = max_size
+
+    def connect(self):
+        # a connection per operation: safe to use from any thread and process
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=5)
+        connection.execute('CREATE TABLE IF NOT EXISTS palettes (key TEXT PRIMARY KEY, value TEXT NOT NULL, '
+                           'size INTEGER NOT NULL, last_used REAL NOT NULL)')
+        return connection
+
+    def get(self, key):
+        """
+        :return: the stored record (dict), or None
+        """
+        try:
+            with closing(self.connect()) as connection, connection:
+                row = connection.execute('SELECT value FROM palettes WHERE key = ?', (key,)).fetchone()
+                if row is None:
+                    return None
+                connection.execute('UPDATE palettes SET last_used = ? WHERE key = ?', (time.time(), key))
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            print(e)
+            return None
+
+    def put(self, key, record):
+        """
+        :param record: JSON-serializable dict, e.g. {'palette': [...], 'names': {...}}
+        """
+        value = json.dumps(record)
+        try:
+            with closing(self.connect()) as connection, connection:
+                connection.execute('INSERT OR REPLACE INTO palettes VALUES (?, ?, ?, ?)',
+                                   (key, value, len(value), time.time()))
+                self.evict(connection)
+        except sqlite3.Error as e:
+            print(e)
+
+    def evict(self, connection):
+        total = connection.execute('SELECT COALESCE(SUM(size), 0) FROM palettes').fetchone()[0]
+        if total <= self.max_size:
+            return
+        for key, size in connection.execute('SELECT key, size FROM palettes ORDER BY last_used').fetchall():
+            connection.execute('DELETE FROM palettes WHERE key = ?', (key,))
+            total -= size
+            if total <= self.max_size:
+                break
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def info(self):
+        """
+        :return: {'records', 'size', 'max_size'}
+        """
+        with closing(self.connect()) as connection:
+            records, size = connection.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM palettes').fetchone()
+        return {'records': records, 'size': size, 'max_size': self.max_size}
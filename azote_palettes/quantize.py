@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+# _*_ coding: utf-8 _*_
+"""
+Palette extraction engines:
+'mmcq' - numpy port of the ColorThief MMCQ (modified median cut quantization), same results, 10-50x faster;
+'colorthief' - the original pure Python implementation.
+The MMCQ code follows colorthief by Shipeng Feng, see LICENSE-COLORTHIEF.
+"""
+from PIL import Image
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from colorthief import ColorThief
+except ImportError:
+    ColorThief = None
+
+SIGBITS = 5
+RSHIFT = 8 - SIGBITS
+MAX_ITERATION = 1000
+FRACT_BY_POPULATIONS = 0.75
+
+# number of pixels to sample from an image, whatever its size
+PIXEL_BUDGET = 250000
+# the sample is random, but the same image always gives the same palette
+SAMPLING_SEED = 0
+
+
+class VBox(object):
+    """
+    3d colour space box over the (32, 32, 32) histogram; bounds are inclusive
+    """
+    def __init__(self, r1, r2, g1, g2, b1, b2, histo):
+        self.r1 = r1
+        self.r2 = r2
+        self.g1 = g1
+        self.g2 = g2
+        self.b1 = b1
+        self.b2 = b2
+        self.histo = histo
+        self.volume = (r2 - r1 + 1) * (g2 - g1 + 1) * (b2 - b1 + 1)
+        self.count = int(self.cells().sum())
+        self.cached_avg = None
+
+    def cells(self):
+        return self.histo[self.r1:self.r2 + 1, self.g1:self.g2 + 1, self.b1:self.b2 + 1]
+
+    def copy(self, **bounds):
+        values = dict(r1=self.r1, r2=self.r2, g1=self.g1, g2=self.g2, b1=self.b1, b2=self.b2)
+        values.update(bounds)
+        return VBox(histo=self.histo, **values)
+
+    @property
+    def avg(self):
+        if self.cached_avg is None:
+            mult = 1 << RSHIFT
+            if self.count:
+                cells = self.cells()
+                # sums of hval * (i + 0.5) * mult, in integers
+                sums = [int((cells.sum(axis=axes) * (np.arange(first, first + cells.shape[axis]) * mult + mult // 2))
+                            .sum()) for axis, axes, first in ((0, (1, 2), self.r1), (1, (0, 2), self.g1),
+                                                               (2, (0, 1), self.b1))]
+                self.cached_avg = tuple(int(s / self.count) for s in sums)
+            else:
+                self.cached_avg = (int(mult * (self.r1 + self.r2 + 1) / 2), int(mult * (self.g1 + self.g2 + 1) / 2),
+                                   int(mult * (self.b1 + self.b2 + 1) / 2))
+        return self.cached_avg
+
+
+class PQueue(object):
+    """
+    Same queue as in colorthief: stable sort on demand, pop the last (greatest) item
+    """
+    def __init__(self, sort_key):
+        self.sort_key = sort_key
+        self.contents = []
+        self.sorted = False
+
+    def push(self, o):
+        self.contents.append(o)
+        self.sorted = False
+
+    def pop(self):
+        if not self.sorted:
+            self.contents.sort(key=self.sort_key)
+            self.sorted = True
+        return self.contents.pop()
+
+    def size(self):
+        return len(self.contents)
+
+
+def median_cut_apply(vbox):
+    if not vbox.count:
+        return None, None
+    if vbox.count == 1:
+        return vbox.copy(), None
+
+    rw = vbox.r2 - vbox.r1 + 1
+    gw = vbox.g2 - vbox.g1 + 1
+    bw = vbox.b2 - vbox.b1 + 1
+    maxw = max(rw, gw, bw)
+    if maxw == rw:
+        axis, dim1, dim2 = 0, 'r1', 'r2'
+    elif maxw == gw:
+        axis, dim1, dim2 = 1, 'g1', 'g2'
+    else:
+        axis, dim1, dim2 = 2, 'b1', 'b2'
+    dim1_val = getattr(vbox, dim1)
+    dim2_val = getattr(vbox, dim2)
+
+    # partial sums along the selected axis
+    sums = vbox.cells().sum(axis=tuple(a for a in range(3) if a != axis)).cumsum().tolist()
+    total = sums[-1]
+    partialsum = {i: s for i, s in zip(range(dim1_val, dim2_val + 1), sums)}
+    lookaheadsum = {i: total - s for i, s in partialsum.items()}
+
+    # determine the cut planes
+    for i in range(dim1_val, dim2_val + 1):
+        if partialsum[i] > total / 2:
+            left = i - dim1_val
+            right = dim2_val - i
+            if left <= right:
+                d2 = min(dim2_val - 1, int(i + right / 2))
+            else:
+                d2 = max(dim1_val, int(i - 1 - left / 2))
+            # avoid 0-count boxes
+            while not partialsum.get(d2, False):
+                d2 += 1
+            count2 = lookaheadsum.get(d2)
+            while not count2 and partialsum.get(d2 - 1, False):
+                d2 -= 1
+                count2 = lookaheadsum.get(d2)
+            return vbox.copy(**{dim2: d2}), vbox.copy(**{dim1: d2 + 1})
+    return None, None
+
+
+def iterate(queue, target):
+    n_color = 1
+    n_iter = 0
+    while n_iter < MAX_ITERATION:
+        vbox = queue.pop()
+        if not vbox.count:
+            # just put it back
+            queue.push(vbox)
+            n_iter += 1
+            continue
+        vbox1, vbox2 = median_cut_apply(vbox)
+        if not vbox1:
+            raise Exception("vbox1 not defined; shouldn't happen!")
+        queue.push(vbox1)
+        if vbox2:
+            queue.push(vbox2)
+            n_color += 1
+        if n_color >= target:
+            return
+        n_iter += 1
+
+
+def histogram(pixels):
+    """
+    :param pixels: (n, 3) uint8 array
+    :return: (32, 32, 32) int64 array of pixel counts
+    """
+    q = pixels.astype(np.int64) >> RSHIFT
+    index = (q[:, 0] << (2 * SIGBITS)) | (q[:, 1] << SIGBITS) | q[:, 2]
+    return np.bincount(index, minlength=1 << (3 * SIGBITS)).reshape((1 << SIGBITS,) * 3)
+
+
+def quantize(pixels, max_color):
+    """
+    :param pixels: (n, 3) uint8 array
+    :param max_color: max number of colours, 2 - 256
+    :return: list of (r, g, b) tuples, the most important first
+    """
+    if not len(pixels):
+        raise Exception('Empty pixels when quantize.')
+    return quantize_histogram(histogram(pixels), max_color)
+
+
+def quantize_histogram(histo, max_color):
+    """
+    The median cut alone, no pixel work: takes a few milliseconds whatever the image size
+    :param histo: see histogram
+    :param max_color: max number of colours, 2 - 256
+    :return: list of (r, g, b) tuples, the most important first
+    """
+    if max_color < 2 or max_color > 256:
+        raise Exception('Wrong number of max colors when quantize.')
+
+    r, g, b = np.nonzero(histo)
+    queue = PQueue(lambda x: x.count)
+    queue.push(VBox(int(r.min()), int(r.max()), int(g.min()), int(g.max()), int(b.min()), int(b.max()), histo))
+
+    # first set of colours, sorted by population
+    iterate(queue, FRACT_BY_POPULATIONS * max_color)
+
+    # re-sort by the product of pixel occupancy times the size in colour space
+    queue2 = PQueue(lambda x: x.count * x.volume)
+    while queue.size():
+        queue2.push(queue.pop())
+    iterate(queue2, max_color - queue2.size())
+
+    palette = []
+    while queue2.size():
+        palette.append(queue2.pop().avg)
+    return palette
+
+
+def valid_pixels(image, quality=10):
+    """
+    :param image: PIL Image
+    :param quality: take every n-th pixel
+    :return: (n, 3) uint8 array of mostly opaque, not white pixels
+    """
+    pixels = np.asarray(image.convert('RGBA')).reshape(-1, 4)[::quality]
+    opaque = pixels[:, 3] >= 125
+    white = (pixels[:, 0] > 250) & (pixels[:, 1] > 250) & (pixels[:, 2] > 250)
+    return np.ascontiguousarray(pixels[opaque & ~white, :3])
+
+
+def sampling_quality(image, pixel_budget=PIXEL_BUDGET):
+    """
+    :return: the 'quality' (take every n-th pixel) which samples about pixel_budget pixels of the image
+    """
+    w, h = image.size
+    return max(1, w * h // pixel_budget)
+
+
+def sample_image(image, pixel_budget=PIXEL_BUDGET, seed=SAMPLING_SEED):
+    """
+    Stratified random sample: the image is split into about pixel_budget cells (k row bands x m columns),
+    one random pixel is taken from each. Only the k sampled rows are copied, so the cost hardly depends
+    on the image size; unlike a fixed stride, the sample does not alias with regular patterns.
+    :param image: PIL Image
+    :return: the image itself if not larger than pixel_budget, otherwise a 1 pixel high RGB(A) image of the sample
+    """
+    w, h = image.size
+    if w * h <= pixel_budget:
+        return image
+    k = max(1, min(h, int(round((pixel_budget * h / w) ** 0.5))))
+    m = min(w, -(-pixel_budget // k))
+
+    random = np.random.RandomState(seed)
+    rows = ((np.arange(k) + random.random_sample(k)) * (h / k)).astype(np.intp)
+    columns = ((np.arange(m) + random.random_sample((k, m))) * (w / m)).astype(np.intp)
+    mode = image.mode if image.mode in ('RGB', 'RGBA') else 'RGBA'
+    strip = np.concatenate([np.asarray(image.crop((0, y, w, y + 1)).convert(mode)) for y in rows.tolist()])
+    sample = strip[np.arange(k)[:, None], columns]
+    return Image.fromarray(np.ascontiguousarray(sample.reshape(1, k * m, -1)), mode)
+
+
+def sampled(image, quality=10, pixel_budget=None):
+    """
+    :return: (image, quality) to pass to an engine: the stratified sample and 1, if pixel_budget given
+    (the image and a stride, if no numpy); the arguments as they are otherwise
+    """
+    if pixel_budget:
+        if np is not None:
+            return sample_image(image, pixel_budget), 1
+        return image, sampling_quality(image, pixel_budget)
+    return image, quality
+
+
+def mmcq_palette(image, color_count=10, quality=10):
+    return quantize(valid_pixels(image, quality), color_count)
+
+
+def colorthief_palette(image, color_count=10, quality=10):
+    color_thief = ColorThief.__new__(ColorThief)
+    color_thief.image = image
+    return color_thief.get_palette(color_count=color_count, quality=quality)
+
+
+engines = {}
+if np is not None:
+    engines['mmcq'] = mmcq_palette
+if ColorThief is not None:
+    engines['colorthief'] = colorthief_palette
+
+
+def default_engine():
+    return 'mmcq' if 'mmcq' in engines else 'colorthief'
+
+
+class PaletteSource(object):
+    """
+    The pixel work for an image, done once: palettes of any size up to max_count are then served from
+    the stored histogram ('mmcq'), or sliced from the max_count palette ('colorthief', whose histogram
+    is not accessible; the slices are its most important colours, not exactly what a smaller count gives)
+    """
+    def __init__(self, image, max_count, quality=10, engine=None, pixel_budget=None):
+        if engine not in engines:
+            engine = default_engine()
+        self.engine = engine
+        self.max_count = max_count
+        self.histo = None
+        self.full = None
+        image, quality = sampled(image, quality, pixel_budget)
+        if engine == 'mmcq':
+            pixels = valid_pixels(image, quality)
+            if not len(pixels):
+                raise Exception('Empty pixels when quantize.')
+            self.histo = histogram(pixels)
+        else:
+            self.full = engines[engine](image, max_count, quality)
+
+    def palette(self, color_count):
+        """
+        :param color_count: as in get_palette, max_count at most
+        :return: list of (r, g, b) tuples
+        """
+        if self.histo is not None:
+            return quantize_histogram(self.histo, color_count)
+        return self.full[:color_count]
+
+
+def get_palette(image, color_count=10, quality=10, engine=None, pixel_budget=None):
+    """
+    :param image: PIL Image or path
+    :param color_count: passed to the engine; as in colorthief, the palette may come out a colour shorter
+    :param quality: take every n-th pixel; ignored if pixel_budget given
+    :param engine: 'mmcq' or 'colorthief'; the first available if None or not available
+    :param pixel_budget: sample about this many pixels, see sample_image (stride, if no numpy)
+    :return: list of (r, g, b) tuples
+    """
+    if not isinstance(image, Image.Image):
+        image = Image.open(image)
+    if engine not in engines:
+        engine = default_engine()
+    image, quality = sampled(image, quality, pixel_budget)
+    return engines[engine](image, color_count, quality)
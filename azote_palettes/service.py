@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# _*_ coding: utf-8 _*_
+"""
+Local palette service: a long-running process on a Unix socket, with warm worker processes and preloaded
+name indexes, so that a request costs no imports or index building. The protocol is a JSON object per line:
+  {"cmd": "palette", "path": "/image.jpg"}, or "data": base64 encoded image file instead of "path";
+      optional "colors", "engine", "pixel_budget", "dict", "metric"; answer: a batch.extract record
+  {"cmd": "name", "colours": ["#rrggbb", [r, g, b], 0xrrggbb, ...]}; optional "dict", "metric";
+      answer: {"names": {dictionary: [[exact name or null, nearest name, nearest hex], ...]}}
+  {"cmd": "ping"}; answer: {"pong": true}
+Errors are answered with {"error": message}.
+"""
+import io
+import os
+import sys
+import json
+import base64
+import stat
+import signal
+import socket
+import socketserver
+from concurrent.futures import ProcessPoolExecutor
+
+from azote_palettes.batch import extract, init_worker
+from azote_palettes.color_tools import get_colour_names, preload_dictionaries, registry, \
+    check_metric, parse_colour
+from azote_palettes.dictionary_files import CompiledDictionary
+from azote_palettes.quantize import PIXEL_BUDGET
+
+
+def extract_data(data, *args):
+    """
+    batch.extract of an image file content, in a worker process
+    """
+    record = extract(io.BytesIO(data), *args)
+    record['path'] = None
+    return record
+
+
+if not hasattr(socket, 'AF_UNIX'):
+    raise ImportError('The palette service needs Unix sockets, not available on this platform')
+
+
+def remove_stale_socket(path):
+    """
+    Removes the socket file left by a service which is not running any more
+    :raises: FileExistsError if path is not a socket, or a service is still listening on it
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(st.st_mode):
+        raise FileExistsError('{}: exists and is not a socket'.format(path))
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        try:
+            s.connect(path)
+        except ConnectionRefusedError:
+            os.remove(path)
+            return
+    raise FileExistsError('{}: another service is listening on this socket'.format(path))
+
+
+class PaletteServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, jobs=None, dictionaries=('names', 'pantone'), metric='rgb', color_count=24):
+        """
+        :param path: socket file; a stale one is replaced, see remove_stale_socket
+        :param jobs: number of worker processes, os.cpu_count() if None
+        :param dictionaries: default dictionaries, preloaded in all processes
+        """
+        remove_stale_socket(path)
+        self.dictionaries = list(dictionaries)
+        self.metric = metric
+        self.color_count = color_count
+        dictionary_files = {name: d.source for name, d in registry.items() if isinstance(d, CompiledDictionary)}
+        self.executor = ProcessPoolExecutor(jobs or os.cpu_count() or 1, initializer=init_worker,
+                                            initargs=(self.dictionaries, dictionary_files))
+        for _ in preload_dictionaries(self.dictionaries):
+            pass
+
+        try:
+            super().__init__(path, RequestHandler)
+        except OSError:
+            self.executor.shutdown(wait=False)
+            raise
+
+    def server_bind(self):
+        # the socket file is created with mode 0600, not accessible to others even for a moment
+        umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+
+    def palette(self, message):
+        dictionaries = self.dictionary_list(message)
+        metric = message.get('metric', self.metric)
+        check_metric(metric)
+        args = (int(message.get('colors', self.color_count)), message.get('engine'),
+                int(message.get('pixel_budget', PIXEL_BUDGET)), dictionaries, metric)
+        if 'data' in message:
+            future = self.executor.submit(extract_data, base64.b64decode(message['data']), *args)
+        else:
+            future = self.executor.submit(extract, message['path'], *args)
+        return future.result()
+
+    def name(self, message):
+        dictionaries = self.dictionary_list(message)
+        metric = message.get('metric', self.metric)
+        check_metric(metric)
+        colours = [parse_colour(tuple(c) if isinstance(c, list) else c) for c in message['colours']]
+        return {'names': get_colour_names(colours, dictionaries, metric)}
+
+    def dictionary_list(self, message):
+        dictionaries = message.get('dict', self.dictionaries)
+        for dictionary in dictionaries:
+            if dictionary not in registry:
+                raise ValueError('unknown dictionary: {}'.format(dictionary))
+        return dictionaries
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=False)
+        try:
+            os.remove(self.server_address)
+        except OSError:
+            pass
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    commands = {'palette': PaletteServer.palette, 'name': PaletteServer.name}
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                message = json.loads(line.decode('utf-8'))
+                cmd = message.get('cmd')
+                if cmd == 'ping':
+                    answer = {'pong': True}
+                elif cmd in self.commands:
+                    answer = self.commands[cmd](self.server, message)
+                else:
+                    answer = {'error': 'unknown command: {}'.format(cmd)}
+            except Exception as e:
+                answer = {'error': '{}: {}'.format(type(e).__name__, e)}
+            self.wfile.write(json.dumps(answer, ensure_ascii=False).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+
+def serve(path, jobs=None, dictionaries=('names', 'pantone'), metric='rgb', color_count=24):
+    """
+    Runs the service until interrupted or terminated
+    """
+    # SIGTERM leaves serve_forever like Ctrl+C, the socket file is removed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        server = PaletteServer(path, jobs, dictionaries, metric, color_count)
+    except OSError as e:
+        sys.exit('azote-palettes serve: {}'.format(e))
+    with server:
+        print('Listening on {}'.format(path), file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def request(path, message, timeout=None):
+    """
+    Client: sends a request to the service and waits for the answer
+    :param path: socket file
+    :param message: dict, see the module docstring
+    :param timeout: in seconds, None to wait forever
+    :return: answer dict
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.settimeout(timeout)
+        s.connect(path)
+        s.sendall(json.dumps(message).encode('utf-8') + b'\n')
+        with s.makefile('rb') as f:
+            return json.loads(f.readline().decode('utf-8'))
+
+
+def remote_palette(path, image=None, data=None, timeout=None, **options):
+    """
+    Client: palette of an image file or content, see batch.extract
+    :param path: socket file
+    :param image: image file path, as seen by the service
+    :param data: image file content (bytes), instead of image
+    :param options: colors, engine, pixel_budget, dict, metric
+    :return: record as from batch.extract
+    :raises: ValueError if the service answers with an error
+    """
+    message = dict(options, cmd='palette')
+    if data is not None:
+        message['data'] = base64.b64encode(data).decode('ascii')
+    else:
+        message['path'] = os.path.abspath(image)
+    answer = request(path, message, timeout)
+    if 'error' in answer and 'path' not in answer:
+        raise ValueError(answer['error'])
+    return answer
+
+
+def remote_names(path, colours, timeout=None, **options):
+    """
+    Client: names of colours, see color_tools.get_colour_names
+    :param path: socket file
+    :param colours: #rrggbb strings or (r, g, b) tuples
+    :param options: dict, metric
+    :return: {dictionary: [(exact name or None, nearest name, nearest hex), ...]}
+    :raises: ValueError if the service answers with an error
+    """
+    answer = request(path, dict(options, cmd='name', colours=[list(c) if isinstance(c, tuple) else c
+                                                               for c in colours]), timeout)
+    if 'error' in answer:
+        raise ValueError(answer['error'])
+    return {dictionary: [tuple(entry) for entry in entries] for dictionary, entries in answer['names'].items()}
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# _*_ coding: utf-8 _*_
+"""
+Compiles the colour name dictionaries: azote_palettes/dictionaries/*.tsv, a '#rrggbb<TAB>name' line per colour,
+to the .bin files read by color_tools.ColourDictionary. Edit the .tsv files, then run this script.
+The line order and the key case are kept: the order breaks ties in nearest colour searches.
+"""
+import os
+import glob
+
+from azote_palettes.color_tools import write_dictionary, dictionaries_path
+
+
+def read_tsv(path):
+    d = {}
+    with open(path, encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            line = line.rstrip('\r\n')
+            if not line:
+                continue
+            key, name = line.split('\t')
+            if key in d:
+                raise ValueError('{}:{}: {} repeated'.format(path, number, key))
+            d[key] = name
+    return d
+
+
+def main():
+    for source in sorted(glob.glob(os.path.join(dictionaries_path, '*.tsv'))):
+        path = os.path.splitext(source)[0] + '.bin'
+        write_dictionary(path, read_tsv(source))
+        print(path)
+
+
+if __name__ == '__main__':
+    main()
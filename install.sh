@@ -12,7 +12,7 @@ for path in $PATTERN; do
 done
 
 # Remove launcher scripts
-filenames=("/usr/bin/azote-palettes")
+filenames=("/usr/bin/azote-palettes" "/usr/bin/azote-palettes-cli")
 
 for filename in "${filenames[@]}"; do
   rm -f "$filename"
@@ -16,7 +16,7 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     package_data={
-        "": ["images/*"]
+        "": ["images/*", "dictionaries/*"]
     },
     url='https://github.com/nwg-piotr/azote-palettes',
     license='GPL3',
@@ -26,7 +26,11 @@ setup(
     install_requires=[],
     entry_points={
         'gui_scripts': [
-            'azote-palettes = azote_palettes.main:main'
+            'azote-palettes = azote_palettes.cli:main'
+        ],
+        # batch, name and serve write to stdout / stderr, which gui_scripts do not have on Windows
+        'console_scripts': [
+            'azote-palettes-cli = azote_palettes.cli:main'
         ]
     }
 